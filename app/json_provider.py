@@ -0,0 +1,56 @@
+"""
+orjson-backed JSON for Flask responses and Socket.IO packets.
+
+Gamepad commands arrive and are answered as JSON at up to 60 Hz, so the
+serializer sits on the control hot path. orjson is an optional dependency
+(pip install orjson); without it the app keeps Flask's default provider and
+Socket.IO's stdlib json.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy arrays/scalars can reach responses from the video/control services;
+# non-str keys match the stdlib's behaviour of coercing int keys to strings
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider using orjson.
+
+    Types orjson can't handle natively (e.g. Decimal) fall back to Flask's
+    default conversion. Formatting options such as indent/sort_keys are
+    ignored: API responses are always compact.
+    """
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, default=self.default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON str or bytes."""
+        return orjson.loads(s)
+
+
+class OrjsonSocketIOJSON:
+    """
+    orjson shim for SocketIO(json=...).
+
+    python-socketio calls dumps(data, separators=(',', ':')) and expects a
+    str back; orjson output is already compact, so keyword options are ignored.
+    """
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        """Serialize obj to a JSON string."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        """Deserialize a JSON str or bytes."""
+        return orjson.loads(s)
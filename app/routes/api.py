@@ -9,6 +9,8 @@ import logging
 import time
 from flask import Blueprint, request, jsonify, current_app
 
+from app.services.connection import ConnectionBusyError
+
 api_bp = Blueprint('api', __name__)
 
 
@@ -75,7 +77,10 @@ def connect():
             socketio.emit('connection_error', {'message': error_msg})
 
         # Provide user-friendly error messages based on error type
-        if "already connected" in error_msg.lower() or "busy" in error_msg.lower():
+        if isinstance(e, ConnectionBusyError):
+            # This server's own connection, not another client's
+            error_msg = "Already connected or connecting to the robot. Disconnect first."
+        elif "already connected" in error_msg.lower() or "busy" in error_msg.lower():
             error_msg = "Robot is already connected to another client. Close the Unitree mobile app and try again."
         elif "unreachable" in error_msg.lower() or "timeout" in error_msg.lower():
             error_msg = f"Cannot reach robot. Check IP address and network connection."
@@ -350,6 +355,8 @@ def control_action():
 
         data = request.json
         action = data.get('action')
+        # Clients use the control_action WebSocket event when connected
+        logging.debug("HTTP fallback: control action %s", action)
 
         if not action:
             return jsonify({'status': 'error', 'message': 'No action specified'}), 400
@@ -378,9 +385,11 @@ def control_camera():
             return jsonify({'status': 'error', 'message': 'Robot not connected'}), 400
 
         data = request.json
-        yaw = data.get('yaw', 0)
+        yaw = float(data.get('yaw', 0))
+        # Clients use the control_camera WebSocket event when connected
+        logging.debug("HTTP fallback: camera yaw %s", yaw)
 
-        result = control_service.send_camera_control(yaw)
+        result = control_service.send_camera_control_sync(yaw)
 
         if result['status'] == 'error':
             return jsonify(result), 400
@@ -407,7 +416,7 @@ def status():
 
 @api_bp.route('/ping')
 def ping():
-    """Lightweight ping endpoint for network latency testing"""
+    """Lightweight ping endpoint for network latency testing (see also the latency_ping WebSocket event)"""
     return jsonify({'pong': time.time()})
 
 
@@ -472,36 +481,10 @@ def get_light_level():
         if not state.is_connected:
             return jsonify({'success': False, 'message': 'Robot not connected'}), 400
 
-        from unitree_webrtc_connect.constants import RTC_TOPIC
-        import asyncio
-        import json as json_mod
-
-        async def query_brightness():
-            """Query current brightness from robot via VUI API 1006."""
-            try:
-                response = await state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["VUI"],
-                    {"api_id": 1006}
-                )
-
-                if response and 'data' in response:
-                    if 'header' in response['data']:
-                        status_code = response['data']['header'].get('status', {}).get('code', -1)
-                        if status_code == 0:
-                            data_str = response['data'].get('data', '{}')
-                            data_parsed = json_mod.loads(data_str) if isinstance(data_str, str) else data_str
-                            brightness = data_parsed.get('brightness', 0)
-                            logging.info(f"💡 Current LED brightness: {brightness}/10")
-                            return brightness
-
-                logging.warning(f"Failed to query LED brightness: {response}")
-                return None
-
-            except Exception as e:
-                logging.error(f"Error querying LED brightness: {e}")
-                return None
+        control_service = current_app.config['CONTROL_SERVICE']
 
-        future = asyncio.run_coroutine_threadsafe(query_brightness(), state.event_loop)
+        # The response carries the robot's answer, so this one has to wait
+        future = asyncio.run_coroutine_threadsafe(control_service.get_led_brightness(), state.event_loop)
         brightness = future.result(timeout=5)
 
         if brightness is not None:
@@ -547,14 +530,18 @@ def set_light_level():
         if not isinstance(brightness, int) or brightness < 0 or brightness > 10:
             return jsonify({'success': False, 'message': 'Brightness must be between 0 and 10'}), 400
 
-        # Use the control service method which handles flashlight/RGB interaction
+        if not state.event_loop or not state.event_loop.is_running():
+            return jsonify({'success': False, 'message': 'Event loop not running'}), 400
+
+        # Use the control service method which handles flashlight/RGB interaction.
+        # Fire-and-forget: the response doesn't depend on the robot's ack (the
+        # method logs its own errors), so don't hold this worker thread on it
         import asyncio
 
-        future = asyncio.run_coroutine_threadsafe(
+        asyncio.run_coroutine_threadsafe(
             control_service.set_led_brightness(brightness),
             state.event_loop
         )
-        future.result(timeout=5)
 
         return jsonify({'success': True, 'level': brightness})
 
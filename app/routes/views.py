@@ -4,11 +4,17 @@ HTML view routes for Unitree WebRTC Connect.
 This module contains routes that render HTML templates.
 """
 
-from flask import Blueprint, render_template, Response
+from flask import Blueprint, render_template, Response, request
 
 views_bp = Blueprint('views', __name__)
 
 
+def _requested_width():
+    """Target stream width from the ?w= query parameter, or None for full size."""
+    width = request.args.get('w', type=int)
+    return width if width and width > 0 else None
+
+
 @views_bp.route('/')
 def landing():
     """Render the landing page with robot management dashboard"""
@@ -32,12 +38,30 @@ def video_feed():
     """
     Video streaming route.
     
+    Optional ?w=<pixels> downscales the stream (e.g. ?w=800 for mobile
+    consoles on a constrained link).
+    
     This route is injected with the video_service dependency when the blueprint is registered.
     """
     # video_service will be injected via current_app.config
     from flask import current_app
     video_service = current_app.config['VIDEO_SERVICE']
     
-    return Response(video_service.generate_frames(),
+    return Response(video_service.generate_frames(width=_requested_width()),
                     mimetype='multipart/x-mixed-replace; boundary=frame')
 
+
+
+@views_bp.route('/video_feed_raw')
+def video_feed_raw():
+    """
+    Uncompressed video streaming route (multipart PPM).
+    
+    Skips JPEG encoding on the server for LAN clients that can decode PPM
+    (e.g. OpenCV/ffmpeg viewers); browsers should keep using /video_feed.
+    """
+    from flask import current_app
+    video_service = current_app.config['VIDEO_SERVICE']
+    
+    return Response(video_service.generate_frames(raw=True, width=_requested_width()),
+                    mimetype='multipart/x-mixed-replace; boundary=frame')
@@ -5,9 +5,21 @@ This module contains all WebSocket event handlers for real-time communication.
 """
 
 import logging
+import struct
+import time
 from flask import current_app
 from flask_socketio import emit
 
+# Optional: msgpack for the binary control channel (pip install msgpack)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Binary gamepad command: four little-endian float32 axes (lx, ly, rx, ry),
+# as packed by static/js/websocket-client.js
+_GAMEPAD_AXES = struct.Struct('<4f')
+
 
 def register_websocket_handlers(socketio):
     """
@@ -17,52 +29,51 @@ def register_websocket_handlers(socketio):
         socketio: Flask-SocketIO instance
     """
     
-    @socketio.on('control_command')
-    def handle_websocket_control_command(data):
+    def run_control_command(data) -> dict:
         """
-        WebSocket handler for gamepad or keyboard/mouse movement commands
-        This provides lower latency than HTTP by using persistent WebSocket connection
+        Process one gamepad or keyboard/mouse movement command and send it to the robot.
 
-        Note: Logs at DEBUG level to reduce console spam during high-frequency control (30-60 Hz).
-        Set logging level to DEBUG to see detailed control command flow.
+        Shared by the JSON and msgpack handlers.
+
+        Returns:
+            dict: Response payload for the client
         """
         try:
             state = current_app.config['STATE_SERVICE']
             control_service = current_app.config['CONTROL_SERVICE']
 
             # Log at DEBUG level to reduce console spam (these messages occur 30-60 times per second)
-            logging.debug(f"[WebSocket] Received control_command: {data}")
-            logging.debug(f"[WebSocket] State - connected: {state.is_connected}, gamepad: {state.gamepad_enabled}, kb/mouse: {state.keyboard_mouse_enabled}")
+            logging.debug("[WebSocket] Received control_command: %s", data)
+            logging.debug("[WebSocket] State - connected: %s, gamepad: %s, kb/mouse: %s",
+                          state.is_connected, state.gamepad_enabled, state.keyboard_mouse_enabled)
 
             if not state.is_connected:
                 logging.warning("[WebSocket] Robot not connected")
-                emit('command_response', {
+                return {
                     'status': 'error',
                     'message': 'Robot not connected'
-                })
-                return
+                }
 
             if not state.gamepad_enabled and not state.keyboard_mouse_enabled:
                 logging.warning("[WebSocket] Control not enabled")
-                emit('command_response', {
+                return {
                     'status': 'error',
                     'message': 'Control not enabled'
-                })
-                return
+                }
 
             # Process movement command
             result = control_service.process_movement_command(data)
-            logging.debug(f"[WebSocket] Process result: {result}")
+            logging.debug("[WebSocket] Process result: %s", result)
 
             if result['status'] == 'error':
-                emit('command_response', result)
-                return
+                return result
 
             # If should send, actually send the command to the robot
             if result.get('should_send', False):
                 velocities = result['velocities']
                 # Log actual robot commands at DEBUG level (high frequency)
-                logging.debug(f"[WebSocket] Sending to robot: lx={velocities.get('lx', 0)}, ly={velocities.get('ly', 0)}, rx={velocities.get('rx', 0)}, ry={velocities.get('ry', 0)}")
+                logging.debug("[WebSocket] Sending to robot: lx=%s, ly=%s, rx=%s, ry=%s",
+                              velocities.get('lx', 0), velocities.get('ly', 0), velocities.get('rx', 0), velocities.get('ry', 0))
                 send_result = control_service.send_movement_command_sync(
                     velocities.get('lx', 0.0),
                     velocities.get('ly', 0.0),
@@ -72,18 +83,124 @@ def register_websocket_handlers(socketio):
                 )
                 # Merge send result with process result
                 result['send_status'] = send_result['status']
-                logging.debug(f"[WebSocket] Send result: {send_result}")
+                logging.debug("[WebSocket] Send result: %s", send_result)
 
-            # Send response back to client
-            emit('command_response', result)
+            return result
 
         except Exception as e:
             logging.error(f"WebSocket control command error: {e}", exc_info=True)
-            emit('command_response', {
+            return {
                 'status': 'error',
                 'message': str(e)
-            })
-    
+            }
+
+    @socketio.on('control_command')
+    def handle_websocket_control_command(data):
+        """
+        WebSocket handler for gamepad or keyboard/mouse movement commands
+        This provides lower latency than HTTP by using persistent WebSocket connection
+
+        Note: Logs at DEBUG level to reduce console spam during high-frequency control (30-60 Hz).
+        Set logging level to DEBUG to see detailed control command flow.
+        """
+        # Send response back to client
+        emit('command_response', run_control_command(data))
+
+    @socketio.on('gamepad_axes')
+    def handle_websocket_gamepad_axes(payload):
+        """
+        Binary gamepad handler: a 16-byte blob of four float32 axes.
+
+        Gamepad commands carry nothing but the stick axes, so the browser sends
+        them as a binary attachment; one struct unpack replaces JSON decoding.
+        Replies on command_response like control_command.
+        """
+        try:
+            lx, ly, rx, ry = _GAMEPAD_AXES.unpack(payload)
+        except (struct.error, TypeError) as e:
+            logging.error(f"WebSocket gamepad axes decode error: {e}")
+            emit('command_response', {'status': 'error', 'message': 'Invalid gamepad axes payload'})
+            return
+        emit('command_response', run_control_command(
+            {'lx': lx, 'ly': ly, 'rx': rx, 'ry': ry, 'source': 'gamepad'}
+        ))
+
+    if msgpack is not None:
+        @socketio.on('control_command_bin')
+        def handle_websocket_control_command_bin(payload):
+            """
+            Binary variant of control_command: msgpack-encoded command in, msgpack out.
+
+            Socket.IO sends bytes as a binary attachment instead of a JSON string,
+            so each 30-60 Hz command is smaller on the wire and cheaper to parse.
+            Clients without msgpack keep using control_command.
+            """
+            try:
+                data = msgpack.unpackb(payload)
+            except (TypeError, ValueError) as e:
+                # ValueError covers msgpack's ExtraData/FormatError/StackError
+                logging.error(f"WebSocket binary control command decode error: {e}")
+                result = {'status': 'error', 'message': 'Invalid msgpack payload'}
+            else:
+                result = run_control_command(data)
+            emit('command_response_bin', msgpack.packb(result))
+
+    @socketio.on('control_action')
+    def handle_websocket_control_action(data):
+        """
+        WebSocket counterpart of POST /api/control/action for button presses.
+
+        The action is scheduled on the event loop without waiting for it;
+        the result is returned as the Socket.IO acknowledgement.
+        """
+        try:
+            state = current_app.config['STATE_SERVICE']
+            control_service = current_app.config['CONTROL_SERVICE']
+
+            if not state.is_connected:
+                return {'status': 'error', 'message': 'Robot not connected'}
+
+            action = data.get('action') if isinstance(data, dict) else None
+            if not action:
+                return {'status': 'error', 'message': 'No action specified'}
+
+            return control_service.send_robot_action_sync(action)
+
+        except Exception as e:
+            logging.error(f"WebSocket control action error: {e}")
+            return {'status': 'error', 'message': str(e)}
+
+    @socketio.on('control_camera')
+    def handle_websocket_control_camera(data):
+        """
+        WebSocket counterpart of POST /api/control/camera for trigger samples.
+
+        Yaw goes into the control service's latest-wins camera slot, so
+        samples arriving faster than the robot accepts them are coalesced.
+        """
+        try:
+            state = current_app.config['STATE_SERVICE']
+            control_service = current_app.config['CONTROL_SERVICE']
+
+            if not state.is_connected:
+                return {'status': 'error', 'message': 'Robot not connected'}
+
+            return control_service.send_camera_control_sync(float(data.get('yaw', 0)))
+
+        except Exception as e:
+            logging.error(f"WebSocket control camera error: {e}")
+            return {'status': 'error', 'message': str(e)}
+
+    @socketio.on('latency_ping')
+    def handle_websocket_latency_ping():
+        """
+        WebSocket counterpart of GET /api/ping for latency probes.
+
+        The pong is the Socket.IO acknowledgement, so a round trip is one
+        frame each way on the open connection instead of an HTTP request.
+        """
+        return {'pong': time.time()}
+
     @socketio.on('start_microphone')
     def handle_start_microphone():
         """Start transmitting microphone audio (push-to-talk pressed)"""
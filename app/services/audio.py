@@ -10,7 +10,8 @@ This service encapsulates all audio-related functionality:
 
 CRITICAL THREAD SAFETY:
 - All state access goes through StateService properties (thread-safe)
-- PyAudio operations use asyncio.to_thread() to prevent event loop blocking
+- Playback writes run on a dedicated AudioOutput writer thread
+- Microphone reads use asyncio.to_thread() to prevent event loop blocking
 """
 
 import logging
@@ -21,6 +22,8 @@ import pyaudio
 from aiortc import AudioStreamTrack
 from av import AudioFrame as AVAudioFrame
 
+from .native_threading import native_threading
+
 
 class AudioService:
     """
@@ -48,15 +51,20 @@ class AudioService:
         self.channels = 2  # Stereo
         self.format = pyaudio.paInt16
         self.frames_per_buffer = 8192
+        # Playback ring slot size, fixed by the config above: room for one 40ms
+        # frame. recv_audio_stream pushes only a frame's own samples (3840 bytes
+        # for the robot's 20ms Opus frames), not the decoder's padded plane
+        self.output_slot_bytes = (self.sample_rate // 25) * self.channels * 2
     
     async def recv_audio_stream(self, frame):
         """
         Receive audio frames from the robot and play them through speakers.
         This callback is triggered when audio frames are received from the robot.
         
-        CRITICAL: Uses asyncio.to_thread() to prevent blocking the event loop.
-        PyAudio's write() is a synchronous blocking operation that would otherwise
-        block video frame processing, causing latency and artifacts.
+        CRITICAL: Never writes to PyAudio on the event loop. PyAudio's write() is a
+        synchronous blocking operation that would otherwise block video frame
+        processing, causing latency and artifacts. Frames are handed to the
+        AudioOutput writer thread instead, which is non-blocking.
         
         Audio stream is always connected, but playback is controlled by state.audio_muted flag.
         This allows instant mute/unmute without reconnecting.
@@ -65,24 +73,52 @@ class AudioService:
             frame: Audio frame from WebRTC
         """
         try:
-            if not self.state.audio_initialized or self.state.pyaudio_stream is None:
+            # Check mute first (the common idle case) and bail out before the frame is
+            # touched at all - decoding it into planes/ndarrays only churns the GC
+            if self.state.audio_muted or not self.state.audio_initialized:
                 return
             
-            # Check if audio is muted - if so, discard the frame without playing
-            if self.state.audio_muted:
+            stream = self.state.pyaudio_stream
+            if stream is None:
                 return
             
-            # Convert the frame to audio data (16-bit PCM)
-            audio_data = np.frombuffer(frame.to_ndarray(), dtype=np.int16)
-            audio_bytes = audio_data.tobytes()
+            # Writer thread is started lazily on the first frame for this stream
+            output = self.state.audio_output
+            if output is None or output.stream is not stream:
+                output = self._start_audio_output(stream)
             
-            # Run the blocking PyAudio write in a separate thread to avoid blocking the event loop
-            # This prevents audio from interfering with video frame processing
-            await asyncio.to_thread(self.state.pyaudio_stream.write, audio_bytes)
+            # The decoder already hands us packed 16-bit PCM in plane 0. Copy it once,
+            # straight into a preallocated ring slot, instead of going through
+            # to_ndarray(), np.frombuffer() and tobytes(). The plane buffer is padded
+            # (aiortc's OpusDecoder allocates room for a 120ms frame), so only the
+            # frame's own samples are pushed.
+            nbytes = frame.samples * len(frame.layout.channels) * frame.format.bytes
+            output.push(memoryview(frame.planes[0])[:nbytes])
         
         except Exception as e:
             self.logger.error(f"Error playing audio frame: {e}")
     
+    def _start_audio_output(self, stream):
+        """
+        Start an AudioOutput writer thread for the given PyAudio stream.
+        
+        Any writer left over from a previous stream is stopped first.
+        
+        Args:
+            stream: PyAudio output stream to write to
+            
+        Returns:
+            AudioOutput: Running writer for the stream
+        """
+        previous = self.state.audio_output
+        if previous is not None:
+            previous.stop()
+        
+        output = AudioOutput(stream, slot_bytes=self.output_slot_bytes)
+        output.start()
+        self.state.audio_output = output
+        return output
+    
     def create_microphone_track(self):
         """
         Factory method to create a MicrophoneAudioTrack instance.
@@ -170,6 +206,191 @@ class AudioService:
             return {'transmitting': False}
 
 
+def _process_mic(mono, out):
+    """
+    Duplicate mono int16 microphone samples into packed (interleaved) output.
+
+    Writes straight into the preallocated `out` buffer through a reshaped view,
+    replacing the column_stack()/flatten()/reshape() chain that allocated three
+    temporaries per 20ms frame.
+
+    Args:
+        mono: 1-D int16 array of microphone samples
+        out: (1, len(mono) * channels) int16 array, overwritten in place
+    """
+    out.reshape(mono.shape[0], -1)[:] = mono[:, None]
+
+
+class AudioFrameQueue:
+    """
+    Single-producer/single-consumer ring of preallocated PCM frame slots.
+
+    push() copies a frame's bytes straight into the next free slot and peek()
+    returns an ndarray view of the oldest one, so steady-state playback does no
+    per-frame allocation. Head/tail are plain ints: with one producer and one
+    consumer each index has a single writer, and CPython int assignment is
+    atomic, so no lock is needed. When the ring is full, new frames are
+    dropped - the slot the consumer is reading is never overwritten. Frames
+    larger than a slot are dropped too and counted in oversize_drops.
+    """
+
+    def __init__(self, n_slots: int = 10, slot_bytes: int = 7680):
+        """
+        Initialize AudioFrameQueue.
+
+        Args:
+            n_slots: Number of frames the ring can hold
+            slot_bytes: Capacity of each slot (7680 = 40ms of 48kHz s16 stereo)
+        """
+        self.n_slots = n_slots
+        self.slot_bytes = slot_bytes
+        self._slots = np.zeros((n_slots, slot_bytes), dtype=np.uint8)
+        self._lengths = [0] * n_slots
+        self._head = 0  # Next slot to write (producer only)
+        self._tail = 0  # Next slot to read (consumer only)
+        self.oversize_drops = 0  # Frames rejected for not fitting a slot (producer only)
+
+    def __len__(self):
+        return self._head - self._tail
+
+    def push(self, data) -> bool:
+        """
+        Copy a frame into the next free slot (non-blocking).
+
+        Args:
+            data: Any buffer-protocol object (bytes, AudioFrame plane, ndarray)
+
+        Returns:
+            bool: False if the frame was dropped (ring full or frame too large)
+        """
+        head = self._head
+        if head - self._tail >= self.n_slots:
+            return False
+        src = np.frombuffer(data, dtype=np.uint8)
+        nbytes = src.shape[0]
+        if nbytes > self.slot_bytes:
+            self.oversize_drops += 1
+            return False
+        index = head % self.n_slots
+        self._slots[index, :nbytes] = src
+        self._lengths[index] = nbytes
+        # Publish only after the slot is fully written
+        self._head = head + 1
+        return True
+
+    def peek(self):
+        """
+        Return a view of the oldest queued frame without consuming it.
+
+        The view stays valid until advance() is called.
+
+        Returns:
+            np.ndarray: uint8 view of the frame bytes, or None if empty
+        """
+        tail = self._tail
+        if tail == self._head:
+            return None
+        index = tail % self.n_slots
+        return self._slots[index, :self._lengths[index]]
+
+    def advance(self):
+        """Release the slot returned by peek() back to the producer."""
+        if self._tail != self._head:
+            self._tail += 1
+
+    def clear(self):
+        """Drop all queued frames (only safe while the consumer is stopped)."""
+        self._tail = self._head
+
+
+class AudioOutput:
+    """
+    Dedicated writer thread for robot audio playback.
+
+    recv_audio_stream() pushes PCM frames into an AudioFrameQueue without
+    blocking and a single long-lived thread drains it into the PyAudio stream.
+    This avoids one asyncio.to_thread() executor handoff per frame. When
+    playback falls behind, incoming frames are dropped so latency stays bounded.
+    """
+
+    def __init__(self, stream, max_frames: int = 10, slot_bytes: int = 7680):
+        """
+        Initialize AudioOutput.
+
+        Args:
+            stream: PyAudio output stream (blocking write())
+            max_frames: Frames buffered before new ones are dropped
+                (10 x 20ms = 200ms of audio)
+            slot_bytes: Largest frame accepted, in bytes (see AudioFrameQueue)
+        """
+        self.stream = stream
+        self.logger = logging.getLogger(__name__)
+        self._queue = AudioFrameQueue(n_slots=max_frames, slot_bytes=slot_bytes)
+        self._oversize_drops_seen = 0
+        self._wakeup = native_threading.Event()
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        """Start the writer thread."""
+        self._running = True
+        # Native thread: PyAudio's blocking write() would stall an eventlet hub
+        self._thread = native_threading.Thread(target=self._drain, name="AudioOutput", daemon=True)
+        self._thread.start()
+
+    def push(self, data):
+        """
+        Queue PCM data for playback (non-blocking).
+
+        Frames dropped because the ring is full are expected when playback
+        falls behind; frames too large for a slot mean the slot size is wrong
+        and are logged (first drop, then every 50th).
+
+        Args:
+            data: Packed 16-bit PCM buffer (bytes or AudioFrame plane)
+        """
+        queue = self._queue
+        if not queue.push(data):
+            drops = queue.oversize_drops
+            if drops != self._oversize_drops_seen:
+                self._oversize_drops_seen = drops
+                if drops == 1 or drops % 50 == 0:
+                    self.logger.warning("Dropped oversized audio frame (slot is %d bytes, %d dropped so far)",
+                                        queue.slot_bytes, drops)
+        self._wakeup.set()
+
+    def stop(self, timeout: float = 1.0):
+        """
+        Stop the writer thread and discard pending audio.
+
+        Args:
+            timeout: Seconds to wait for the thread to exit
+        """
+        self._running = False
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._queue.clear()
+
+    def _drain(self):
+        """Writer thread loop: write buffered frames until stopped."""
+        queue = self._queue
+        while self._running:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            while self._running:
+                data = queue.peek()
+                if data is None:
+                    break
+                try:
+                    # write() takes the 1-D uint8 slot view as-is (len() == byte count)
+                    self.stream.write(data)
+                except Exception as e:
+                    self.logger.error(f"Error playing audio frame: {e}")
+                queue.advance()
+
+
 class MicrophoneAudioTrack(AudioStreamTrack):
     """
     Custom audio track that streams PC microphone audio to the robot.
@@ -194,6 +415,19 @@ class MicrophoneAudioTrack(AudioStreamTrack):
         self.audio_samples = 0  # Track timestamps
         self.is_transmitting = False  # Push-to-talk state
 
+        # Pre-built silence frame, reused for every idle recv() (50 Hz while
+        # push-to-talk is released). Only pts changes between sends; the Opus
+        # encoder consumes the frame synchronously, so sharing it is safe.
+        self._silence_bytes = b'\x00' * (self.samples_per_frame * self.channels * 2)  # s16
+        self._silence_frame = AVAudioFrame(format='s16', layout='stereo', samples=self.samples_per_frame)
+        self._silence_frame.planes[0].update(self._silence_bytes)
+        self._silence_frame.sample_rate = self.sample_rate
+        self._silence_frame.time_base = fractions.Fraction(1, self.sample_rate)
+
+        # Scratch buffer for packed stereo microphone samples, filled in place by
+        # _process_mic() on every transmitted frame
+        self._scratch = np.empty((1, self.samples_per_frame * self.channels), dtype=np.int16)
+
         # Initialize PyAudio for microphone capture (server-side)
         self.p = pyaudio.PyAudio()
         self.mic_stream = self.p.open(
@@ -231,6 +465,10 @@ class MicrophoneAudioTrack(AudioStreamTrack):
         try:
             # Always read from microphone to prevent buffer overflow
             # Run the blocking PyAudio read in a separate thread
+            # NOTE: read() returns a fresh 1920-byte bytes object per frame. Neither
+            # PyAudio nor sounddevice's RawInputStream can read into a caller-owned
+            # buffer, so this allocation stays; everything downstream is either a
+            # zero-copy view (np.frombuffer) or the reused scratch buffer.
             mic_data = await asyncio.to_thread(
                 self.mic_stream.read,
                 self.samples_per_frame,
@@ -239,27 +477,17 @@ class MicrophoneAudioTrack(AudioStreamTrack):
 
             # If not transmitting, send silence instead
             if not self.is_transmitting:
-                silence = np.zeros((1, self.samples_per_frame * self.channels), dtype=np.int16)
-                frame = AVAudioFrame.from_ndarray(silence, format='s16', layout='stereo')
-                frame.sample_rate = self.sample_rate
-                frame.pts = self.audio_samples
-                frame.time_base = fractions.Fraction(1, self.sample_rate)
-                self.audio_samples += frame.samples
-                return frame
-
-            # Convert bytes to numpy array (mono, int16)
-            audio_array = np.frombuffer(mic_data, dtype=np.int16)
+                return self._next_silence_frame()
 
-            # Convert mono to stereo by duplicating the channel
-            audio_stereo = np.column_stack((audio_array, audio_array))
+            # Convert bytes to numpy array (mono, int16) - zero-copy view
+            audio_array = np.frombuffer(mic_data, dtype=np.int16)
 
-            # Reshape to packed format (1, samples*channels)
-            total_samples = self.samples_per_frame * self.channels
-            audio_packed = audio_stereo.flatten().reshape((1, total_samples))
+            # Convert mono to packed stereo in the preallocated scratch buffer
+            _process_mic(audio_array, self._scratch)
 
-            # Create audio frame
+            # Create audio frame (from_ndarray copies, so the scratch can be reused)
             frame = AVAudioFrame.from_ndarray(
-                audio_packed,
+                self._scratch,
                 format='s16',
                 layout='stereo'
             )
@@ -284,13 +512,19 @@ class MicrophoneAudioTrack(AudioStreamTrack):
                 logging.error(f"Error reading microphone: {e}")
 
             # Return silence on error
-            silence = np.zeros((1, self.samples_per_frame * self.channels), dtype=np.int16)
-            frame = AVAudioFrame.from_ndarray(silence, format='s16', layout='stereo')
-            frame.sample_rate = self.sample_rate
-            frame.pts = self.audio_samples
-            frame.time_base = fractions.Fraction(1, self.sample_rate)
-            self.audio_samples += frame.samples
-            return frame
+            return self._next_silence_frame()
+
+    def _next_silence_frame(self):
+        """
+        Return the cached silence frame stamped with the next timestamp.
+
+        Returns:
+            AVAudioFrame: Shared silence frame for WebRTC transmission
+        """
+        frame = self._silence_frame
+        frame.pts = self.audio_samples
+        self.audio_samples += frame.samples
+        return frame
 
     def stop(self):
         """Clean up microphone resources"""
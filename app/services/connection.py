@@ -22,13 +22,56 @@ DEPENDENCIES:
 
 import asyncio
 import logging
-import threading
+from enum import IntEnum
 from typing import Optional, Callable, Dict, Any
 import pyaudio
 
 from unitree_webrtc_connect.webrtc_driver import UnitreeWebRTCConnection, WebRTCConnectionMethod
 from unitree_webrtc_connect.constants import RTC_TOPIC, SPORT_CMD, OBSTACLES_AVOID_API
 
+from .native_threading import native_threading
+
+# Optional: libuv-based event loop (pip install uvloop; Linux/macOS only).
+# Falls back to the stock asyncio loop when the package is missing.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+class ConnState(IntEnum):
+    """Connection lifecycle states."""
+    DISCONNECTED = 0
+    CONNECTING = 1
+    CONNECTED = 2
+    CLOSING = 3
+
+
+class ConnEvent(IntEnum):
+    """Events that drive connection state transitions."""
+    CONNECT = 0       # connect requested
+    ESTABLISHED = 1   # setup_connection() completed
+    FAILED = 2        # connect attempt or live connection failed
+    DISCONNECT = 3    # disconnect requested
+    CLOSED = 4        # peer connection torn down
+
+
+class ConnectionBusyError(RuntimeError):
+    """This server already has a connection to the robot open or in progress."""
+
+
+# (current state, event) -> next state. Pairs not listed are invalid and ignored.
+_TRANSITIONS = {
+    (ConnState.DISCONNECTED, ConnEvent.CONNECT): ConnState.CONNECTING,
+    (ConnState.CONNECTING, ConnEvent.ESTABLISHED): ConnState.CONNECTED,
+    (ConnState.CONNECTING, ConnEvent.FAILED): ConnState.DISCONNECTED,
+    (ConnState.CONNECTING, ConnEvent.DISCONNECT): ConnState.CLOSING,
+    (ConnState.CONNECTED, ConnEvent.FAILED): ConnState.DISCONNECTED,
+    (ConnState.CONNECTED, ConnEvent.DISCONNECT): ConnState.CLOSING,
+    (ConnState.CLOSING, ConnEvent.CLOSED): ConnState.DISCONNECTED,
+    (ConnState.CLOSING, ConnEvent.FAILED): ConnState.DISCONNECTED,
+}
+
 
 class ConnectionService:
     """
@@ -56,6 +99,25 @@ class ConnectionService:
         self.debug_level = debug_level
         self.socketio = socketio
         self._status_polling_task = None  # Background task for status polling
+        self.conn_state = ConnState.DISCONNECTED
+
+    def handle_event(self, event: ConnEvent) -> ConnState:
+        """
+        Advance the connection state machine.
+
+        Invalid (state, event) pairs are logged and leave the state unchanged.
+
+        Args:
+            event: ConnEvent that occurred
+
+        Returns:
+            ConnState: State after handling the event
+        """
+        try:
+            self.conn_state = _TRANSITIONS[(self.conn_state, event)]
+        except KeyError:
+            self.logger.warning(f"Ignoring {event.name} in state {self.conn_state.name}")
+        return self.conn_state
 
     def emit_progress(self, stage: str, message: str = None):
         """
@@ -75,29 +137,43 @@ class ConnectionService:
             except Exception as e:
                 self.logger.error(f"Error emitting progress: {e}")
     
-    def _run_event_loop(self, loop: asyncio.AbstractEventLoop):
+    def _run_event_loop(self, loop: asyncio.AbstractEventLoop, ready: Optional[native_threading.Event] = None):
         """
         Run asyncio event loop in a separate thread.
         
         Args:
             loop: Event loop to run
+            ready: Optional event set once the loop is actually processing callbacks
         """
         asyncio.set_event_loop(loop)
+        if ready is not None:
+            loop.call_soon(ready.set)
         loop.run_forever()
     
-    def ensure_event_loop(self):
+    def ensure_event_loop(self, timeout: float = 5.0):
         """
         Ensure event loop exists and is running.
         Creates new event loop if needed.
+
+        Blocks until the new loop is running, so a second call made right away
+        sees is_running() == True and reuses it instead of starting another loop.
+
+        Args:
+            timeout: Seconds to wait for a new loop to start (default: 5)
         """
         if self.state.event_loop is None or not self.state.event_loop.is_running():
-            self.state.event_loop = asyncio.new_event_loop()
-            self.state.loop_thread = threading.Thread(
+            ready = native_threading.Event()
+            # uvloop cuts per-callback scheduling cost on the WebRTC/command loop
+            self.state.event_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+            # Native thread: under eventlet a green thread would starve the loop
+            self.state.loop_thread = native_threading.Thread(
                 target=self._run_event_loop,
-                args=(self.state.event_loop,),
+                args=(self.state.event_loop, ready),
                 daemon=True
             )
             self.state.loop_thread.start()
+            if not ready.wait(timeout):
+                self.logger.error("Event loop thread did not start within timeout")
             self.logger.info("Event loop created and started")
     
     def create_connection(
@@ -177,6 +253,13 @@ class ConnectionService:
                 - rate: Sample rate (e.g., 48000)
                 - frames_per_buffer: Buffer size (e.g., 8192)
         """
+        # GIL-protected test-and-set: setup_connection() only runs on the event loop
+        # thread and there is no await between the check and the transition, so a
+        # second connect attempt can't slip in between - no asyncio.Lock needed.
+        if self.conn_state is not ConnState.DISCONNECTED:
+            raise ConnectionBusyError(f"Connection already {self.conn_state.name.lower()}")
+        self.handle_event(ConnEvent.CONNECT)
+
         try:
             # Stage 1: Establishing connection
             self.emit_progress('establishing')
@@ -221,6 +304,7 @@ class ConnectionService:
             # Update state
             self.state.connection = conn
             self.state.is_connected = True
+            self.handle_event(ConnEvent.ESTABLISHED)
 
             # Query obstacle avoidance state early to sync frontend UI ASAP
             # This prevents visual flicker from loading state → actual state
@@ -234,6 +318,7 @@ class ConnectionService:
 
         except Exception as e:
             self.logger.error(f"Error connecting to robot: {e}")
+            self.handle_event(ConnEvent.FAILED)
             # Emit error event
             if self.socketio:
                 self.socketio.emit('connection_error', {'message': str(e)})
@@ -261,7 +346,7 @@ class ConnectionService:
                     if battery_soc is not None:
                         self.state.battery_level = battery_soc
                         self.state.last_status_update = time.time()
-                        self.logger.debug(f"Battery level updated: {battery_soc}%")
+                        self.logger.debug("Battery level updated: %s%%", battery_soc)
 
                     # Extract all temperature values and store the maximum
                     temps = []
@@ -419,7 +504,7 @@ class ConnectionService:
                 ping_ms = int((end_time - start_time) * 1000)
                 self.state.ping_ms = ping_ms
 
-                self.logger.debug(f"Ping: {ping_ms}ms")
+                self.logger.debug("Ping: %sms", ping_ms)
 
             except Exception as e:
                 self.logger.error(f"Error measuring ping: {e}")
@@ -608,6 +693,7 @@ class ConnectionService:
             self.logger.info("=" * 60)
 
             self.state.is_connected = False
+            self.handle_event(ConnEvent.DISCONNECT)
             self.logger.info("✓ Connection state set to disconnected")
 
             # STEP 2: Disable all control modes
@@ -653,6 +739,7 @@ class ConnectionService:
             except Exception as e:
                 self.logger.error(f"Error closing WebRTC connection: {e}")
 
+            self.handle_event(ConnEvent.CLOSED)
             self.logger.info("=" * 60)
             self.logger.info("DISCONNECT COMPLETE")
             self.logger.info("=" * 60)
@@ -661,17 +748,24 @@ class ConnectionService:
             self.logger.error(f"Error during disconnect: {e}", exc_info=True)
             # Ensure state is set to disconnected even if errors occur
             self.state.is_connected = False
+            self.handle_event(ConnEvent.FAILED)
 
     def cleanup_audio_resources(self):
         """
         Clean up PyAudio resources.
 
         This function:
-        1. Stops and closes PyAudio stream
-        2. Terminates PyAudio instance
-        3. Resets audio state variables
+        1. Stops the audio playback writer thread
+        2. Stops and closes PyAudio stream
+        3. Terminates PyAudio instance
+        4. Resets audio state variables
         """
         # Clean up audio resources (properties handle locking internally)
+        # Stop the playback writer thread before its stream is closed underneath it
+        if self.state.audio_output:
+            self.state.audio_output.stop()
+            self.state.audio_output = None
+
         if self.state.pyaudio_stream:
             try:
                 self.state.pyaudio_stream.stop_stream()
@@ -699,7 +793,7 @@ class ConnectionService:
         This function:
         1. Stops status polling (if still running)
         2. Cleans up audio resources
-        3. Resets connection object
+        3. Resets connection object and connection state machine
         4. Resets all state variables
         """
         # Stop status polling (if still running)
@@ -710,6 +804,7 @@ class ConnectionService:
 
         # Reset connection object
         self.state.connection = None
+        self.conn_state = ConnState.DISCONNECTED
 
         # Reset all state variables
         self.state.battery_level = 0
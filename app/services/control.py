@@ -11,11 +11,144 @@ This service handles all robot control functionality including:
 - Emergency stop management
 """
 
+import functools
+import json
 import logging
+import threading
 import time
 import asyncio
 from typing import Dict, Any, Optional
-from unitree_webrtc_connect.constants import RTC_TOPIC, VUI_COLOR
+from unitree_webrtc_connect.constants import RTC_TOPIC, SPORT_CMD, VUI_COLOR
+
+# Topic of the 30-60 Hz movement path, resolved once instead of per command
+_WIRELESS_CONTROLLER_TOPIC = RTC_TOPIC["WIRELESS_CONTROLLER"]
+
+# Robot actions that are a single parameterless SPORT_MOD request, resolved
+# with one dict lookup ahead of the stateful actions in send_robot_action().
+# Like the other actions whose response isn't inspected, they're published
+# without waiting for the robot's reply.
+# action -> (api_id, log message)
+_SPORT_MOD_TOPIC = RTC_TOPIC["SPORT_MOD"]
+_SIMPLE_SPORT_ACTIONS = {
+    # Free Walk mode (Agile Mode) - AI mode obstacle avoidance
+    'free_walk': (SPORT_CMD["FreeWalk"], "FreeWalk (Agile Mode) command sent - obstacle avoidance enabled"),
+    # LeadFollow API 1045 toggles Leash Mode
+    'leash_mode': (SPORT_CMD["LeadFollow"], "Leash Mode (Lead Follow) toggle command sent"),
+    # RecoveryStand (1006) - reliable command for standing with full movement capabilities
+    'stand_up': (SPORT_CMD["RecoveryStand"], "RecoveryStand command sent - robot standing with movement enabled"),
+    'crouch': (SPORT_CMD["StandDown"], "Crouch command sent"),
+    'sit_down': (SPORT_CMD["Sit"], "Sit down command sent"),
+    'stop_move': (SPORT_CMD["StopMove"], "Stop move command sent"),
+}
+
+# Display names for the SpeedLevel range (-1..1) and the toggle_height cycle
+_SPEED_NAMES = {-1: "slow", 0: "normal", 1: "fast"}
+_HEIGHT_VALUES = (-0.18, 0.0, 0.15)  # BodyHeight offsets: low, middle, high
+_HEIGHT_NAMES = ('low', 'middle', 'high')
+
+# Minimum spacing between camera (Euler) publishes; trigger samples that
+# arrive in between are coalesced into the latest yaw
+_CAMERA_CONTROL_INTERVAL = 0.02
+# Camera requests allowed to await the robot's reply at once, and how long
+# the drain waits for a free slot before sending anyway
+_CAMERA_MAX_INFLIGHT = 4
+_CAMERA_ACK_TIMEOUT = 1.0
+
+# Optional: Numba JIT for the stick math (pip install numba). Falls back to
+# plain Python when the package is missing.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _target_velocities_py(lx: float, ly: float, rx: float, ry: float, is_keyboard_mouse: bool,
+                          deadzone_left: float, deadzone_right: float,
+                          sensitivity_linear: float, sensitivity_strafe: float,
+                          sensitivity_rotation: float, speed_mult: float,
+                          max_linear: float, max_strafe: float, max_rotation: float,
+                          max_pitch: float) -> tuple:
+    """
+    Map raw stick input to target velocities (before slew rate limiting).
+
+    Scalar arithmetic only, so Numba can compile it unchanged in nopython mode.
+    Kept scalar without Numba too: for three axes, NumPy ufunc dispatch costs
+    far more (~12 us) than the whole function in plain Python (~0.6 us).
+
+    Returns:
+        tuple: (lx, ly, rx, ry) after dead zones and multipliers, followed by
+        (vx, vy, vyaw, pitch) target velocities
+    """
+    # Apply dead zones
+    if abs(lx) < deadzone_left:
+        lx = 0.0
+    if abs(ly) < deadzone_left:
+        ly = 0.0
+    if abs(rx) < deadzone_right:
+        rx = 0.0
+    # Only apply deadzone to ry for gamepad input
+    # Keyboard/mouse pitch already has its own deadzone applied in frontend
+    if not is_keyboard_mouse and abs(ry) < deadzone_right:
+        ry = 0.0
+
+    # Only apply gamepad sensitivity/speed multipliers to gamepad inputs
+    # Keyboard/mouse inputs already have exponential curves applied in frontend
+    if not is_keyboard_mouse:
+        # Apply sensitivity multipliers (gamepad only)
+        ly *= sensitivity_linear
+        lx *= sensitivity_strafe
+        rx *= sensitivity_rotation
+
+        # Apply speed multiplier (gamepad only)
+        ly *= speed_mult
+        lx *= speed_mult
+        rx *= speed_mult
+
+    # CRITICAL FIX: Scale normalized input (-1.0 to 1.0) by max velocity BEFORE clamping
+    # Frontend sends normalized values (0.0-1.0), backend must multiply by max velocity
+    # to get actual physical velocity (e.g., 0.81 * 9.0 = 7.29 rad/s)
+    return (
+        lx, ly, rx, ry,
+        ly * max_linear,     # Forward/back from left stick Y
+        -lx * max_strafe,    # Strafe from left stick X (inverted)
+        -rx * max_rotation,  # Yaw from right stick X (inverted)
+        ry * max_pitch,      # Pitch angle (rad) - NOT inverted
+    )
+
+
+if njit is not None:
+    # Eager signature: compiled at import (and cached on disk), so the first
+    # gamepad command doesn't pay the JIT cost. No fastmath: it would change
+    # NaN/inf handling of malformed input.
+    _target_velocities_kernel = njit(
+        'UniTuple(f8, 8)(f8, f8, f8, f8, b1, f8, f8, f8, f8, f8, f8, f8, f8, f8, f8)',
+        cache=True,
+    )(_target_velocities_py)
+else:
+    _target_velocities_kernel = _target_velocities_py
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_target_velocities(lx: float, ly: float, rx: float, ry: float, is_keyboard_mouse: bool,
+                               deadzone_left: float, deadzone_right: float,
+                               sensitivity_linear: float, sensitivity_strafe: float,
+                               sensitivity_rotation: float, speed_mult: float,
+                               max_linear: float, max_strafe: float, max_rotation: float,
+                               max_pitch: float) -> tuple:
+    """
+    Cached front end for the stick math (see _target_velocities_py).
+
+    Pure function of its arguments, so held stick positions (at rest, full
+    forward) are served from the cache instead of being recomputed every tick.
+    Settings are part of the key, so preset/settings changes never see stale
+    results.
+    """
+    return _target_velocities_kernel(
+        lx, ly, rx, ry, is_keyboard_mouse,
+        deadzone_left, deadzone_right,
+        sensitivity_linear, sensitivity_strafe, sensitivity_rotation, speed_mult,
+        max_linear, max_strafe, max_rotation, max_pitch,
+    )
 
 
 class ControlService:
@@ -62,6 +195,23 @@ class ControlService:
         self.MAX_YAW_ACCEL = 10.0     # rad/s² (tune for rotation smoothness)
         self.MAX_PITCH_ACCEL = 0.5    # rad/s² (tune for pitch smoothness)
 
+        # Single-slot movement mailbox: producers overwrite the pending command
+        # and the event loop publishes only the freshest one (stale commands
+        # are dropped instead of queuing up behind a slow data channel)
+        self._pending_movement = None
+        self._movement_loop = None  # Loop that was woken for the pending command
+        self._movement_lock = threading.Lock()
+
+        # Same latest-wins slot for camera yaw, drained by one coroutine per
+        # loop that publishes at most every _CAMERA_CONTROL_INTERVAL
+        self._pending_camera_yaw = None
+        self._camera_loop = None  # Loop running the drain coroutine
+        self._camera_lock = threading.Lock()
+        self._camera_inflight = set()  # Euler requests awaiting the robot's reply
+
+        # Robot actions currently running on the event loop
+        self._action_tasks = set()
+
         # Hardware limits: the robot's physical maximum capabilities
         # These MUST match HARDWARE_LIMITS in static/js/curve-utils.js
         # Used for re-normalization when sending to WirelessController topic
@@ -276,7 +426,7 @@ class ControlService:
 
                 # Only log Pose Mode movement at DEBUG_LEVEL >= 2 (Verbose)
                 if not is_zero and self.debug_level >= 2:
-                    self.logger.debug(f"🎯 [POSE MODE] lx(roll)={lx:.3f}, ly(height)={ly:.3f}, rx(yaw)={rx:.3f}, ry(pitch)={ry:.3f}")
+                    self.logger.debug("🎯 [POSE MODE] lx(roll)=%.3f, ly(height)=%.3f, rx(yaw)=%.3f, ry(pitch)=%.3f", lx, ly, rx, ry)
 
                 return self.send_movement_command_sync(lx, ly, rx, ry, is_zero)
 
@@ -290,55 +440,49 @@ class ControlService:
             rx = float(data.get('rx', 0.0))  # Yaw (rotation)
             ry = float(data.get('ry', 0.0))  # Pitch (head up/down)
 
-            # Apply dead zones
-            deadzone_left = self.state.gamepad_settings['deadzone_left_stick']
-            deadzone_right = self.state.gamepad_settings['deadzone_right_stick']
-
-            if abs(lx) < deadzone_left:
-                lx = 0.0
-            if abs(ly) < deadzone_left:
-                ly = 0.0
-            if abs(rx) < deadzone_right:
-                rx = 0.0
-            # Only apply deadzone to ry for gamepad input
-            # Keyboard/mouse pitch already has its own deadzone applied in frontend
-            if data.get('source', 'gamepad') != 'keyboard_mouse' and abs(ry) < deadzone_right:
-                ry = 0.0
-
             # Check if this is keyboard/mouse input (already has curves applied)
             # or gamepad input (needs sensitivity/speed multipliers)
             source = data.get('source', 'gamepad')
             is_keyboard_mouse = (source == 'keyboard_mouse')
 
-            # Only apply gamepad sensitivity/speed multipliers to gamepad inputs
-            # Keyboard/mouse inputs already have exponential curves applied in frontend
-            if not is_keyboard_mouse:
-                # Apply sensitivity multipliers (gamepad only)
-                ly *= self.state.gamepad_settings['sensitivity_linear']
-                lx *= self.state.gamepad_settings['sensitivity_strafe']
-                rx *= self.state.gamepad_settings['sensitivity_rotation']
-
-                # Apply speed multiplier (gamepad only)
-                speed_mult = self.state.gamepad_settings['speed_multiplier']
-                ly *= speed_mult
-                lx *= speed_mult
-                rx *= speed_mult
+            # One immutable snapshot per command: no dict copy, consistent values
+            settings = self.state.gamepad_settings_snapshot
+
+            # Idle fast path: sticks resting inside the dead zone and the robot
+            # already told to stop -> the pipeline below could only produce
+            # another zero command that wouldn't be sent. Keyboard/mouse pitch
+            # has no backend dead zone, so it must be exactly zero.
+            idle_threshold = min(settings.deadzone_left_stick, settings.deadzone_right_stick)
+            if (self.state.zero_velocity_sent
+                    and abs(lx) < idle_threshold and abs(ly) < idle_threshold and abs(rx) < idle_threshold
+                    and (ry == 0.0 if is_keyboard_mouse else abs(ry) < idle_threshold)):
+                self.last_cmd_time = time.time()  # Keep the slew limiter's dt fresh
+                return {
+                    'status': 'success',
+                    'zero_velocity': True,
+                    'should_send': False,
+                    'velocities': {
+                        'vx': 0.0, 'vy': 0.0, 'vyaw': 0.0, 'pitch': 0.0,
+                        'lx': 0.0, 'ly': 0.0, 'rx': 0.0, 'ry': 0.0
+                    },
+                    'processing_time_ms': round((time.time() - request_start_time) * 1000, 2)
+                }
 
             # Use velocity limits from command data if provided (keyboard/mouse), otherwise use gamepad settings
-            max_linear = data.get('max_linear', self.state.gamepad_settings['max_linear_velocity'])
-            max_strafe = data.get('max_strafe', self.state.gamepad_settings['max_strafe_velocity'])
-            max_rotation = data.get('max_rotation', self.state.gamepad_settings['max_rotation_velocity'])
+            max_linear = data.get('max_linear', settings.max_linear_velocity)
+            max_strafe = data.get('max_strafe', settings.max_strafe_velocity)
+            max_rotation = data.get('max_rotation', settings.max_rotation_velocity)
             max_pitch = data.get('max_pitch', 0.35)  # Default to 0.35 rad (~20°) if not provided
 
-            # CRITICAL FIX: Scale normalized input (-1.0 to 1.0) by max velocity BEFORE clamping
-            # Frontend sends normalized values (0.0-1.0), backend must multiply by max velocity
-            # to get actual physical velocity (e.g., 0.81 * 9.0 = 7.29 rad/s)
-
-            # Step 1: Calculate Target Velocities (scale normalized input by max velocity)
-            raw_target_vx = ly * max_linear          # Forward/back from left stick Y
-            raw_target_vy = -lx * max_strafe         # Strafe from left stick X (inverted)
-            raw_target_vyaw = -rx * max_rotation     # Yaw from right stick X (inverted)
-            raw_target_pitch = ry * max_pitch        # Pitch angle (rad) - NOT inverted
+            # Step 1: Dead zones, sensitivity and target velocities (pure, cached per input)
+            (lx, ly, rx, ry,
+             raw_target_vx, raw_target_vy, raw_target_vyaw, raw_target_pitch) = _compute_target_velocities(
+                lx, ly, rx, ry, is_keyboard_mouse,
+                settings.deadzone_left_stick, settings.deadzone_right_stick,
+                settings.sensitivity_linear, settings.sensitivity_strafe,
+                settings.sensitivity_rotation, settings.speed_multiplier,
+                max_linear, max_strafe, max_rotation, max_pitch
+            )
 
             # Step 2: Apply Slew Rate Limiter (prevents jerky "freaking out" movements)
             # This smoothly ramps velocity changes over time instead of allowing instant jumps
@@ -358,7 +502,7 @@ class ControlService:
                 vy = raw_target_vy
                 vyaw = raw_target_vyaw
 
-                self.logger.warning(f"🔥 [RAGE MODE] RAW VELOCITIES: vx={vx:.3f}, vy={vy:.3f}, vyaw={vyaw:.3f}")
+                self.logger.warning("🔥 [RAGE MODE] RAW VELOCITIES: vx=%.3f, vy=%.3f, vyaw=%.3f", vx, vy, vyaw)
             else:
                 # Normal mode: Apply slew rate limiter
 
@@ -444,9 +588,10 @@ class ControlService:
             # Changed to DEBUG level to reduce console spam (30-60 Hz during movement)
             if is_keyboard_mouse and (abs(vx) > 0.01 or abs(vy) > 0.01 or abs(vyaw) > 0.01 or abs(pitch) > 0.005):
                 if rage_mode:
-                    self.logger.debug(f"[KB/Mouse Backend RAGE] vx={vx:.3f}, vy={vy:.3f}, vyaw={vyaw:.3f}, pitch={pitch:.3f}")
+                    self.logger.debug("[KB/Mouse Backend RAGE] vx=%.3f, vy=%.3f, vyaw=%.3f, pitch=%.3f", vx, vy, vyaw, pitch)
                 else:
-                    self.logger.debug(f"[KB/Mouse Backend] rx={rx:.3f} → vyaw={vyaw:.3f}, ry={ry:.3f} → pitch={pitch:.3f} (dt={dt*1000:.1f}ms)")
+                    self.logger.debug("[KB/Mouse Backend] rx=%.3f → vyaw=%.3f, ry=%.3f → pitch=%.3f (dt=%.1fms)",
+                                      rx, vyaw, ry, pitch, dt * 1000)
 
             # Check if all velocities AND pitch are zero
             is_zero_velocity = (abs(vx) < 0.01 and abs(vy) < 0.01 and abs(vyaw) < 0.01 and abs(pitch) < 0.005)
@@ -493,7 +638,7 @@ class ControlService:
             # Calculate processing time
             processing_time = (time.time() - request_start_time) * 1000  # Convert to ms
             if processing_time > 10:  # Log if processing takes more than 10ms
-                self.logger.warning(f"Slow command processing: {processing_time:.1f}ms")
+                self.logger.warning("Slow command processing: %.1fms", processing_time)
 
             return {
                 'status': 'success',
@@ -507,14 +652,16 @@ class ControlService:
             }
 
         except Exception as e:
-            self.logger.error(f"Movement command error: {e}")
+            self.logger.error("Movement command error: %s", e)
             return {'status': 'error', 'message': str(e)}
 
     def send_movement_command_sync(self, lx: float, ly: float, rx: float, ry: float, is_zero_velocity: bool) -> dict:
         """
         Synchronous wrapper for send_movement_command.
 
-        Schedules async send_movement_command() in event loop (fire-and-forget).
+        Stores the command in a single-slot mailbox and wakes the event loop
+        (fire-and-forget). Commands that arrive before the loop gets to publish
+        replace the pending one, so only the latest target is sent.
         Returns immediately without waiting for completion.
 
         Args:
@@ -527,19 +674,31 @@ class ControlService:
         Returns:
             dict: Result with status (always success if scheduled)
         """
-        if self.state.event_loop and self.state.event_loop.is_running():
-            asyncio.run_coroutine_threadsafe(
-                self.send_movement_command(lx, ly, rx, ry, is_zero_velocity),
-                self.state.event_loop
-            )
+        event_loop = self.state.event_loop
+        if event_loop and event_loop.is_running():
+            with self._movement_lock:
+                # Also wake a new loop after a reconnect (the old one never flushed)
+                wake_loop = self._pending_movement is None or self._movement_loop is not event_loop
+                self._pending_movement = (lx, ly, rx, ry, is_zero_velocity)
+                self._movement_loop = event_loop
+            if wake_loop:
+                event_loop.call_soon_threadsafe(self._flush_pending_movement)
             return {'status': 'success', 'message': 'Movement command scheduled'}
         else:
             self.logger.error(
-                f"Event loop not running! state.event_loop={self.state.event_loop}, "
-                f"is_running={self.state.event_loop.is_running() if self.state.event_loop else 'N/A'}"
+                f"Event loop not running! state.event_loop={event_loop}, "
+                f"is_running={event_loop.is_running() if event_loop else 'N/A'}"
             )
             return {'status': 'error', 'message': 'Event loop not running'}
 
+    def _flush_pending_movement(self):
+        """Publish the latest mailbox command (runs in the event loop)."""
+        with self._movement_lock:
+            command = self._pending_movement
+            self._pending_movement = None
+        if command is not None:
+            self._publish_movement_command(*command)
+
     async def send_movement_command(self, lx: float, ly: float, rx: float, ry: float, is_zero_velocity: bool):
         """
         Send movement command to robot via WirelessController topic.
@@ -559,12 +718,15 @@ class ControlService:
             ry: Normalized pitch (-1 to 1) - currently IGNORED (pitch not sent to robot)
             is_zero_velocity: Whether this is a zero velocity command
         """
-        try:
-            from unitree_webrtc_connect.constants import RTC_TOPIC
+        self._publish_movement_command(lx, ly, rx, ry, is_zero_velocity)
 
+    def _publish_movement_command(self, lx: float, ly: float, rx: float, ry: float, is_zero_velocity: bool):
+        """Publish a WirelessController message (see send_movement_command)."""
+        try:
             # Debug logging for non-trivial commands
-            # Changed to DEBUG level to reduce console spam (30-60 Hz during movement)
-            if abs(ly) > 0.01 or abs(lx) > 0.01 or abs(rx) > 0.01:
+            # Changed to DEBUG level to reduce console spam (30-60 Hz during movement);
+            # checked first so the f-string isn't formatted when DEBUG is off
+            if self.logger.isEnabledFor(logging.DEBUG) and (abs(ly) > 0.01 or abs(lx) > 0.01 or abs(rx) > 0.01):
                 self.logger.debug(
                     f"🤖 [ROBOT COMMAND] WirelessController: lx={lx:.3f}, ly={ly:.3f}, rx={rx:.3f}"
                 )
@@ -574,7 +736,7 @@ class ControlService:
             # In Pose mode (1028): ry controls pitch via WirelessController natively
             ry_value = round(ry, 4) if self.state.pose_mode_active else 0.0
             self.state.connection.datachannel.pub_sub.publish_without_callback(
-                RTC_TOPIC["WIRELESS_CONTROLLER"],
+                _WIRELESS_CONTROLLER_TOPIC,
                 {"lx": round(lx, 4), "ly": round(ly, 4), "rx": round(rx, 4), "ry": ry_value, "keys": 0}
             )
 
@@ -583,7 +745,7 @@ class ControlService:
                 self.logger.debug("✓ Zero velocity command sent - robot should stop immediately")
 
         except Exception as e:
-            self.logger.error(f"Error sending WirelessController command: {e}")
+            self.logger.error("Error sending WirelessController command: %s", e)
 
     def send_robot_action_sync(self, action: str) -> dict:
         """
@@ -599,20 +761,21 @@ class ControlService:
             dict: Result with status (always success if scheduled)
         """
         if self.state.event_loop and self.state.event_loop.is_running():
-            self.logger.info(f"Scheduling robot action: {action}")
-            asyncio.run_coroutine_threadsafe(self.send_robot_action(action), self.state.event_loop)
+            self.logger.info("Scheduling robot action: %s", action)
+            # Hand over just the action name; the coroutine is created on the
+            # loop, so no concurrent.futures.Future is built per button press
+            self.state.event_loop.call_soon_threadsafe(self._start_robot_action, action)
             result = {'status': 'success', 'action': action, 'message': f'Action {action} scheduled'}
 
             # Height adjustment disabled - BodyHeight API (1013) returns code 3203 in AI mode
-            # height_names = ['low', 'middle', 'high']
             # if action == 'increase_height':
             #     predicted = min(self.state.current_body_height + 1, 2)
             #     result['height_level'] = predicted
-            #     result['height_name'] = height_names[predicted]
+            #     result['height_name'] = _HEIGHT_NAMES[predicted]
             # elif action == 'decrease_height':
             #     predicted = max(self.state.current_body_height - 1, 0)
             #     result['height_level'] = predicted
-            #     result['height_name'] = height_names[predicted]
+            #     result['height_name'] = _HEIGHT_NAMES[predicted]
 
             return result
         else:
@@ -622,6 +785,13 @@ class ControlService:
             )
             return {'status': 'error', 'message': 'Event loop not running'}
 
+    def _start_robot_action(self, action: str):
+        """Start send_robot_action() as a task (runs in the event loop)."""
+        task = asyncio.get_running_loop().create_task(self.send_robot_action(action))
+        # The loop only keeps weak references to tasks
+        self._action_tasks.add(task)
+        task.add_done_callback(self._action_tasks.discard)
+
     async def send_robot_action(self, action: str) -> dict:
         """
         Send robot action command asynchronously.
@@ -633,13 +803,21 @@ class ControlService:
             dict: Result with status and action
         """
         try:
-            from unitree_webrtc_connect.constants import RTC_TOPIC, SPORT_CMD, MCF_CMD
+            simple_action = _SIMPLE_SPORT_ACTIONS.get(action)
+            if simple_action is not None:
+                api_id, message = simple_action
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
+                    {"api_id": api_id}
+                )
+                self.logger.info(message)
+                return {'status': 'success', 'action': action}
 
             if action == 'emergency_stop':
                 # Emergency stop - damp all motors
                 self.state.emergency_stop_active = True
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
                     {"api_id": SPORT_CMD["Damp"]}
                 )
                 self.logger.warning("EMERGENCY STOP ACTIVATED")
@@ -648,23 +826,6 @@ class ControlService:
                 self.state.emergency_stop_active = False
                 self.logger.info("Emergency stop cleared")
 
-            elif action == 'free_walk':
-                # Enter Free Walk mode (Agile Mode) - AI mode obstacle avoidance
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
-                    {"api_id": SPORT_CMD["FreeWalk"]}
-                )
-                self.logger.info("FreeWalk (Agile Mode) command sent - obstacle avoidance enabled")
-
-            elif action == 'leash_mode':
-                # Toggle Leash Mode (Lead Follow mode)
-                # Use LeadFollow API 1045 to toggle the mode
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
-                    {"api_id": SPORT_CMD["LeadFollow"]}
-                )
-                self.logger.info("Leash Mode (Lead Follow) toggle command sent")
-
             elif action == 'switch_avoid_mode':
                 # Toggle Obstacle Avoidance Mode
                 # SDK2 Reference: obstacles_avoid_api.hpp
@@ -758,40 +919,16 @@ class ControlService:
                         self.logger.info("✅ Obstacle avoidance DISABLED (LiDAR remains ON)")
 
                 except Exception as e:
-                    self.logger.error(f"Error toggling obstacle avoidance: {e}")
+                    self.logger.error("Error toggling obstacle avoidance: %s", e)
                     # Don't change state on error - revert if we already changed it
                     self.state.obstacle_avoid_active = not new_avoid_state
 
-            elif action == 'stand_up':
-                # RecoveryStand (1006) - reliable command for standing with full movement capabilities
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
-                    {"api_id": SPORT_CMD["RecoveryStand"]}
-                )
-                self.logger.info("RecoveryStand command sent - robot standing with movement enabled")
-
-            elif action == 'crouch':
-                # Crouch down (StandDown)
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
-                    {"api_id": SPORT_CMD["StandDown"]}
-                )
-                self.logger.info("Crouch command sent")
-
-            elif action == 'sit_down':
-                # Sit down
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
-                    {"api_id": SPORT_CMD["Sit"]}
-                )
-                self.logger.info("Sit down command sent")
-
             elif action == 'hello':
                 # Hello gesture (wave) - triggered by left mouse click
                 self.logger.info("Sending Hello gesture (wave)")
                 try:
                     response = await self.state.connection.datachannel.pub_sub.publish_request_new(
-                        RTC_TOPIC["SPORT_MOD"],
+                        _SPORT_MOD_TOPIC,
                         {"api_id": SPORT_CMD["Hello"]}
                     )
 
@@ -806,43 +943,42 @@ class ControlService:
                             # RecoveryStand (1006) restores normal movement controls
                             try:
                                 recovery_response = await self.state.connection.datachannel.pub_sub.publish_request_new(
-                                    RTC_TOPIC["SPORT_MOD"],
+                                    _SPORT_MOD_TOPIC,
                                     {"api_id": SPORT_CMD["RecoveryStand"]}
                                 )
                                 self.logger.info("✓ Restored FreeWalk mode after Hello gesture (RecoveryStand 1006)")
                             except Exception as recovery_error:
-                                self.logger.error(f"Error sending RecoveryStand after Hello gesture: {recovery_error}")
+                                self.logger.error("Error sending RecoveryStand after Hello gesture: %s", recovery_error)
                         else:
-                            self.logger.warning(f"Hello gesture returned status code: {status_code}")
+                            self.logger.warning("Hello gesture returned status code: %s", status_code)
                 except Exception as e:
-                    self.logger.error(f"Error sending Hello gesture: {e}")
+                    self.logger.error("Error sending Hello gesture: %s", e)
 
             elif action == 'toggle_height':
                 # Cycle through heights: 0 (low), 1 (middle), 2 (high)
                 self.state.current_body_height = (self.state.current_body_height + 1) % 3
-                height_values = [-0.18, 0.0, 0.15]  # Low, middle, high
-                height_value = height_values[self.state.current_body_height]
-                height_name = ['low', 'middle', 'high'][self.state.current_body_height]
+                height_value = _HEIGHT_VALUES[self.state.current_body_height]
+                height_name = _HEIGHT_NAMES[self.state.current_body_height]
 
-                self.logger.info(f"Attempting to change body height to: {height_name} ({height_value})")
+                self.logger.info("Attempting to change body height to: %s (%s)", height_name, height_value)
                 self.logger.warning("Note: BodyHeight command may not work in AI mode")
 
                 try:
                     response = await self.state.connection.datachannel.pub_sub.publish_request_new(
-                        RTC_TOPIC["SPORT_MOD"],
+                        _SPORT_MOD_TOPIC,
                         {
                             "api_id": SPORT_CMD["BodyHeight"],
                             "parameter": {"height": height_value}
                         }
                     )
-                    self.logger.info(f"Body height command sent. Response: {response}")
+                    self.logger.info("Body height command sent. Response: %s", response)
 
                     if response and 'data' in response:
-                        self.logger.info(f"Body height changed to: {height_name}")
+                        self.logger.info("Body height changed to: %s", height_name)
                     else:
-                        self.logger.warning(f"Body height command may have failed - no response data")
+                        self.logger.warning("Body height command may have failed - no response data")
                 except Exception as e:
-                    self.logger.error(f"Error changing body height: {e}")
+                    self.logger.error("Error changing body height: %s", e)
 
             # Height adjustment disabled - BodyHeight API (1013) returns code 3203 in AI mode
             # elif action == 'increase_height': ...
@@ -859,7 +995,8 @@ class ControlService:
                 from unitree_webrtc_connect.constants import AUDIO_API, OBSTACLES_AVOID_API
 
                 new_state = not self.state.lidar_state
-                self.logger.info(f"LiDAR switch: {'ON' if new_state else 'OFF'} (current: {'ON' if self.state.lidar_state else 'OFF'})")
+                self.logger.info("LiDAR switch: %s (current: %s)",
+                                 'ON' if new_state else 'OFF', 'ON' if self.state.lidar_state else 'OFF')
 
                 try:
                     if new_state:
@@ -940,13 +1077,13 @@ class ControlService:
                             RTC_TOPIC["ULIDAR_STATE"],    # rt/utlidar/lidar_state
                             RTC_TOPIC["ROBOTODOM"],        # rt/utlidar/robot_pose
                         ]
-                        self.logger.info(f"LiDAR OFF [1/3]: Unsubscribing from {len(lidar_data_topics)} LiDAR data topics...")
+                        self.logger.info("LiDAR OFF [1/3]: Unsubscribing from %d LiDAR data topics...", len(lidar_data_topics))
                         for topic in lidar_data_topics:
                             try:
                                 self.state.connection.datachannel.pub_sub.unsubscribe(topic)
-                                self.logger.debug(f"  Unsubscribed from: {topic}")
+                                self.logger.debug("  Unsubscribed from: %s", topic)
                             except Exception as unsub_err:
-                                self.logger.warning(f"  Failed to unsubscribe from {topic}: {unsub_err}")
+                                self.logger.warning("  Failed to unsubscribe from %s: %s", topic, unsub_err)
 
                         # 3. Send OFF command to shut down both LiDAR motors
                         self.state.connection.datachannel.pub_sub.publish_without_callback(
@@ -964,20 +1101,12 @@ class ControlService:
                         if self.socketio:
                             self.socketio.emit('lidar_state_update', {'enabled': False})
 
-                    self.logger.info(f"LiDAR is now {'ON' if new_state else 'OFF'}")
+                    self.logger.info("LiDAR is now %s", 'ON' if new_state else 'OFF')
 
                 except Exception as e:
-                    self.logger.error(f"Error toggling LiDAR: {e}")
+                    self.logger.error("Error toggling LiDAR: %s", e)
                     # Don't change state on error - it remains at its previous value
 
-            elif action == 'stop_move':
-                # Stop all movement
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
-                    {"api_id": SPORT_CMD["StopMove"]}
-                )
-                self.logger.info("Stop move command sent")
-
             elif action == 'enable_walk_mode':
                 # In AI mode, robot is already in BalanceStand which allows movement
                 self.logger.info("Walk mode enabled - robot ready to move (AI mode)")
@@ -985,8 +1114,8 @@ class ControlService:
             elif action == 'disable_walk_mode':
                 # Stop movement by sending Move command with zero velocities
                 self.logger.info("Walk mode disabled - stopping movement")
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
                     {
                         "api_id": SPORT_CMD["Move"],
                         "parameter": {"x": 0.0, "y": 0.0, "z": 0.0}
@@ -996,64 +1125,67 @@ class ControlService:
             elif action == 'speed_level_up':
                 # Increase speed level
                 self.state.speed_level = min(1, self.state.speed_level + 1)  # Clamp to max 1
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
                     {
                         "api_id": SPORT_CMD["SpeedLevel"],
                         "parameter": {"level": self.state.speed_level}
                     }
                 )
-                speed_name = {-1: "slow", 0: "normal", 1: "fast"}[self.state.speed_level]
-                self.logger.info(f"Speed level set to: {self.state.speed_level} ({speed_name})")
+                speed_name = _SPEED_NAMES[self.state.speed_level]
+                self.logger.info("Speed level set to: %s (%s)", self.state.speed_level, speed_name)
 
             elif action == 'speed_level_down':
                 # Decrease speed level
                 self.state.speed_level = max(-1, self.state.speed_level - 1)  # Clamp to min -1
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
                     {
                         "api_id": SPORT_CMD["SpeedLevel"],
                         "parameter": {"level": self.state.speed_level}
                     }
                 )
-                speed_name = {-1: "slow", 0: "normal", 1: "fast"}[self.state.speed_level]
-                self.logger.info(f"Speed level set to: {self.state.speed_level} ({speed_name})")
+                speed_name = _SPEED_NAMES[self.state.speed_level]
+                self.logger.info("Speed level set to: %s (%s)", self.state.speed_level, speed_name)
 
             elif action == 'toggle_free_bound':
                 # Toggle FreeBound mode (Bound Run Mode)
                 self.state.free_bound_active = not self.state.free_bound_active
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
                     {
                         "api_id": SPORT_CMD["FreeBound"],
                         "parameter": {"data": self.state.free_bound_active}
                     }
                 )
-                self.logger.info(f"FreeBound (Bound Run) mode: {'enabled' if self.state.free_bound_active else 'disabled (returned to Agile Mode)'}")
+                self.logger.info("FreeBound (Bound Run) mode: %s",
+                                 'enabled' if self.state.free_bound_active else 'disabled (returned to Agile Mode)')
 
             elif action == 'toggle_free_jump':
                 # Toggle FreeJump mode (Jump Mode)
                 self.state.free_jump_active = not self.state.free_jump_active
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
                     {
                         "api_id": SPORT_CMD["FreeJump"],
                         "parameter": {"data": self.state.free_jump_active}
                     }
                 )
-                self.logger.info(f"FreeJump (Jump) mode: {'enabled' if self.state.free_jump_active else 'disabled (returned to Agile Mode)'}")
+                self.logger.info("FreeJump (Jump) mode: %s",
+                                 'enabled' if self.state.free_jump_active else 'disabled (returned to Agile Mode)')
 
             elif action == 'toggle_free_avoid':
                 # Toggle FreeAvoid mode (Avoidance Mode)
                 self.state.free_avoid_active = not self.state.free_avoid_active
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
                     {
                         "api_id": SPORT_CMD["FreeAvoid"],
                         "parameter": {"data": self.state.free_avoid_active}
                     }
                 )
-                self.logger.info(f"FreeAvoid (Avoidance) mode: {'enabled' if self.state.free_avoid_active else 'disabled (returned to Agile Mode)'}")
+                self.logger.info("FreeAvoid (Avoidance) mode: %s",
+                                 'enabled' if self.state.free_avoid_active else 'disabled (returned to Agile Mode)')
 
             elif action == 'enter_pose_mode':
                 # Enter Pose Mode: stop movement, then send Pose API (1028)
@@ -1069,7 +1201,7 @@ class ControlService:
 
                 # Enter Pose Mode
                 await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                    _SPORT_MOD_TOPIC,
                     {"api_id": SPORT_CMD["Pose"]}
                 )
                 self.state.pose_mode_active = True
@@ -1083,7 +1215,7 @@ class ControlService:
 
                 # RecoveryStand restores FreeWalk movement
                 await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                    _SPORT_MOD_TOPIC,
                     {"api_id": SPORT_CMD["RecoveryStand"]}
                 )
                 await asyncio.sleep(1.0)  # Wait for robot to stabilize
@@ -1093,8 +1225,8 @@ class ControlService:
 
             elif action == 'toggle_walk_pose':
                 # Toggle between walk and pose mode (legacy - kept for compatibility)
-                await self.state.connection.datachannel.pub_sub.publish_request_new(
-                    RTC_TOPIC["SPORT_MOD"],
+                self.state.connection.datachannel.pub_sub.publish_request_without_callback(
+                    _SPORT_MOD_TOPIC,
                     {"api_id": SPORT_CMD["Pose"]}
                 )
                 self.logger.info("Walk/Pose mode toggled")
@@ -1105,9 +1237,66 @@ class ControlService:
             return {'status': 'success', 'action': action}
 
         except Exception as e:
-            self.logger.error(f"Robot action error: {e}")
+            self.logger.error("Robot action error: %s", e)
             return {'status': 'error', 'message': str(e)}
 
+    def send_camera_control_sync(self, yaw: float) -> dict:
+        """
+        Synchronous wrapper for send_camera_control.
+
+        Stores yaw in a single-slot mailbox and starts a drain coroutine on the
+        event loop if one isn't already running (fire-and-forget). Trigger
+        samples that arrive faster than the publish interval replace the
+        pending yaw, so only the latest value is sent.
+
+        Args:
+            yaw: Camera yaw angle
+
+        Returns:
+            dict: Result with status (always success if scheduled)
+        """
+        event_loop = self.state.event_loop
+        if event_loop and event_loop.is_running():
+            with self._camera_lock:
+                # Also start a drain on a new loop after a reconnect
+                start_drain = self._camera_loop is not event_loop
+                self._pending_camera_yaw = yaw
+                self._camera_loop = event_loop
+            if start_drain:
+                asyncio.run_coroutine_threadsafe(self._drain_camera_control(event_loop), event_loop)
+            return {'status': 'success', 'message': 'Camera command scheduled'}
+        else:
+            return {'status': 'error', 'message': 'Event loop not running'}
+
+    async def _drain_camera_control(self, event_loop):
+        """
+        Publish the pending camera yaw until the mailbox stays empty.
+
+        Each Euler request awaits its reply in its own task, up to
+        _CAMERA_MAX_INFLIGHT at once, so a slow response doesn't hold back
+        newer yaw values and a lost one doesn't stall the camera.
+        """
+        # Requests left on a previous loop (before a reconnect) never complete
+        self._camera_inflight.difference_update(
+            [task for task in self._camera_inflight if task.get_loop() is not event_loop]
+        )
+        while True:
+            if len(self._camera_inflight) >= _CAMERA_MAX_INFLIGHT:
+                await asyncio.wait(
+                    self._camera_inflight, timeout=_CAMERA_ACK_TIMEOUT, return_when=asyncio.FIRST_COMPLETED
+                )
+            with self._camera_lock:
+                yaw = self._pending_camera_yaw
+                self._pending_camera_yaw = None
+                if yaw is None:
+                    if self._camera_loop is event_loop:
+                        self._camera_loop = None
+                    return
+            task = event_loop.create_task(self.send_camera_control(yaw))
+            self._camera_inflight.add(task)
+            task.add_done_callback(self._camera_inflight.discard)
+            await asyncio.sleep(_CAMERA_CONTROL_INTERVAL)
+
     async def send_camera_control(self, yaw: float):
         """
         Send camera control command asynchronously.
@@ -1116,17 +1305,15 @@ class ControlService:
             yaw: Camera yaw angle
         """
         try:
-            from unitree_webrtc_connect.constants import RTC_TOPIC, SPORT_CMD
-
             await self.state.connection.datachannel.pub_sub.publish_request_new(
-                RTC_TOPIC["SPORT_MOD"],
+                _SPORT_MOD_TOPIC,
                 {
                     "api_id": SPORT_CMD["Euler"],
                     "parameter": {"roll": 0.0, "pitch": 0.0, "yaw": yaw}
                 }
             )
         except Exception as e:
-            self.logger.error(f"Error sending camera control command: {e}")
+            self.logger.error("Error sending camera control command: %s", e)
 
     # ============================================================================
     # LED CONTROL METHODS (VUI API)
@@ -1274,16 +1461,19 @@ class ControlService:
                 RTC_TOPIC["VUI"],
                 {"api_id": 1006}
             )
-            if response and 'data' in response:
-                import json
-                data = json.loads(response['data']['data'])
-                brightness = data.get('brightness')
-                # Update tracked brightness
-                if brightness is not None:
+            if response and 'data' in response and 'header' in response['data']:
+                status_code = response['data']['header'].get('status', {}).get('code', -1)
+                if status_code == 0:
+                    data = response['data'].get('data', '{}')
+                    if isinstance(data, str):
+                        data = json.loads(data)
+                    brightness = data.get('brightness', 0)
+                    # Update tracked brightness
                     self._current_flashlight_brightness = brightness
-                return brightness
+                    return brightness
+            self.logger.warning("Failed to query LED brightness: %s", response)
         except Exception as e:
-            self.logger.error(f"Error getting LED brightness: {e}")
+            self.logger.error("Error getting LED brightness: %s", e)
         return None
 
     async def _apply_pending_rgb_color(self):
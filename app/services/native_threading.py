@@ -0,0 +1,20 @@
+"""
+Real OS threading primitives, even under eventlet.
+
+With SOCKETIO_ASYNC_MODE=eventlet, web_interface.py monkey-patches threading
+so Flask/Socket.IO handlers run as green threads. The asyncio event loop
+(aiortc, and uvloop when installed) and the PyAudio writer block in C code
+that never yields to the eventlet hub, so they must run on native threads
+or they freeze every handler. Without eventlet this is the stdlib module.
+"""
+
+import threading
+
+try:
+    from eventlet.patcher import original as _eventlet_original
+except ImportError:
+    native_threading = threading
+else:
+    native_threading = _eventlet_original('threading')
+
+__all__ = ['native_threading']
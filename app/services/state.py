@@ -8,13 +8,17 @@ consistency and thread safety.
 CRITICAL THREAD SAFETY RULES:
 ==============================
 
-1. ALL PROPERTIES USE INTERNAL LOCKING
-   - Every property getter/setter acquires its respective lock internally
-   - Example: state.latest_frame uses self._frame_lock internally
+1. ALL PROPERTIES ARE SAFE TO USE FROM ANY THREAD
+   - Audio resource properties acquire their lock internally
+   - Example: state.pyaudio_stream uses self._audio_lock internally
+   - Single-word flags (audio_muted, gamepad_enabled, ...) and
+     reading state.latest_frame are plain attribute accesses, which are
+     atomic under the GIL, so the audio/video/gamepad hot paths pay no lock
+     per access
 
 2. NEVER USE EXPLICIT LOCKS WITH PROPERTIES
-   - ❌ WRONG: with state._frame_lock: state.latest_frame = img
-   - ✅ RIGHT: state.latest_frame = img
+   - ❌ WRONG: with state._audio_lock: state.pyaudio_stream = stream
+   - ✅ RIGHT: state.pyaudio_stream = stream
 
 3. WHY DOUBLE-LOCKING IS DEADLY
    - Using 'with state._lock:' before accessing a property creates a DEADLOCK
@@ -24,11 +28,11 @@ CRITICAL THREAD SAFETY RULES:
 4. WHEN TO USE LOCKS DIRECTLY
    - Only when accessing multiple private attributes atomically
    - Only when you need to read/write the private _attribute directly
-   - Example: with self._frame_lock: self._latest_frame = value
+   - Example: with self._audio_lock: self._audio_output = None
 
 5. EXTERNAL CODE SHOULD ONLY USE PROPERTIES
    - Never access private attributes (e.g., state._latest_frame) from outside
-   - Never use locks (e.g., state._frame_lock) from outside
+   - Never use locks (e.g., state._audio_lock) from outside
    - Always use properties (e.g., state.latest_frame)
 
 See .agent-os/standards/best-practices.md for detailed examples.
@@ -36,17 +40,35 @@ See .agent-os/standards/best-practices.md for detailed examples.
 
 import threading
 from queue import Queue
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, NamedTuple, Tuple
 import asyncio
 
 
+class GamepadSettings(NamedTuple):
+    """
+    Immutable snapshot of the gamepad settings.
+
+    Updates build a new snapshot and swap it in, so the movement hot path can
+    grab one reference and read fields without locking or copying a dict.
+    """
+    deadzone_left_stick: float = 0.15
+    deadzone_right_stick: float = 0.15
+    sensitivity_linear: float = 1.0
+    sensitivity_strafe: float = 1.0
+    sensitivity_rotation: float = 1.0
+    max_linear_velocity: float = 0.6
+    max_strafe_velocity: float = 0.4
+    max_rotation_velocity: float = 0.8
+    speed_multiplier: float = 1.0
+
+
 class StateService:
     """
     Centralized state management service.
 
     Manages all application state including:
     - Connection state (WebRTC connection, event loop, threads)
-    - Video state (frame queue, latest frame)
+    - Video state (latest frame and its sequence number)
     - Audio state (streaming, mute, push-to-talk)
     - Control state (gamepad, keyboard/mouse, emergency stop)
     - Settings (gamepad sensitivity, velocity limits, presets)
@@ -54,23 +76,24 @@ class StateService:
 
     THREAD SAFETY:
     --------------
-    All properties are thread-safe and use internal locking.
+    All properties are thread-safe. Audio resource properties use internal
+    locking; single-word flags and latest_frame reads rely on atomic rebinding.
     External code should NEVER use explicit locks when accessing properties.
 
     ❌ ANTI-PATTERN (causes deadlock):
-        with state._frame_lock:
-            state.latest_frame = img  # Property already uses _frame_lock!
+        with state._audio_lock:
+            state.pyaudio_stream = stream  # Property already uses _audio_lock!
 
     ✅ CORRECT USAGE:
-        state.latest_frame = img  # Property handles locking internally
+        state.pyaudio_stream = stream  # Property handles locking internally
     """
     
     def __init__(self):
         """Initialize state service with default values."""
-        # Thread locks for thread-safe access
-        self._frame_lock = threading.Lock()
-        self._gamepad_lock = threading.Lock()
-        self._keyboard_mouse_lock = threading.Lock()
+        # Thread locks for thread-safe access. A plain Lock, not an RLock: no
+        # code path re-acquires it while held (methods that update several
+        # fields touch the private attributes, never the locking properties),
+        # and Lock avoids RLock's owner/recursion bookkeeping on every access.
         self._audio_lock = threading.Lock()
         
         # Connection state
@@ -80,8 +103,12 @@ class StateService:
         self._is_connected = False
         
         # Video state
-        self._frame_queue = Queue(maxsize=30)
+        # Latest-only: MJPEG viewers always want the newest frame, so there is
+        # no backlog buffer. _frame_seq is bumped on every publish and
+        # _frame_cond wakes consumers waiting for a frame newer than theirs.
         self._latest_frame = None
+        self._frame_seq = 0
+        self._frame_cond = threading.Condition(threading.Lock())
         
         # Audio state
         self._audio_streaming_enabled = False
@@ -91,6 +118,7 @@ class StateService:
         self._pyaudio_instance = None
         self._audio_muted = True  # Muted by default
         self._pyaudio_stream = None
+        self._audio_output = None  # AudioOutput writer thread for playback
         self._audio_output_queue = Queue(maxsize=100)
         
         # Gamepad control state
@@ -120,18 +148,11 @@ class StateService:
         self._ping_ms = None  # Network round-trip time in milliseconds
         self._max_temperature = None  # Maximum temperature from all sensors (°C)
 
-        # Gamepad settings
-        self._gamepad_settings = {
-            'deadzone_left_stick': 0.15,
-            'deadzone_right_stick': 0.15,
-            'sensitivity_linear': 1.0,
-            'sensitivity_strafe': 1.0,
-            'sensitivity_rotation': 1.0,
-            'max_linear_velocity': 0.6,
-            'max_strafe_velocity': 0.4,
-            'max_rotation_velocity': 0.8,
-            'speed_multiplier': 1.0
-        }
+        # Gamepad settings: immutable snapshot replaced on every update.
+        # Reads are lock-free; _settings_lock only serializes writers so two
+        # concurrent read-modify-write updates can't drop each other's keys.
+        self._gamepad_settings = GamepadSettings()
+        self._settings_lock = threading.Lock()
         
         # Last sent velocities for zero-velocity detection
         self._last_sent_velocities = {'vx': 0.0, 'vy': 0.0, 'vyaw': 0.0}
@@ -181,60 +202,79 @@ class StateService:
     
     # ========== Video State ==========
     
-    @property
-    def frame_queue(self) -> Queue:
-        """Get video frame queue."""
-        return self._frame_queue
-    
     @property
     def latest_frame(self):
-        """Get latest video frame (thread-safe)."""
-        with self._frame_lock:
-            return self._latest_frame
+        """
+        Get latest video frame (thread-safe).
+
+        No lock: rebinding a reference is atomic under the GIL and frames are
+        never mutated in place after publishing, so readers always see a
+        whole frame.
+        """
+        return self._latest_frame
     
     @latest_frame.setter
     def latest_frame(self, value):
-        """Set latest video frame (thread-safe)."""
-        with self._frame_lock:
+        """Publish a new latest video frame and wake waiting consumers (thread-safe)."""
+        with self._frame_cond:
             self._latest_frame = value
+            self._frame_seq += 1
+            self._frame_cond.notify_all()
+
+    @property
+    def frame_seq(self) -> int:
+        """Get sequence number of the latest published frame."""
+        return self._frame_seq
+
+    def wait_for_frame(self, last_seq: Optional[int], timeout: float) -> Tuple[Any, int]:
+        """
+        Wait until a frame newer than last_seq is published (thread-safe).
+
+        Args:
+            last_seq: Sequence number of the frame the caller already has,
+                or None to return the current frame immediately
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            (frame, seq) tuple; seq equals last_seq if nothing new arrived
+            within timeout. frame may be None if no video is available.
+        """
+        with self._frame_cond:
+            if self._frame_seq == last_seq:
+                self._frame_cond.wait(timeout)
+            return self._latest_frame, self._frame_seq
 
     # ========== Audio State ==========
 
     @property
     def audio_streaming_enabled(self) -> bool:
         """Get audio streaming enabled state."""
-        with self._audio_lock:
-            return self._audio_streaming_enabled
+        return self._audio_streaming_enabled
 
     @audio_streaming_enabled.setter
     def audio_streaming_enabled(self, value: bool):
         """Set audio streaming enabled state."""
-        with self._audio_lock:
-            self._audio_streaming_enabled = value
+        self._audio_streaming_enabled = value
 
     @property
     def audio_initialized(self) -> bool:
         """Get audio initialized state."""
-        with self._audio_lock:
-            return self._audio_initialized
+        return self._audio_initialized
 
     @audio_initialized.setter
     def audio_initialized(self, value: bool):
         """Set audio initialized state."""
-        with self._audio_lock:
-            self._audio_initialized = value
+        self._audio_initialized = value
 
     @property
     def push_to_talk_active(self) -> bool:
         """Get push-to-talk active state."""
-        with self._audio_lock:
-            return self._push_to_talk_active
+        return self._push_to_talk_active
 
     @push_to_talk_active.setter
     def push_to_talk_active(self, value: bool):
         """Set push-to-talk active state."""
-        with self._audio_lock:
-            self._push_to_talk_active = value
+        self._push_to_talk_active = value
 
     @property
     def microphone_audio_track(self):
@@ -263,14 +303,12 @@ class StateService:
     @property
     def audio_muted(self) -> bool:
         """Get audio muted state."""
-        with self._audio_lock:
-            return self._audio_muted
+        return self._audio_muted
 
     @audio_muted.setter
     def audio_muted(self, value: bool):
         """Set audio muted state."""
-        with self._audio_lock:
-            self._audio_muted = value
+        self._audio_muted = value
 
     @property
     def pyaudio_stream(self):
@@ -284,6 +322,18 @@ class StateService:
         with self._audio_lock:
             self._pyaudio_stream = value
 
+    @property
+    def audio_output(self):
+        """Get AudioOutput playback writer."""
+        with self._audio_lock:
+            return self._audio_output
+
+    @audio_output.setter
+    def audio_output(self, value):
+        """Set AudioOutput playback writer."""
+        with self._audio_lock:
+            self._audio_output = value
+
     @property
     def audio_output_queue(self) -> Queue:
         """Get audio output queue."""
@@ -294,14 +344,12 @@ class StateService:
     @property
     def gamepad_enabled(self) -> bool:
         """Get gamepad enabled state (thread-safe)."""
-        with self._gamepad_lock:
-            return self._gamepad_enabled
+        return self._gamepad_enabled
 
     @gamepad_enabled.setter
     def gamepad_enabled(self, value: bool):
         """Set gamepad enabled state (thread-safe)."""
-        with self._gamepad_lock:
-            self._gamepad_enabled = value
+        self._gamepad_enabled = value
 
     @property
     def last_command_time(self) -> float:
@@ -363,14 +411,12 @@ class StateService:
     @property
     def keyboard_mouse_enabled(self) -> bool:
         """Get keyboard/mouse enabled state (thread-safe)."""
-        with self._keyboard_mouse_lock:
-            return self._keyboard_mouse_enabled
+        return self._keyboard_mouse_enabled
 
     @keyboard_mouse_enabled.setter
     def keyboard_mouse_enabled(self, value: bool):
         """Set keyboard/mouse enabled state (thread-safe)."""
-        with self._keyboard_mouse_lock:
-            self._keyboard_mouse_enabled = value
+        self._keyboard_mouse_enabled = value
 
     # ========== AI Mode State ==========
 
@@ -470,23 +516,30 @@ class StateService:
 
     @property
     def gamepad_settings(self) -> Dict[str, float]:
-        """Get gamepad settings (returns a copy for thread safety)."""
-        return self._gamepad_settings.copy()
+        """Get gamepad settings as a dict (a fresh copy, e.g. for JSON)."""
+        return self._gamepad_settings._asdict()
+
+    @property
+    def gamepad_settings_snapshot(self) -> GamepadSettings:
+        """Get the current immutable gamepad settings (no copy, thread-safe)."""
+        return self._gamepad_settings
 
     def update_gamepad_settings(self, settings: Dict[str, Any]):
-        """Update gamepad settings (thread-safe)."""
-        for key, value in settings.items():
-            if key in self._gamepad_settings:
-                self._gamepad_settings[key] = value
+        """Update gamepad settings (thread-safe, unknown keys are ignored)."""
+        changes = {key: value for key, value in settings.items() if key in GamepadSettings._fields}
+        if changes:
+            with self._settings_lock:
+                self._gamepad_settings = self._gamepad_settings._replace(**changes)
 
     def get_gamepad_setting(self, key: str) -> Optional[float]:
         """Get a specific gamepad setting."""
-        return self._gamepad_settings.get(key)
+        if key in GamepadSettings._fields:
+            return getattr(self._gamepad_settings, key)
+        return None
 
     def set_gamepad_setting(self, key: str, value: float):
         """Set a specific gamepad setting."""
-        if key in self._gamepad_settings:
-            self._gamepad_settings[key] = value
+        self.update_gamepad_settings({key: value})
 
     # ========== Velocity Tracking ==========
 
@@ -528,6 +581,7 @@ class StateService:
             self._pyaudio_instance = None
             self._audio_muted = True
             self._pyaudio_stream = None
+            self._audio_output = None
             # Clear audio queue
             while not self._audio_output_queue.empty():
                 try:
@@ -537,10 +591,8 @@ class StateService:
 
     def reset_control_state(self):
         """Reset all control-related state."""
-        with self._gamepad_lock:
-            self._gamepad_enabled = False
-        with self._keyboard_mouse_lock:
-            self._keyboard_mouse_enabled = False
+        self._gamepad_enabled = False
+        self._keyboard_mouse_enabled = False
         self._emergency_stop_active = False
         self._pose_mode_active = False
         self._last_command_time = 0
@@ -553,14 +605,7 @@ class StateService:
         self.reset_control_state()
 
         # Reset video state
-        with self._frame_lock:
-            self._latest_frame = None
-        # Clear frame queue
-        while not self._frame_queue.empty():
-            try:
-                self._frame_queue.get_nowait()
-            except:
-                break
+        self.latest_frame = None
 
         # Reset AI mode state
         self._speed_level = 0
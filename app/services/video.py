@@ -3,7 +3,7 @@ VideoService - Video frame processing and MJPEG streaming.
 
 This service encapsulates all video-related functionality:
 - Video frame reception from WebRTC
-- Frame queue management
+- Latest-frame handoff to stream consumers
 - JPEG encoding
 - MJPEG stream generation
 
@@ -15,14 +15,183 @@ Thread Safety:
 
 import asyncio
 import logging
+import os
 import time
-from queue import Empty
 from typing import Generator, Optional
 
 import cv2
 import numpy as np
 from aiortc import MediaStreamTrack
 
+# Optional: libjpeg-turbo's SIMD encoder (pip install PyTurboJPEG).
+# Falls back to cv2.imencode when the package or shared library is missing.
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+except ImportError:
+    TurboJPEG = None
+
+# Optional: NVIDIA nvJPEG GPU encoder (pip install pynvjpeg), opt-in only.
+try:
+    from nvjpeg import NvJpeg
+except ImportError:
+    NvJpeg = None
+
+# JPEG encoder backend for the MJPEG stream:
+#   auto      - TurboJPEG if installed, otherwise OpenCV (default)
+#   cpu       - OpenCV (cv2.imencode)
+#   turbojpeg - TurboJPEG, falling back to OpenCV if unavailable
+#   nvjpeg    - nvJPEG on the GPU, falling back to OpenCV if unavailable
+# Any other value is logged and treated as auto.
+_JPEG_ENCODERS = ('auto', 'cpu', 'turbojpeg', 'nvjpeg')
+
+
+def _parse_jpeg_encoder(value: Optional[str]) -> str:
+    """Parse a JPEG_ENCODER setting; unknown values are logged and treated as auto."""
+    encoder = (value or 'auto').lower()
+    if encoder not in _JPEG_ENCODERS:
+        logging.getLogger(__name__).warning("Unknown JPEG_ENCODER %r (expected one of %s), using auto",
+                                            value, ", ".join(_JPEG_ENCODERS))
+        return 'auto'
+    return encoder
+
+
+JPEG_ENCODER = _parse_jpeg_encoder(os.getenv('JPEG_ENCODER'))
+
+_DEFAULT_MJPEG_QUALITY = 85
+
+
+def _parse_jpeg_quality(value: Optional[str]) -> int:
+    """
+    Parse a JPEG quality setting, clamped to 1-100.
+
+    A missing or malformed value falls back to the default with a warning
+    instead of failing at import.
+    """
+    if value is None:
+        return _DEFAULT_MJPEG_QUALITY
+    try:
+        quality = int(value)
+    except ValueError:
+        logging.getLogger(__name__).warning("Invalid MJPEG_QUALITY %r, using %d",
+                                            value, _DEFAULT_MJPEG_QUALITY)
+        return _DEFAULT_MJPEG_QUALITY
+    return min(max(quality, 1), 100)
+
+
+# MJPEG quality (1-100); ~40 is a good choice for low-bandwidth operator consoles
+MJPEG_QUALITY = _parse_jpeg_quality(os.getenv('MJPEG_QUALITY'))
+
+
+def _load_turbojpeg(requested: bool = False):
+    """
+    Create a TurboJPEG encoder, or return None if libjpeg-turbo is unavailable.
+
+    Args:
+        requested: True when JPEG_ENCODER=turbojpeg asked for it explicitly,
+            so failing to load it is a warning rather than a quiet fallback
+    """
+    logger = logging.getLogger(__name__)
+    if TurboJPEG is None:
+        if requested:
+            logger.warning("JPEG_ENCODER=turbojpeg but PyTurboJPEG is not installed, using OpenCV encoder")
+        return None
+    try:
+        return TurboJPEG()
+    except (OSError, RuntimeError) as e:
+        log = logger.warning if requested else logger.info
+        log("TurboJPEG unavailable, using OpenCV encoder: %s", e)
+        return None
+
+
+def _load_nvjpeg():
+    """Create an nvJPEG encoder, or return None if no CUDA device/library is available."""
+    if NvJpeg is None:
+        logging.getLogger(__name__).warning("JPEG_ENCODER=nvjpeg but pynvjpeg is not installed, using OpenCV encoder")
+        return None
+    try:
+        return NvJpeg()
+    except (OSError, RuntimeError) as e:
+        logging.getLogger(__name__).warning("nvJPEG unavailable, using OpenCV encoder: %s", e)
+        return None
+
+
+# Placeholder shown while no video is arriving. Its content never changes,
+# so it is rendered and JPEG-encoded once at import instead of per stream tick.
+_BLANK_FRAME_SIZE = (640, 480)  # Width x Height
+_BLANK_JPEG_QUALITY = MJPEG_QUALITY
+
+
+def _render_blank_frame(size=_BLANK_FRAME_SIZE) -> np.ndarray:
+    """Render a black frame with the "Waiting for video..." message."""
+    blank_frame = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+    cv2.putText(
+        blank_frame,
+        "Waiting for video...",
+        (150, 240),
+        cv2.FONT_HERSHEY_SIMPLEX,
+        1,
+        (255, 255, 255),
+        2
+    )
+    return blank_frame
+
+
+_, _blank_buffer = cv2.imencode(
+    '.jpg', _render_blank_frame(), [cv2.IMWRITE_JPEG_QUALITY, _BLANK_JPEG_QUALITY]
+)
+_BLANK_JPEG_BYTES = _blank_buffer.tobytes()
+del _blank_buffer
+
+
+# multipart/x-mixed-replace framing around each JPEG (boundary=frame)
+_MJPEG_HEADER = b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+_MJPEG_TAIL = b'\r\n'
+
+
+# Same framing for the uncompressed stream (see VideoService.generate_frames(raw=True))
+_PPM_PART_HEADER = b'--frame\r\nContent-Type: image/x-portable-pixmap\r\n\r\n'
+
+
+def _mjpeg_part(jpeg) -> bytes:
+    """Wrap a JPEG (any bytes-like object) in one multipart part, copying it only once."""
+    return b''.join((_MJPEG_HEADER, jpeg, _MJPEG_TAIL))
+
+
+def _downscale(frame: np.ndarray, width: Optional[int], out: Optional[np.ndarray]) -> np.ndarray:
+    """
+    Shrink frame to the given width (keeping aspect ratio) into a reusable buffer.
+    
+    Args:
+        frame: NumPy array (BGR format)
+        width: Target width in pixels; None or >= the frame width leaves it as is
+        out: Buffer from the previous call, reused when the output size matches
+    
+    Returns:
+        The resized frame (a buffer the caller may pass back as out), or frame itself
+    """
+    height, frame_width = frame.shape[:2]
+    if not width or width >= frame_width:
+        return frame
+    target = (width, max(1, round(height * width / frame_width)))
+    if out is None or out.shape[1::-1] != target:
+        out = np.empty((target[1], target[0], 3), dtype=np.uint8)
+    # INTER_AREA averages source pixels, so downscaled text/edges don't alias
+    return cv2.resize(frame, target, dst=out, interpolation=cv2.INTER_AREA)
+
+
+def _ppm_part(frame: np.ndarray) -> bytes:
+    """
+    Wrap a BGR frame as a binary PPM (P6) multipart part.
+    
+    No compression at all: the only work is the BGR->RGB channel swap, so this
+    is far cheaper in CPU than JPEG but 5-10x larger on the wire.
+    """
+    height, width = frame.shape[:2]
+    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    return b''.join((
+        _PPM_PART_HEADER, b'P6\n%d %d\n255\n' % (width, height), rgb.data, _MJPEG_TAIL
+    ))
+
 
 class VideoService:
     """
@@ -30,7 +199,7 @@ class VideoService:
     
     This service handles:
     - Receiving video frames from WebRTC track
-    - Managing frame queue and latest frame
+    - Publishing the latest frame
     - Encoding frames as JPEG
     - Generating MJPEG stream for HTTP response
     
@@ -59,20 +228,35 @@ class VideoService:
         self.logger = logging.getLogger(__name__)
         
         # JPEG encoding quality (0-100, higher is better quality)
-        self.jpeg_quality = 85
+        self.jpeg_quality = MJPEG_QUALITY
+        
+        # Optional accelerated encoders, selected by JPEG_ENCODER; None means
+        # that backend is off. OpenCV is used when both are None.
+        self.nvjpeg = _load_nvjpeg() if JPEG_ENCODER == 'nvjpeg' else None
+        self.turbo_jpeg = (_load_turbojpeg(requested=JPEG_ENCODER == 'turbojpeg')
+                           if JPEG_ENCODER in ('auto', 'turbojpeg') else None)
         
         # Blank frame settings
         self.blank_frame_timeout = 2.0  # Show "waiting" message after 2 seconds
-        self.blank_frame_size = (640, 480)  # Width x Height
+        self.blank_frame_interval = 0.5  # Resend it at 2 Hz; it never changes
+        self.blank_frame_size = _BLANK_FRAME_SIZE
         
         # Frame generation settings
-        self.frame_timeout = 0.1  # Queue get timeout in seconds
+        # Upper bound on one wait for a new frame, in seconds. Streams otherwise
+        # sleep until a frame is published or the blank frame is due, so idle
+        # viewers don't poll.
+        self.frame_timeout = 1.0
+
+        # Latest encoded part per output format ((raw, width) -> (seq, part)).
+        # Every viewer is woken for the same frame, so only the first one to
+        # reach it encodes; the others reuse the bytes.
+        self._part_cache = {}
         self.target_fps = 30  # Target frames per second
         self.frame_interval = 1.0 / self.target_fps  # ~0.033 seconds
     
     async def recv_camera_stream(self, track: MediaStreamTrack):
         """
-        Receive video frames from the robot and put them in the queue.
+        Receive video frames from the robot and publish them as the latest frame.
         
         This async callback is triggered when video frames are received from WebRTC.
         It runs in the asyncio event loop.
@@ -89,25 +273,18 @@ class VideoService:
                 
                 frame_count += 1
                 
-                # Update the latest frame (property handles locking internally)
-                self.state.latest_frame = img.copy()
-                
-                # Also add to queue for buffering
-                if self.state.frame_queue.full():
-                    # Remove old frame if queue is full
-                    try:
-                        self.state.frame_queue.get_nowait()
-                    except Empty:
-                        pass
+                # Hand the decoded buffer over without copying: the decoder
+                # allocates a fresh array per frame and we never touch it again.
+                # Mark it read-only so an accidental in-place edit by a consumer
+                # raises instead of corrupting the shared frame.
+                img.flags.writeable = False
                 
-                self.state.frame_queue.put(img)
+                # Publish as the latest frame (wakes waiting stream consumers)
+                self.state.latest_frame = img
                 
                 # Log every 30 frames
                 if frame_count % 30 == 0:
-                    self.logger.info(
-                        f"Received {frame_count} video frames, "
-                        f"queue size: {self.state.frame_queue.qsize()}"
-                    )
+                    self.logger.info(f"Received {frame_count} video frames")
             
             except Exception as e:
                 # During disconnect, track.recv() will raise MediaStreamError or similar
@@ -121,25 +298,50 @@ class VideoService:
                     self.logger.debug(f"Video stream closed (expected during disconnect): {e}")
                 break
     
-    def _encode_jpeg(self, frame: np.ndarray, quality: Optional[int] = None) -> Optional[bytes]:
+    def _encode_jpeg_buffer(self, frame: np.ndarray, quality: Optional[int] = None):
         """
-        Encode frame as JPEG.
+        Encode frame as JPEG without copying the encoder's output.
         
         Args:
             frame: NumPy array (BGR format)
             quality: JPEG quality (0-100), uses self.jpeg_quality if None
         
         Returns:
-            JPEG bytes or None if encoding failed
+            Bytes-like JPEG (bytes or memoryview) or None if encoding failed
         """
         if quality is None:
             quality = self.jpeg_quality
         
+        # Baseline (non-optimized Huffman) JPEGs on every path: optimizing the
+        # tables costs a second pass per frame, which a live stream can't afford
+        if self.nvjpeg is not None:
+            # nvJPEG takes the BGR ndarray as-is, like cv2.imencode
+            return self.nvjpeg.encode(frame, quality)
+        
+        if self.turbo_jpeg is not None:
+            return self.turbo_jpeg.encode(frame, quality=quality, pixel_format=TJPF_BGR)
+        
         ret, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
         if ret:
-            return buffer.tobytes()
+            return memoryview(buffer)
         return None
     
+    def _encode_jpeg(self, frame: np.ndarray, quality: Optional[int] = None) -> Optional[bytes]:
+        """
+        Encode frame as JPEG.
+        
+        Args:
+            frame: NumPy array (BGR format)
+            quality: JPEG quality (0-100), uses self.jpeg_quality if None
+        
+        Returns:
+            JPEG bytes or None if encoding failed
+        """
+        jpeg = self._encode_jpeg_buffer(frame, quality)
+        if jpeg is None:
+            return None
+        return bytes(jpeg)
+    
     def _create_blank_frame(self) -> np.ndarray:
         """
         Create a blank frame with "Waiting for video..." message.
@@ -147,66 +349,112 @@ class VideoService:
         Returns:
             NumPy array (BGR format)
         """
-        blank_frame = np.zeros((self.blank_frame_size[1], self.blank_frame_size[0], 3), dtype=np.uint8)
-        cv2.putText(
-            blank_frame,
-            "Waiting for video...",
-            (150, 240),
-            cv2.FONT_HERSHEY_SIMPLEX,
-            1,
-            (255, 255, 255),
-            2
-        )
-        return blank_frame
-
-    def generate_frames(self) -> Generator[bytes, None, None]:
+        return _render_blank_frame(self.blank_frame_size)
+
+    def _blank_jpeg(self) -> Optional[bytes]:
+        """
+        JPEG bytes for the "Waiting for video..." frame.
+        
+        Uses the copy encoded at import unless the blank frame size or JPEG
+        quality has been changed on this instance.
+        
+        Returns:
+            JPEG bytes or None if encoding failed
+        """
+        if (self.blank_frame_size == _BLANK_FRAME_SIZE
+                and self.jpeg_quality == _BLANK_JPEG_QUALITY):
+            return _BLANK_JPEG_BYTES
+        return self._encode_jpeg(self._create_blank_frame())
+
+    def generate_frames(self, raw: bool = False, width: Optional[int] = None) -> Generator[bytes, None, None]:
         """
         Generate frames for MJPEG streaming.
 
         This generator function yields JPEG frames in MJPEG format for HTTP streaming.
         It runs in the Flask thread (not the asyncio event loop).
 
+        Args:
+            raw: Send uncompressed PPM images instead of JPEG. Skips encoding
+                entirely at the cost of bandwidth; meant for LAN clients.
+            width: Downscale frames to this width (aspect ratio kept) before
+                encoding. Encode time and bytes on the wire scale with pixel count.
+
         Yields:
             bytes: MJPEG frame data (multipart/x-mixed-replace format)
         """
         last_frame_time = time.time()
-        blank_frame = None
+        last_seq = None
+        blank_part = None
+        last_blank_time = 0.0
+        resize_buffer = None  # Reused across frames; parts are copied before yielding
+        frame_to_send = None
 
         while True:
             try:
-                frame_to_send = None
-
-                # Try to get frame from queue with timeout
-                try:
-                    frame_to_send = self.state.frame_queue.get(timeout=self.frame_timeout)
-                except Empty:
-                    # If queue is empty, use the latest frame we have (property handles locking)
-                    if self.state.latest_frame is not None:
-                        frame_to_send = self.state.latest_frame.copy()
+                # Block until a frame newer than the last one sent is published
+                # (read-only, only encoded); stale frames are never re-sent.
+                # Without a frame, wake up early when the blank frame is due;
+                # a stalled stream (frame kept, no new seq) waits the full timeout.
+                timeout = self.frame_timeout
+                if frame_to_send is None:
+                    next_blank_time = max(last_frame_time + self.blank_frame_timeout,
+                                          last_blank_time + self.blank_frame_interval)
+                    timeout = min(timeout, max(0.0, next_blank_time - time.time()))
+                frame_to_send, seq = self.state.wait_for_frame(last_seq, timeout)
+                is_new = seq != last_seq
+                last_seq = seq
 
                 if frame_to_send is not None:
+                    if not is_new:
+                        # Stream stalled: the client keeps showing the last frame
+                        continue
+
                     # We have a valid frame to send
                     last_frame_time = time.time()
 
-                    # Encode frame as JPEG
-                    frame_bytes = self._encode_jpeg(frame_to_send)
-                    if frame_bytes:
-                        yield (b'--frame\r\n'
-                               b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
-                else:
-                    # Only show "waiting" message if we haven't received frames for a while
-                    if time.time() - last_frame_time > self.blank_frame_timeout:
-                        # Create blank frame only once
-                        if blank_frame is None:
-                            blank_frame = self._create_blank_frame()
-
-                        frame_bytes = self._encode_jpeg(blank_frame)
-                        if frame_bytes:
-                            yield (b'--frame\r\n'
-                                   b'Content-Type: image/jpeg\r\n\r\n' + frame_bytes + b'\r\n')
+                    cache_key = (raw, width)
+                    cached = self._part_cache.get(cache_key)
+                    if cached is not None and cached[0] == seq:
+                        # Another viewer already encoded this frame
+                        yield cached[1]
+                        continue
+
+                    if width:
+                        resized = _downscale(frame_to_send, width, resize_buffer)
+                        if resized is not frame_to_send:
+                            resize_buffer = frame_to_send = resized
+
+                    if raw:
+                        part = _ppm_part(frame_to_send)
                     else:
-                        # Just wait a bit and try again
-                        time.sleep(self.frame_interval)
+                        # Encode frame as JPEG; the only copy happens when framing the part
+                        frame_bytes = self._encode_jpeg_buffer(frame_to_send)
+                        part = _mjpeg_part(frame_bytes) if frame_bytes else None
+
+                    if part:
+                        if cache_key not in self._part_cache and len(self._part_cache) >= 8:
+                            # ?w= is client-chosen; don't keep a slot per distinct width
+                            self._part_cache.clear()
+                        self._part_cache[cache_key] = (seq, part)
+                        yield part
+                else:
+                    # Only show "waiting" message if we haven't received frames for a while.
+                    # Keep waiting on the frame condition in between resends, so
+                    # video resumes as soon as a frame arrives.
+                    now = time.time()
+                    if (now - last_frame_time >= self.blank_frame_timeout
+                            and now - last_blank_time >= self.blank_frame_interval):
+                        last_blank_time = now
+                        # Blank frame is constant, so no per-tick rendering or encoding
+                        if blank_part is None:
+                            if raw:
+                                blank_part = _ppm_part(self._create_blank_frame())
+                            else:
+                                blank_bytes = self._blank_jpeg()
+                                blank_part = _mjpeg_part(blank_bytes) if blank_bytes else b''
+
+                        if blank_part:
+                            yield blank_part
 
             except Exception as e:
                 self.logger.error(f"Error generating frame: {e}")
@@ -11,7 +11,7 @@ import asyncio
 import logging
 import threading
 import time
-from queue import Queue
+from collections import deque
 from unitree_webrtc_connect.webrtc_driver import UnitreeWebRTCConnection, WebRTCConnectionMethod
 from aiortc import MediaStreamTrack
 
@@ -19,7 +19,9 @@ from aiortc import MediaStreamTrack
 logging.basicConfig(level=logging.FATAL)
 
 def main():
-    frame_queue = Queue()
+    # Latest-only handoff: appending evicts the unshown frame, so a slow
+    # display never falls behind the stream (append/popleft need no lock)
+    frame_queue = deque(maxlen=1)
 
     # Choose a connection method (uncomment the correct one)
     conn = UnitreeWebRTCConnection(WebRTCConnectionMethod.LocalSTA, ip="192.168.8.181")
@@ -27,13 +29,13 @@ def main():
     # conn = UnitreeWebRTCConnection(WebRTCConnectionMethod.Remote, serialNumber="B42D2000XXXXXXXX", username="email@gmail.com", password="pass")
     # conn = UnitreeWebRTCConnection(WebRTCConnectionMethod.LocalAP)
 
-    # Async function to receive video frames and put them in the queue
+    # Async function to receive video frames and hand them to the display loop
     async def recv_camera_stream(track: MediaStreamTrack):
         while True:
             frame = await track.recv()
             # Convert the frame to a NumPy array
             img = frame.to_ndarray(format="bgr24")
-            frame_queue.put(img)
+            frame_queue.append(img)
 
     def run_asyncio_loop(loop):
         asyncio.set_event_loop(loop)
@@ -63,8 +65,12 @@ def main():
 
     try:
         while True:
-            if not frame_queue.empty():
-                img = frame_queue.get()
+            try:
+                img = frame_queue.popleft()
+            except IndexError:
+                img = None
+
+            if img is not None:
                 print(f"Shape: {img.shape}, Dimensions: {img.ndim}, Type: {img.dtype}, Size: {img.size}")
                 # Display the frame
                 cv2.imshow('Video', img)
@@ -3,7 +3,7 @@
 Double-Locking Anti-Pattern Detector
 
 This script scans Python files for the dangerous double-locking pattern where
-external code uses explicit locks (e.g., `with state._frame_lock:`) before
+external code uses explicit locks (e.g., `with state._audio_lock:`) before
 accessing StateService properties that already use internal locking.
 
 This pattern causes deadlocks that freeze the entire application.
@@ -44,9 +44,9 @@ def check_file(filepath: Path) -> List[Tuple[int, str]]:
         print(f"⚠️  Warning: Could not read {filepath}: {e}", file=sys.stderr)
         return issues
     
-    # Pattern to detect: with state._<something>_lock:
-    # This is almost always wrong when used outside StateService class
-    lock_pattern = re.compile(r'with\s+state\._\w+_lock:')
+    # Pattern to detect: with state._<something>_lock: (or the frame Condition,
+    # state._frame_cond). This is almost always wrong outside StateService
+    lock_pattern = re.compile(r'with\s+state\._\w+_(?:lock|cond):')
     
     for i, line in enumerate(lines, 1):
         if lock_pattern.search(line):
@@ -86,10 +86,11 @@ def main():
     if args.all:
         project_root = Path(__file__).parent.parent
         files_to_check = list(project_root.glob('**/*.py'))
-        # Exclude test files and virtual environments
+        # Exclude test files, virtual environments and this script's own examples
+        this_script = Path(__file__).resolve()
         files_to_check = [
             f for f in files_to_check
-            if 'test' not in f.parts and 'venv' not in f.parts and '.venv' not in f.parts
+            if not {'test', 'tests', 'venv', '.venv'} & set(f.parts) and f.resolve() != this_script
         ]
     elif args.files:
         files_to_check = [Path(f) for f in args.files]
@@ -131,8 +132,8 @@ def main():
         print(f"\n❌ Found {total_issues} potential double-locking issue(s) in {len(all_issues)} file(s)!")
         print()
         print("Fix by removing the 'with state._lock:' wrapper:")
-        print("  ❌ WRONG: with state._frame_lock: state.latest_frame = img")
-        print("  ✅ RIGHT: state.latest_frame = img")
+        print("  ❌ WRONG: with state._audio_lock: state.pyaudio_stream = stream")
+        print("  ✅ RIGHT: state.pyaudio_stream = stream")
         print()
         print("See .agent-os/standards/best-practices.md for details.")
         
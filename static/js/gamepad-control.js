@@ -274,6 +274,12 @@ class GamepadControl {
         if (pressed && !wasPressed) {
             console.log('Button pressed:', action);
 
+            // Prefer the open WebSocket; HTTP is the fallback
+            if (typeof websocketClient !== 'undefined' && websocketClient.sendAction(action)) {
+                this.lastButtonStates[buttonIndex] = pressed;
+                return;
+            }
+
             try {
                 const response = await fetch('/api/control/action', {
                     method: 'POST',
@@ -305,6 +311,11 @@ class GamepadControl {
 
         // Send camera control if triggers are pressed
         if (Math.abs(camera_yaw) > 0.1) {
+            // Prefer the open WebSocket; HTTP is the fallback
+            if (typeof websocketClient !== 'undefined' && websocketClient.sendCamera(camera_yaw)) {
+                return;
+            }
+
             try {
                 await fetch('/api/control/camera', {
                     method: 'POST',
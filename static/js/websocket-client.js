@@ -89,9 +89,59 @@ class WebSocketClient {
         // Uncomment for debugging control flow/latency issues
         // console.log('[WebSocket] Emitting control_command:', commandData);
 
-        // Emit command
-        this.socket.emit('control_command', commandData);
+        // Emit command. Gamepad commands are only four stick axes, so they go
+        // out as a 16-byte binary attachment (little-endian float32 lx, ly, rx, ry)
+        if (commandData.source === 'gamepad') {
+            this.socket.emit('gamepad_axes', this.packGamepadAxes(commandData));
+        } else {
+            this.socket.emit('control_command', commandData);
+        }
+
+        return true;
+    }
+
+    /**
+     * Pack gamepad axes for the binary 'gamepad_axes' event
+     * @param {Object} commandData - Command data {lx, ly, rx, ry}
+     * @returns {ArrayBuffer} - 16 bytes: lx, ly, rx, ry as little-endian float32
+     */
+    packGamepadAxes(commandData) {
+        const buffer = new ArrayBuffer(16);
+        const view = new DataView(buffer);
+        view.setFloat32(0, commandData.lx, true);
+        view.setFloat32(4, commandData.ly, true);
+        view.setFloat32(8, commandData.rx, true);
+        view.setFloat32(12, commandData.ry, true);
+        return buffer;
+    }
 
+    /**
+     * Send a robot action (button press) via WebSocket
+     * @param {string} action - Action name, as for POST /api/control/action
+     * @returns {boolean} - False if not connected (caller should fall back to HTTP)
+     */
+    sendAction(action) {
+        if (!this.connected) {
+            return false;
+        }
+        this.socket.emit('control_action', { action }, (result) => {
+            if (result && result.status === 'error') {
+                console.error('Action failed:', action, result.message);
+            }
+        });
+        return true;
+    }
+
+    /**
+     * Send camera yaw (trigger sample) via WebSocket
+     * @param {number} yaw - Camera yaw, as for POST /api/control/camera
+     * @returns {boolean} - False if not connected (caller should fall back to HTTP)
+     */
+    sendCamera(yaw) {
+        if (!this.connected) {
+            return false;
+        }
+        this.socket.emit('control_camera', { yaw });
         return true;
     }
 
@@ -6,11 +6,30 @@ This module provides common fixtures used across unit, integration, and E2E test
 
 import asyncio
 import pytest
-from unittest.mock import Mock, MagicMock, AsyncMock
-from queue import Queue
+from unittest.mock import Mock, MagicMock, AsyncMock, create_autospec
+from types import MappingProxyType, SimpleNamespace
 import threading
 
 
+# ============================================================================
+# Collection Hooks
+# ============================================================================
+
+# Test classes whose class-scoped fixtures should be built once, on one worker
+_XDIST_GROUPS = {
+    'TestMovementCommandFlow': 'control_flow',
+}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Keep tests sharing class-scoped services on the same xdist worker."""
+    for item in items:
+        cls = getattr(item, 'cls', None)
+        group = _XDIST_GROUPS.get(cls.__name__) if cls else None
+        if group:
+            item.add_marker(pytest.mark.xdist_group(group))
+
+
 # ============================================================================
 # Asyncio Event Loop Fixtures
 # ============================================================================
@@ -35,18 +54,137 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope="session")
+def bg_loop():
+    """
+    Event loop running in a background thread for the whole session.
+
+    Mirrors ConnectionService.ensure_event_loop() without paying loop/thread
+    startup in every test. Readiness is signalled from inside the loop, so no
+    sleep is needed before use.
+    """
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    def _run():
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+    ready.wait()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=1)
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def running_event_loop():
+    """Stand-in for StateService.event_loop that reports itself as running."""
+    loop = Mock()
+    loop.is_running.return_value = True
+    return loop
+
+
+@pytest.fixture(scope="session")
+def stopped_event_loop():
+    """Stand-in for StateService.event_loop that reports itself as stopped."""
+    loop = Mock()
+    loop.is_running.return_value = False
+    return loop
+
+
+# ============================================================================
+# Application Service Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def services():
+    """
+    The app.services package, imported once per session (per xdist worker).
+
+    Deferring the import to fixture time keeps the SDK imports out of test
+    collection.
+    """
+    from app import services as _services
+    return _services
+
+
+# ============================================================================
+# Reusable Mock Fixtures
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def _shared_mock():
+    """Single Mock instance shared across the session (use fresh_mock)."""
+    return Mock()
+
+
+@pytest.fixture(scope="session")
+def _shared_async_mock():
+    """Single AsyncMock instance shared across the session (use fresh_async_mock)."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def fresh_mock(_shared_mock):
+    """
+    Blank Mock for a single test.
+
+    The underlying Mock is built once per session and reset (calls, return
+    values and side effects, including child mocks) after each test, so tests
+    don't pay the Mock construction cost every time.
+    """
+    yield _shared_mock
+    _shared_mock.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def fresh_async_mock(_shared_async_mock):
+    """Blank AsyncMock for a single test (see fresh_mock)."""
+    yield _shared_async_mock
+    _shared_async_mock.reset_mock(return_value=True, side_effect=True)
+
+
 # ============================================================================
 # Mock WebRTC Connection Fixtures
 # ============================================================================
 
+class _WebRTCConnectionSpec:
+    """
+    Interface of UnitreeWebRTCConnection as used by the app and tests.
+
+    Spec'ing against this instead of the SDK class keeps aiortc/sounddevice
+    out of collection while still rejecting misspelled attributes.
+    """
+    datachannel = None
+    isConnected = False
+
+    async def connect(self): ...
+    async def disconnect(self): ...
+    async def reconnect(self): ...
+    def is_connected(self): ...
+    async def send_command(self, *args, **kwargs): ...
+
+
+@pytest.fixture(scope="session")
+def _webrtc_connection_template():
+    """Autospecced connection built once per session (use mock_webrtc_connection)."""
+    return create_autospec(_WebRTCConnectionSpec, spec_set=True, instance=True)
+
+
 @pytest.fixture
-def mock_webrtc_connection():
+def mock_webrtc_connection(_webrtc_connection_template):
     """Mock WebRTC connection object."""
-    connection = AsyncMock()
-    connection.connect = AsyncMock(return_value=True)
-    connection.disconnect = AsyncMock(return_value=True)
-    connection.is_connected = Mock(return_value=True)
-    connection.send_command = AsyncMock(return_value=True)
+    connection = _webrtc_connection_template
+    connection.reset_mock(return_value=True, side_effect=True)
+    connection.connect.return_value = True
+    connection.disconnect.return_value = True
+    connection.is_connected.return_value = True
+    connection.send_command.return_value = True
+    connection.datachannel = None
     return connection
 
 
@@ -103,16 +241,29 @@ def mock_pyaudio():
     return pyaudio_mock
 
 
-# ============================================================================
-# Frame Queue Fixtures
-# ============================================================================
-
 @pytest.fixture
-def frame_queue():
-    """Create a frame queue for testing."""
-    return Queue(maxsize=30)
+def mock_pyaudio_fast():
+    """
+    Lightweight PyAudio stand-in without call tracking.
+
+    Plain SimpleNamespace attribute access is far cheaper than Mock's
+    __getattr__ machinery. Use mock_pyaudio when a test asserts on calls.
+    """
+    def _open(**kwargs):
+        return SimpleNamespace(
+            write=lambda data: None,
+            read=lambda num_frames, **kwargs: b'\x00' * num_frames * 4,
+            stop_stream=lambda: None,
+            close=lambda: None,
+        )
+
+    return SimpleNamespace(open=_open, terminate=lambda: None)
 
 
+# ============================================================================
+# Frame Fixtures
+# ============================================================================
+
 @pytest.fixture
 def frame_lock():
     """Create a threading lock for frame access."""
@@ -162,10 +313,15 @@ def mock_socketio_client(mock_flask_app, mock_socketio):
 # Gamepad Settings Fixtures
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_gamepad_settings():
-    """Default gamepad settings for testing."""
-    return {
+    """
+    Default gamepad settings for testing.
+
+    Built once per session and returned read-only; tests that modify settings
+    take a working copy with dict(default_gamepad_settings).
+    """
+    return MappingProxyType({
         'deadzone_left_stick': 0.15,
         'deadzone_right_stick': 0.15,
         'sensitivity_linear': 1.0,
@@ -175,7 +331,7 @@ def default_gamepad_settings():
         'max_strafe_velocity': 0.4,
         'max_rotation_velocity': 0.8,
         'speed_multiplier': 1.0
-    }
+    })
 
 
 # ============================================================================
@@ -10,7 +10,6 @@ import asyncio
 import threading
 import time
 import numpy as np
-from queue import Queue
 from app.services import StateService
 
 
@@ -45,37 +44,34 @@ class TestStateWorkflow:
         assert state.event_loop is None
     
     def test_video_streaming_workflow(self):
-        """Test video streaming workflow with frame buffering."""
+        """Test video streaming workflow with latest-frame handoff."""
         state = StateService()
         
+        # Consumer has seen nothing yet
+        frame, last_seq = state.wait_for_frame(None, timeout=0)
+        assert frame is None
+        
         # Simulate receiving video frames
         for i in range(50):
             frame = np.zeros((480, 640, 3), dtype=np.uint8)
             frame[:, :] = i  # Mark frame with sequence number
             
-            # Update latest frame
+            # Publish latest frame
             state.latest_frame = frame
-            
-            # Add to queue (with overflow handling)
-            if state.frame_queue.full():
-                try:
-                    state.frame_queue.get_nowait()
-                except:
-                    pass
-            state.frame_queue.put(frame)
         
         # Verify state
         assert state.latest_frame is not None
         assert state.latest_frame.shape == (480, 640, 3)
-        assert not state.frame_queue.empty()
         
-        # Simulate frame consumption
-        frames_consumed = 0
-        while not state.frame_queue.empty():
-            frame = state.frame_queue.get()
-            frames_consumed += 1
+        # Consumer skips straight to the newest frame
+        frame, seq = state.wait_for_frame(last_seq, timeout=0.1)
+        assert frame[0, 0, 0] == 49
+        assert seq == last_seq + 50
         
-        assert frames_consumed > 0
+        # Nothing newer: the wait times out and returns the same frame
+        same_frame, same_seq = state.wait_for_frame(seq, timeout=0.01)
+        assert same_frame is frame
+        assert same_seq == seq
     
     def test_audio_streaming_workflow(self):
         """Test audio streaming workflow with mute/unmute."""
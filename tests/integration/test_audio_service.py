@@ -10,11 +10,30 @@ These tests verify that AudioService correctly integrates with:
 
 import pytest
 import asyncio
+import threading
+import tracemalloc
 from unittest.mock import Mock, MagicMock, AsyncMock, patch
+import fractions
 import numpy as np
+from aiortc.codecs.opus import OpusDecoder, OpusEncoder
+from aiortc.jitterbuffer import JitterFrame
+from av import AudioFrame as AVAudioFrame
 
 from app.services.state import StateService
-from app.services.audio import AudioService, MicrophoneAudioTrack
+from app.services.audio import (
+    AudioService, AudioOutput, AudioFrameQueue, MicrophoneAudioTrack, _process_mic
+)
+
+
+def _decoded_opus_frame():
+    """Round-trip 20ms of 48kHz s16 stereo through aiortc's Opus codec, like robot audio."""
+    samples = np.zeros((1, 960 * 2), dtype=np.int16)
+    frame = AVAudioFrame.from_ndarray(samples, format='s16', layout='stereo')
+    frame.sample_rate = 48000
+    frame.pts = 0
+    frame.time_base = fractions.Fraction(1, 48000)
+    payloads, _ = OpusEncoder().encode(frame)
+    return OpusDecoder().decode(JitterFrame(data=payloads[0], timestamp=0))[0]
 
 
 class TestAudioServiceIntegration:
@@ -30,6 +49,7 @@ class TestAudioServiceIntegration:
         assert audio_service.sample_rate == 48000
         assert audio_service.channels == 2
         assert audio_service.frames_per_buffer == 8192
+        assert audio_service.output_slot_bytes == 7680  # 40ms of 48kHz s16 stereo
     
     @pytest.mark.asyncio
     async def test_recv_audio_stream_when_initialized(self):
@@ -38,24 +58,58 @@ class TestAudioServiceIntegration:
         audio_service = AudioService(state)
         
         # Mock PyAudio stream
+        written = threading.Event()
         mock_stream = Mock()
-        mock_stream.write = Mock()
+        mock_stream.write = Mock(side_effect=lambda data: written.set())
         state.pyaudio_stream = mock_stream
         state.audio_initialized = True
         state.audio_muted = False
         
-        # Mock audio frame
-        mock_frame = Mock()
-        test_audio = np.zeros(1024, dtype=np.int16)
-        mock_frame.to_ndarray.return_value = test_audio
+        # Real packed s16 stereo frame, as produced by the Opus decoder
+        samples = np.arange(960 * 2, dtype=np.int16).reshape(1, -1)
+        frame = AVAudioFrame.from_ndarray(samples, format='s16', layout='stereo')
         
-        # Receive audio
-        await audio_service.recv_audio_stream(mock_frame)
+        try:
+            # Receive audio
+            await audio_service.recv_audio_stream(frame)
+            
+            # Writer thread was started for this stream, sized from the audio config
+            assert isinstance(state.audio_output, AudioOutput)
+            assert state.audio_output.stream is mock_stream
+            assert state.audio_output._queue.slot_bytes == audio_service.output_slot_bytes
+            
+            # Verify the plane buffer was written as-is (no to_ndarray() round-trip)
+            assert written.wait(timeout=1.0)
+            mock_stream.write.assert_called_once()
+            assert bytes(mock_stream.write.call_args[0][0]) == samples.tobytes()
+        finally:
+            state.audio_output.stop()
+    
+    @pytest.mark.asyncio
+    async def test_recv_audio_stream_plays_only_decoded_samples(self):
+        """Test a real Opus decoder frame plays its 3840 PCM bytes, not the padded plane."""
+        state = StateService()
+        audio_service = AudioService(state)
         
-        # Verify audio was written (called once via asyncio.to_thread)
-        # Note: We can't easily verify the exact call due to asyncio.to_thread wrapping
-        # But we can verify no exceptions were raised
-        assert True
+        written = threading.Event()
+        mock_stream = Mock()
+        mock_stream.write = Mock(side_effect=lambda data: written.set())
+        state.pyaudio_stream = mock_stream
+        state.audio_initialized = True
+        state.audio_muted = False
+        
+        frame = _decoded_opus_frame()
+        # The decoder's plane has room for a 120ms frame
+        assert len(memoryview(frame.planes[0])) > 3840
+        
+        try:
+            await audio_service.recv_audio_stream(frame)
+            
+            assert written.wait(timeout=1.0)
+            mock_stream.write.assert_called_once()
+            assert len(mock_stream.write.call_args[0][0]) == 3840
+        finally:
+            state.audio_output.stop()
     
     @pytest.mark.asyncio
     async def test_recv_audio_stream_when_muted(self):
@@ -78,8 +132,10 @@ class TestAudioServiceIntegration:
         # Receive audio
         await audio_service.recv_audio_stream(mock_frame)
         
-        # Verify audio was NOT written
+        # Verify audio was NOT written and the frame was never decoded
         mock_stream.write.assert_not_called()
+        mock_frame.to_ndarray.assert_not_called()
+        assert state.audio_output is None
     
     @pytest.mark.asyncio
     async def test_recv_audio_stream_when_not_initialized(self):
@@ -219,6 +275,196 @@ class TestAudioServiceIntegration:
         assert result['transmitting'] is False
 
 
+class TestAudioOutputIntegration:
+    """Integration tests for the AudioOutput playback writer thread."""
+
+    def test_push_writes_on_writer_thread(self):
+        """Test pushed frames are written by the writer thread in order."""
+        written = []
+        done = threading.Event()
+
+        def write(data):
+            written.append((bytes(data), threading.current_thread().name))
+            if len(written) == 3:
+                done.set()
+
+        mock_stream = Mock()
+        mock_stream.write = Mock(side_effect=write)
+
+        output = AudioOutput(mock_stream)
+        output.start()
+        try:
+            for i in range(3):
+                output.push(bytes([i]) * 4)
+
+            assert done.wait(timeout=1.0)
+            assert [data for data, _ in written] == [b'\x00' * 4, b'\x01' * 4, b'\x02' * 4]
+            assert all(name == "AudioOutput" for _, name in written)
+        finally:
+            output.stop()
+
+    def test_push_drops_new_frames_when_full(self):
+        """Test the buffer stays bounded when playback falls behind."""
+        mock_stream = Mock()
+        output = AudioOutput(mock_stream, max_frames=2)
+
+        # Writer not started, so nothing is drained
+        for i in range(5):
+            output.push(bytes([i]))
+
+        assert len(output._queue) == 2
+        assert bytes(output._queue.peek()) == b'\x00'
+
+    def test_push_logs_oversized_frames(self, caplog):
+        """Test frames larger than a slot are counted and logged, not dropped silently."""
+        output = AudioOutput(Mock(), slot_bytes=4)
+
+        with caplog.at_level("WARNING", logger="app.services.audio"):
+            for _ in range(3):
+                output.push(b'12345')
+            output.push(b'1234')
+
+        assert output._queue.oversize_drops == 3
+        assert len(output._queue) == 1
+        warnings = [r for r in caplog.records if "oversized audio frame" in r.getMessage()]
+        assert len(warnings) == 1  # First drop only, not one per frame
+
+    def test_stop_joins_thread_and_clears_buffer(self):
+        """Test stop() terminates the writer thread."""
+        output = AudioOutput(Mock())
+        output.start()
+        thread = output._thread
+
+        output.stop()
+
+        assert not thread.is_alive()
+        assert len(output._queue) == 0
+
+    def test_write_error_does_not_kill_writer(self):
+        """Test a failing write is logged and later frames still play."""
+        done = threading.Event()
+        mock_stream = Mock()
+        calls = []
+
+        def write(data):
+            calls.append(bytes(data))
+            if len(calls) == 1:
+                raise OSError("Stream closed")
+            done.set()
+
+        mock_stream.write = Mock(side_effect=write)
+
+        output = AudioOutput(mock_stream)
+        output.start()
+        try:
+            output.push(b'first')
+            output.push(b'second')
+
+            assert done.wait(timeout=1.0)
+            assert calls == [b'first', b'second']
+        finally:
+            output.stop()
+
+
+class TestAudioFrameQueue:
+    """Tests for the preallocated SPSC audio frame ring."""
+
+    def test_push_peek_advance_fifo(self):
+        """Test frames come out in order and slots are released by advance()."""
+        queue = AudioFrameQueue(n_slots=3, slot_bytes=8)
+
+        assert queue.peek() is None
+        assert queue.push(b'ab') is True
+        assert queue.push(b'cde') is True
+
+        assert bytes(queue.peek()) == b'ab'
+        queue.advance()
+        assert bytes(queue.peek()) == b'cde'
+        queue.advance()
+        assert queue.peek() is None
+        assert len(queue) == 0
+
+    def test_push_rejects_when_full_or_oversized(self):
+        """Test a full ring or oversized frame drops the new frame."""
+        queue = AudioFrameQueue(n_slots=2, slot_bytes=4)
+
+        assert queue.push(b'12345') is False
+        assert queue.push(b'1') is True
+        assert queue.push(b'2') is True
+        assert queue.push(b'3') is False
+
+        # Slot being read is never overwritten
+        assert bytes(queue.peek()) == b'1'
+        assert queue.oversize_drops == 1
+
+    def test_push_accepts_audio_frame_plane(self):
+        """Test the plane of a decoded frame is copied in without conversion."""
+        samples = np.arange(960 * 2, dtype=np.int16).reshape(1, -1)
+        frame = AVAudioFrame.from_ndarray(samples, format='s16', layout='stereo')
+        queue = AudioFrameQueue()
+
+        assert queue.push(frame.planes[0]) is True
+        assert bytes(queue.peek()) == samples.tobytes()
+
+    def test_decoded_opus_frame_fits_output_slot(self):
+        """Test a real decoder frame's samples fit the slot AudioService sizes for playback."""
+        frame = _decoded_opus_frame()
+        nbytes = frame.samples * len(frame.layout.channels) * frame.format.bytes
+        queue = AudioFrameQueue(slot_bytes=AudioService(StateService()).output_slot_bytes)
+
+        assert queue.push(memoryview(frame.planes[0])[:nbytes]) is True
+        assert queue.oversize_drops == 0
+        assert len(queue.peek()) == 3840
+
+    def test_audio_queue_no_allocation(self):
+        """Test steady-state push/pop does not allocate per frame."""
+        queue = AudioFrameQueue(n_slots=10, slot_bytes=3840)
+        frame = np.zeros(1920, dtype=np.int16).tobytes()
+
+        # Warm up so first-use allocations are excluded
+        for _ in range(20):
+            queue.push(frame)
+            queue.peek()
+            queue.advance()
+
+        tracemalloc.start()
+        try:
+            for _ in range(1000):
+                queue.push(frame)
+                queue.peek()
+                queue.advance()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # 1000 frames x 3840 B would be ~3.8 MB if each push allocated a copy
+        assert peak < 3840
+
+
+class TestProcessMic:
+    """Tests for the in-place mono to stereo conversion."""
+
+    def test_process_mic_interleaves_into_buffer(self):
+        """Test mono samples are duplicated into packed stereo in place."""
+        mono = np.array([1, -2, 3, 32767], dtype=np.int16)
+        out = np.zeros((1, 8), dtype=np.int16)
+
+        result = _process_mic(mono, out)
+
+        assert result is None
+        np.testing.assert_array_equal(out, [[1, 1, -2, -2, 3, 3, 32767, 32767]])
+
+    def test_process_mic_matches_column_stack(self):
+        """Test output matches the previous column_stack/flatten conversion."""
+        mono = np.arange(-480, 480, dtype=np.int16)
+        out = np.empty((1, 1920), dtype=np.int16)
+
+        _process_mic(mono, out)
+
+        expected = np.column_stack((mono, mono)).flatten().reshape((1, 1920))
+        np.testing.assert_array_equal(out, expected)
+
+
 class TestMicrophoneAudioTrackIntegration:
     """Integration tests for MicrophoneAudioTrack."""
 
@@ -295,6 +541,11 @@ class TestMicrophoneAudioTrackIntegration:
             assert frame is not None
             assert frame.sample_rate == 48000
 
+            # Scratch buffer is reused for the next frame
+            scratch = track._scratch
+            await track.recv()
+            assert track._scratch is scratch
+
     @pytest.mark.asyncio
     async def test_microphone_track_recv_when_not_transmitting(self):
         """Test recv() generates silence when not transmitting."""
@@ -321,3 +572,11 @@ class TestMicrophoneAudioTrackIntegration:
             assert frame is not None
             assert frame.sample_rate == 48000
 
+            # Silence frame is built from the cached zero bytes
+            assert bytes(frame.planes[0]) == track._silence_bytes
+
+            # Idle frames reuse the cached silence frame, advancing only pts
+            next_frame = await track.recv()
+            assert next_frame is frame
+            assert next_frame.pts == 960
+
@@ -17,7 +17,7 @@ from unittest.mock import Mock, MagicMock, patch, AsyncMock
 import pyaudio
 
 from app.services.state import StateService
-from app.services.connection import ConnectionService
+from app.services.connection import ConnectionService, ConnState, ConnectionBusyError
 
 
 class TestConnectionServiceIntegration:
@@ -51,6 +51,7 @@ class TestConnectionServiceIntegration:
         # Cleanup
         state.event_loop.call_soon_threadsafe(state.event_loop.stop)
         state.loop_thread.join(timeout=2)
+        state.event_loop.close()
     
     def test_ensure_event_loop_reuses_existing_loop(self):
         """Test ensure_event_loop reuses existing running loop."""
@@ -72,7 +73,67 @@ class TestConnectionServiceIntegration:
         # Cleanup
         state.event_loop.call_soon_threadsafe(state.event_loop.stop)
         state.loop_thread.join(timeout=2)
+        state.event_loop.close()
     
+    def test_ensure_event_loop_uses_uvloop_when_available(self, monkeypatch):
+        """Test ensure_event_loop builds the loop with uvloop when it is installed."""
+        from app.services import connection as connection_module
+        fake_uvloop = Mock()
+        fake_uvloop.new_event_loop.side_effect = asyncio.new_event_loop
+        monkeypatch.setattr(connection_module, 'uvloop', fake_uvloop)
+        state = StateService()
+        conn_service = ConnectionService(state)
+
+        conn_service.ensure_event_loop()
+
+        fake_uvloop.new_event_loop.assert_called_once()
+        assert state.event_loop.is_running()
+
+        # Cleanup
+        state.event_loop.call_soon_threadsafe(state.event_loop.stop)
+        state.loop_thread.join(timeout=2)
+        state.event_loop.close()
+
+    def test_native_threading_bypasses_eventlet_patching(self, monkeypatch):
+        """Test the loop thread module is eventlet's unpatched threading when eventlet is installed."""
+        import importlib
+        import sys
+        import types
+        from app.services import native_threading as native_module
+        original_threading = Mock()
+        fake_patcher = types.ModuleType('eventlet.patcher')
+        fake_patcher.original = Mock(return_value=original_threading)
+        fake_eventlet = types.ModuleType('eventlet')
+        fake_eventlet.patcher = fake_patcher
+        monkeypatch.setitem(sys.modules, 'eventlet', fake_eventlet)
+        monkeypatch.setitem(sys.modules, 'eventlet.patcher', fake_patcher)
+
+        try:
+            importlib.reload(native_module)
+            assert native_module.native_threading is original_threading
+            fake_patcher.original.assert_called_once_with('threading')
+        finally:
+            monkeypatch.undo()
+            importlib.reload(native_module)
+
+    def test_ensure_event_loop_runs_on_native_thread(self, monkeypatch):
+        """Test ensure_event_loop starts the loop via native_threading.Thread."""
+        from app.services import connection as connection_module
+        thread_class = Mock(side_effect=threading.Thread)
+        monkeypatch.setattr(connection_module.native_threading, 'Thread', thread_class)
+        state = StateService()
+        conn_service = ConnectionService(state)
+
+        conn_service.ensure_event_loop()
+
+        thread_class.assert_called_once()
+        assert state.event_loop.is_running()
+
+        # Cleanup
+        state.event_loop.call_soon_threadsafe(state.event_loop.stop)
+        state.loop_thread.join(timeout=2)
+        state.event_loop.close()
+
     def test_create_connection_local_ap(self):
         """Test creating LocalAP connection."""
         state = StateService()
@@ -256,6 +317,32 @@ class TestConnectionServiceIntegration:
         assert state.pyaudio_stream is not None
         assert state.microphone_audio_track is not None
 
+    @pytest.mark.asyncio
+    async def test_setup_connection_rejects_second_attempt(self):
+        """Test setup_connection refuses to run while a connection is active."""
+        state = StateService()
+        conn_service = ConnectionService(state)
+        conn_service.conn_state = ConnState.CONNECTED
+
+        mock_conn = Mock()
+        mock_conn.connect = AsyncMock()
+
+        with pytest.raises(ConnectionBusyError, match="already connected"):
+            await conn_service.setup_connection(mock_conn, Mock(), Mock(), Mock(), {})
+
+        mock_conn.connect.assert_not_called()
+        assert conn_service.conn_state is ConnState.CONNECTED
+
+    def test_cleanup_connection_resets_conn_state(self):
+        """Test cleanup_connection allows a fresh connect afterwards."""
+        state = StateService()
+        conn_service = ConnectionService(state)
+        conn_service.conn_state = ConnState.CLOSING
+
+        conn_service.cleanup_connection()
+
+        assert conn_service.conn_state is ConnState.DISCONNECTED
+
     @pytest.mark.asyncio
     async def test_initialize_robot_success(self):
         """Test initialize_robot switches to AI mode and sends FreeWalk."""
@@ -126,9 +126,9 @@ class TestSettingsManagement:
         result = control_service.update_settings(data)
         
         assert result['status'] == 'success'
-        assert state_service.gamepad_settings['deadzone_left_stick'] == 0.2
-        assert state_service.gamepad_settings['sensitivity_linear'] == 1.5
-        assert state_service.gamepad_settings['max_linear_velocity'] == 0.8
+        assert state_service.gamepad_settings['deadzone_left_stick'] == pytest.approx(0.2)
+        assert state_service.gamepad_settings['sensitivity_linear'] == pytest.approx(1.5)
+        assert state_service.gamepad_settings['max_linear_velocity'] == pytest.approx(0.8)
     
     def test_update_settings_with_clamping(self, control_service, state_service):
         """Test that settings are clamped to valid ranges."""
@@ -141,9 +141,9 @@ class TestSettingsManagement:
         result = control_service.update_settings(data)
         
         assert result['status'] == 'success'
-        assert state_service.gamepad_settings['deadzone_left_stick'] == 1.0
-        assert state_service.gamepad_settings['sensitivity_linear'] == 0.1
-        assert state_service.gamepad_settings['max_linear_velocity'] == 1.0
+        assert state_service.gamepad_settings['deadzone_left_stick'] == pytest.approx(1.0)
+        assert state_service.gamepad_settings['sensitivity_linear'] == pytest.approx(0.1)
+        assert state_service.gamepad_settings['max_linear_velocity'] == pytest.approx(1.0)
 
     def test_apply_preset_beginner(self, control_service, state_service):
         """Test applying beginner preset."""
@@ -151,8 +151,8 @@ class TestSettingsManagement:
 
         assert result['status'] == 'success'
         assert result['preset'] == 'beginner'
-        assert state_service.gamepad_settings['deadzone_left_stick'] == 0.15
-        assert state_service.gamepad_settings['speed_multiplier'] == 0.7
+        assert state_service.gamepad_settings['deadzone_left_stick'] == pytest.approx(0.15)
+        assert state_service.gamepad_settings['speed_multiplier'] == pytest.approx(0.7)
 
     def test_apply_preset_sport(self, control_service, state_service):
         """Test applying sport preset."""
@@ -160,8 +160,8 @@ class TestSettingsManagement:
 
         assert result['status'] == 'success'
         assert result['preset'] == 'sport'
-        assert state_service.gamepad_settings['sensitivity_linear'] == 1.5
-        assert state_service.gamepad_settings['speed_multiplier'] == 1.5
+        assert state_service.gamepad_settings['sensitivity_linear'] == pytest.approx(1.5)
+        assert state_service.gamepad_settings['speed_multiplier'] == pytest.approx(1.5)
 
     def test_apply_invalid_preset(self, control_service):
         """Test applying invalid preset."""
@@ -224,7 +224,7 @@ class TestMovementCommandProcessing:
         assert result['status'] == 'success'
         # With 2.0 sensitivity, 1.0 speed_multiplier and 0.5 input, should get 1.0 (clamped to max_linear_velocity=0.6)
         # 0.5 * 2.0 * 1.0 = 1.0, clamped to 0.6
-        assert result['velocities']['vx'] == 0.6
+        assert result['velocities']['vx'] == pytest.approx(0.6)
 
     def test_process_zero_velocity_command(self, control_service, state_service):
         """Test processing zero velocity command."""
@@ -242,6 +242,110 @@ class TestMovementCommandProcessing:
         result2 = control_service.process_movement_command(data)
         assert result2['should_send'] is False
 
+    def test_idle_sticks_skip_pipeline(self, control_service, state_service, monkeypatch):
+        """Test resting sticks skip the velocity math once zero velocity was sent."""
+        from app.services import control as control_module
+        state_service.is_connected = True
+        state_service.gamepad_enabled = True
+        state_service.zero_velocity_sent = True
+        compute = Mock(side_effect=control_module._compute_target_velocities)
+        monkeypatch.setattr(control_module, '_compute_target_velocities', compute)
+
+        # Stick drift inside the dead zone (default 0.15)
+        result = control_service.process_movement_command({'lx': 0.05, 'ly': -0.1, 'rx': 0.0, 'ry': 0.02})
+
+        assert result['should_send'] is False
+        assert result['zero_velocity'] is True
+        assert result['velocities']['vx'] == 0.0
+        compute.assert_not_called()
+
+        # Leaving the dead zone runs the full pipeline again (rage mode: no slew ramp)
+        result = control_service.process_movement_command({'lx': 0.0, 'ly': 0.5, 'rx': 0.0, 'ry': 0.0, 'rage_mode': True})
+
+        assert result['should_send'] is True
+        compute.assert_called_once()
+
+    def test_target_velocities_cached_per_input(self, control_service, state_service):
+        """Test repeated stick positions hit the cache and settings changes don't."""
+        from app.services.control import _compute_target_velocities
+
+        state_service.is_connected = True
+        state_service.gamepad_enabled = True
+        _compute_target_velocities.cache_clear()
+
+        data = {'lx': 0.0, 'ly': 0.5, 'rx': 0.0, 'ry': 0.0, 'rage_mode': True}
+        first = control_service.process_movement_command(data)
+        second = control_service.process_movement_command(data)
+
+        assert first['velocities'] == second['velocities']
+        assert _compute_target_velocities.cache_info().hits == 1
+
+        # A settings change is part of the key, so it yields a fresh result
+        state_service.set_gamepad_setting('sensitivity_linear', 0.5)
+        third = control_service.process_movement_command(data)
+
+        assert third['velocities']['vx'] < first['velocities']['vx']
+        assert _compute_target_velocities.cache_info().misses == 2
+
+    @pytest.mark.parametrize("args", [
+        (0.05, 0.5, -0.3, 0.2, False, 0.15, 0.15, 1.0, 0.8, 1.2, 1.5, 0.6, 0.4, 0.8, 0.35),
+        (0.05, 0.5, -0.3, 0.2, True, 0.15, 0.15, 1.0, 0.8, 1.2, 1.5, 0.6, 0.4, 0.8, 0.35),
+        (-1.0, -1.0, 1.0, -1.0, False, 0.0, 0.0, 2.0, 2.0, 2.0, 1.0, 5.0, 3.0, 9.0, 0.35),
+    ], ids=["gamepad", "keyboard_mouse", "full_deflection"])
+    def test_target_velocity_kernel_matches_python(self, args):
+        """Test the (optionally Numba-compiled) kernel matches the Python math."""
+        from app.services.control import _target_velocities_kernel, _target_velocities_py
+
+        assert _target_velocities_kernel(*args) == pytest.approx(_target_velocities_py(*args))
+
+
+class TestMovementCommandSending:
+    """Test the single-slot movement mailbox."""
+
+    def test_send_movement_coalesces_to_latest(self, control_service, state_service):
+        """Test commands queued before the loop runs collapse to the latest one."""
+        state_service.event_loop = Mock()
+        state_service.event_loop.is_running.return_value = True
+        state_service.connection = Mock()
+        publish = state_service.connection.datachannel.pub_sub.publish_without_callback
+
+        for ly in (0.1, 0.2, 0.3):
+            result = control_service.send_movement_command_sync(0.0, ly, 0.0, 0.0, False)
+            assert result['status'] == 'success'
+
+        # Only the first command wakes the loop; later ones overwrite the mailbox
+        state_service.event_loop.call_soon_threadsafe.assert_called_once()
+        flush = state_service.event_loop.call_soon_threadsafe.call_args[0][0]
+        flush()
+
+        publish.assert_called_once()
+        assert publish.call_args[0][1]['ly'] == pytest.approx(0.3)
+
+    def test_send_movement_wakes_loop_again_after_flush(self, control_service, state_service):
+        """Test a command after a flush schedules a new publish."""
+        state_service.event_loop = Mock()
+        state_service.event_loop.is_running.return_value = True
+        state_service.connection = Mock()
+
+        control_service.send_movement_command_sync(0.0, 0.5, 0.0, 0.0, False)
+        state_service.event_loop.call_soon_threadsafe.call_args[0][0]()
+        control_service.send_movement_command_sync(0.0, 0.0, 0.0, 0.0, True)
+
+        assert state_service.event_loop.call_soon_threadsafe.call_count == 2
+
+    def test_send_movement_wakes_new_loop_after_reconnect(self, control_service, state_service):
+        """Test a command left pending on a dead loop doesn't block the new loop."""
+        old_loop, new_loop = Mock(), Mock()
+        old_loop.is_running.return_value = True
+        new_loop.is_running.return_value = True
+
+        state_service.event_loop = old_loop
+        control_service.send_movement_command_sync(0.0, 0.5, 0.0, 0.0, False)
+        state_service.event_loop = new_loop
+        control_service.send_movement_command_sync(0.0, 0.6, 0.0, 0.0, False)
+
+        new_loop.call_soon_threadsafe.assert_called_once()
+
 
 @pytest.mark.asyncio
 class TestRobotActions:
@@ -272,6 +376,37 @@ class TestRobotActions:
         # Should call publish_request_new twice (StandUp + BalanceStand)
         assert state_service.connection.datachannel.pub_sub.publish_request_new.call_count == 2
 
+    async def test_send_simple_sport_action(self, control_service, state_service):
+        """Test table-dispatched actions publish their SPORT_MOD api_id."""
+        from unitree_webrtc_connect.constants import RTC_TOPIC, SPORT_CMD
+        state_service.connection = Mock()
+        state_service.connection.datachannel = Mock()
+        state_service.connection.datachannel.pub_sub = Mock()
+        state_service.connection.datachannel.pub_sub.publish_request_new = AsyncMock()
+
+        result = await control_service.send_robot_action('crouch')
+
+        assert result == {'status': 'success', 'action': 'crouch'}
+        # No response is needed, so the request isn't awaited
+        state_service.connection.datachannel.pub_sub.publish_request_without_callback.assert_called_once_with(
+            RTC_TOPIC["SPORT_MOD"], {"api_id": SPORT_CMD["StandDown"]}
+        )
+        state_service.connection.datachannel.pub_sub.publish_request_new.assert_not_called()
+
+    async def test_send_robot_action_sync_runs_action_on_loop(self, control_service, state_service):
+        """Test the sync wrapper starts the action as a task on the event loop."""
+        state_service.connection = Mock()
+        state_service.connection.datachannel = Mock()
+        state_service.connection.datachannel.pub_sub = Mock()
+        state_service.event_loop = asyncio.get_running_loop()
+
+        result = control_service.send_robot_action_sync('sit_down')
+        await asyncio.sleep(0.01)
+
+        assert result['status'] == 'success'
+        state_service.connection.datachannel.pub_sub.publish_request_without_callback.assert_called_once()
+        assert not control_service._action_tasks
+
     async def test_send_unknown_action(self, control_service, state_service):
         """Test sending unknown action."""
         state_service.connection = Mock()
@@ -298,5 +433,92 @@ class TestCameraControl:
         # Verify publish_request_new was called with correct parameters
         state_service.connection.datachannel.pub_sub.publish_request_new.assert_called_once()
         call_args = state_service.connection.datachannel.pub_sub.publish_request_new.call_args
-        assert call_args[0][1]['parameter']['yaw'] == 0.5
+        assert call_args[0][1]['parameter']['yaw'] == pytest.approx(0.5)
+
+    async def test_camera_control_sync_coalesces_to_latest_yaw(self, control_service, state_service):
+        """Test trigger samples queued before the drain runs publish only the latest yaw."""
+        state_service.connection = Mock()
+        state_service.connection.datachannel = Mock()
+        state_service.connection.datachannel.pub_sub = Mock()
+        publish = AsyncMock()
+        state_service.connection.datachannel.pub_sub.publish_request_new = publish
+        state_service.event_loop = asyncio.get_running_loop()
+
+        for yaw in (0.1, 0.2, 0.3):
+            result = control_service.send_camera_control_sync(yaw)
+            assert result['status'] == 'success'
+        await asyncio.sleep(0.05)
+
+        publish.assert_awaited_once()
+        assert publish.call_args[0][1]['parameter']['yaw'] == pytest.approx(0.3)
+
+        # Drain has finished, so the next sample starts a new one
+        control_service.send_camera_control_sync(-0.4)
+        await asyncio.sleep(0.05)
+
+        assert publish.await_count == 2
+        assert publish.call_args[0][1]['parameter']['yaw'] == pytest.approx(-0.4)
+
+    async def test_camera_control_stalled_reply_does_not_block_next_yaw(self, control_service, state_service):
+        """Test a request still awaiting its reply doesn't hold back the next yaw."""
+        reply = asyncio.Event()
+
+        async def publish(topic, options):
+            if options['parameter']['yaw'] == pytest.approx(0.1):
+                await reply.wait()
+
+        state_service.connection = Mock()
+        state_service.connection.datachannel = Mock()
+        state_service.connection.datachannel.pub_sub = Mock()
+        state_service.connection.datachannel.pub_sub.publish_request_new = AsyncMock(side_effect=publish)
+        state_service.event_loop = asyncio.get_running_loop()
+
+        control_service.send_camera_control_sync(0.1)
+        await asyncio.sleep(0.05)
+        control_service.send_camera_control_sync(0.2)
+        await asyncio.sleep(0.05)
+
+        publish_mock = state_service.connection.datachannel.pub_sub.publish_request_new
+        assert publish_mock.await_count == 2
+        assert len(control_service._camera_inflight) == 1
+
+        reply.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert not control_service._camera_inflight
+
+    async def test_camera_control_sync_requires_running_loop(self, control_service, state_service, stopped_event_loop):
+        """Test camera commands are rejected when the event loop isn't running."""
+        state_service.event_loop = stopped_event_loop
+
+        result = control_service.send_camera_control_sync(0.5)
+
+        assert result['status'] == 'error'
+
+
+
+@pytest.mark.asyncio
+class TestLedBrightness:
+    """Test LED brightness queries."""
+
+    async def test_get_led_brightness_parses_response(self, control_service, state_service):
+        """Test the brightness is read from the VUI 1006 response."""
+        state_service.connection = Mock()
+        state_service.connection.datachannel = Mock()
+        state_service.connection.datachannel.pub_sub = Mock()
+        state_service.connection.datachannel.pub_sub.publish_request_new = AsyncMock(return_value={
+            'data': {'header': {'status': {'code': 0}}, 'data': '{"brightness": 7}'}
+        })
+
+        assert await control_service.get_led_brightness() == 7
+
+    async def test_get_led_brightness_error_status(self, control_service, state_service):
+        """Test a non-zero status code is reported as a failed query."""
+        state_service.connection = Mock()
+        state_service.connection.datachannel = Mock()
+        state_service.connection.datachannel.pub_sub = Mock()
+        state_service.connection.datachannel.pub_sub.publish_request_new = AsyncMock(return_value={
+            'data': {'header': {'status': {'code': 3203}}, 'data': '{}'}
+        })
 
+        assert await control_service.get_led_brightness() is None
@@ -0,0 +1,66 @@
+"""
+Integration tests for the orjson JSON provider.
+
+These tests verify that the optional orjson serializer:
+- Round-trips API request/response bodies through Flask
+- Handles numpy values and Flask-only types (Decimal)
+- Produces str output compatible with python-socketio
+"""
+
+import pytest
+from decimal import Decimal
+
+import numpy as np
+from flask import Flask, jsonify, request
+
+pytest.importorskip("orjson")
+
+from app.json_provider import OrjsonProvider, OrjsonSocketIOJSON
+
+
+class TestOrjsonProvider:
+    """Integration tests for OrjsonProvider."""
+
+    @pytest.fixture
+    def client(self):
+        """Flask test client with the orjson provider installed."""
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+        app.json = OrjsonProvider(app)
+
+        @app.route('/echo', methods=['POST'])
+        def echo():
+            data = request.json
+            return jsonify({'received': data, 'vx': np.float32(0.5), 'limit': Decimal('0.6')})
+
+        return app.test_client()
+
+    def test_request_and_response_round_trip(self, client):
+        """Test request.json and jsonify go through orjson."""
+        response = client.post('/echo', json={'lx': 0.1, 'ly': -0.2, 'source': 'gamepad'})
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        body = response.get_json()
+        assert body['received'] == {'lx': 0.1, 'ly': -0.2, 'source': 'gamepad'}
+        assert body['vx'] == pytest.approx(0.5)
+        assert body['limit'] == '0.6'  # Flask's default Decimal handling
+
+
+class TestOrjsonSocketIOJSON:
+    """Tests for the Socket.IO json shim."""
+
+    def test_dumps_returns_compact_str(self):
+        """Test dumps accepts python-socketio's kwargs and returns a str."""
+        encoded = OrjsonSocketIOJSON.dumps(
+            ['gamepad_command', {'lx': 0.5, 1: 'key'}], separators=(',', ':')
+        )
+
+        assert isinstance(encoded, str)
+        assert encoded == '["gamepad_command",{"lx":0.5,"1":"key"}]'
+
+    def test_loads_round_trip(self):
+        """Test loads accepts the str produced by dumps."""
+        data = {'lx': 0.5, 'buttons': [True, False], 'source': 'keyboard_mouse'}
+
+        assert OrjsonSocketIOJSON.loads(OrjsonSocketIOJSON.dumps(data)) == data
@@ -0,0 +1,57 @@
+"""
+Integration tests for the connect route.
+
+Tests POST /connect against the real ConnectionService.connect_sync()
+running on a background event loop, with the WebRTC connection mocked.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from flask import Flask
+from app.services import StateService, ConnectionService
+from app.services.connection import ConnState
+from app.routes import api_bp
+
+
+class TestConnectRoute:
+    """Test the HTTP POST /connect endpoint."""
+
+    @pytest.fixture
+    def app(self, bg_loop):
+        """Create a Flask app with a real ConnectionService on a running loop."""
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+
+        state = StateService()
+        state.event_loop = bg_loop
+
+        app.config['STATE_SERVICE'] = state
+        app.config['CONNECTION_SERVICE'] = ConnectionService(state)
+        app.config['VIDEO_SERVICE'] = Mock()
+        app.config['AUDIO_SERVICE'] = Mock()
+        app.register_blueprint(api_bp)
+        return app
+
+    @pytest.mark.parametrize("conn_state", [ConnState.CONNECTING, ConnState.CONNECTED])
+    def test_own_connection_reports_disconnect_first(self, app, conn_state):
+        """Test a second connect while this server holds the robot asks to disconnect first."""
+        app.config['CONNECTION_SERVICE'].conn_state = conn_state
+
+        with patch('app.services.connection.UnitreeWebRTCConnection'):
+            response = app.test_client().post('/connect', json={'connection_method': 'LocalAP'})
+
+        assert response.status_code == 500
+        message = response.get_json()['message']
+        assert "Disconnect first" in message
+        assert "mobile app" not in message
+        assert app.config['CONNECTION_SERVICE'].conn_state is conn_state
+
+    def test_robot_busy_reports_other_client(self, app):
+        """Test the robot refusing the connection still points at the mobile app."""
+        connection_service = app.config['CONNECTION_SERVICE']
+        connection_service.connect_sync = Mock(side_effect=RuntimeError("Robot is busy"))
+
+        response = app.test_client().post('/connect', json={'connection_method': 'LocalAP'})
+
+        assert response.status_code == 500
+        assert "mobile app" in response.get_json()['message']
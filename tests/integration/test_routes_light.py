@@ -0,0 +1,70 @@
+"""
+Integration tests for the robot light routes.
+
+Tests GET /robot/light against the real ControlService.get_led_brightness()
+running on a background event loop, with the robot's VUI 1006 response mocked.
+"""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+from flask import Flask
+from app.services import StateService, ControlService
+from app.routes import api_bp
+
+
+class TestGetLightLevelRoute:
+    """Test the HTTP GET /robot/light endpoint."""
+
+    @pytest.fixture
+    def app(self, bg_loop):
+        """Create a Flask app with a connected state and a real ControlService."""
+        app = Flask(__name__)
+        app.config['TESTING'] = True
+
+        state = StateService()
+        state.is_connected = True
+        state.event_loop = bg_loop
+        state.connection = Mock()
+        state.connection.datachannel.pub_sub.publish_request_new = AsyncMock()
+
+        app.config['STATE_SERVICE'] = state
+        app.config['CONTROL_SERVICE'] = ControlService(state)
+        app.register_blueprint(api_bp)
+        return app
+
+    def _respond_with(self, app, response):
+        """Make the robot answer the brightness query with response."""
+        pub_sub = app.config['STATE_SERVICE'].connection.datachannel.pub_sub
+        pub_sub.publish_request_new.return_value = response
+
+    def test_returns_brightness(self, app):
+        """Test a successful response returns the reported level."""
+        self._respond_with(app, {'data': {'header': {'status': {'code': 0}}, 'data': '{"brightness": 7}'}})
+
+        response = app.test_client().get('/robot/light')
+
+        assert response.status_code == 200
+        assert response.get_json() == {'success': True, 'level': 7}
+
+    def test_missing_brightness_defaults_to_zero(self, app):
+        """Test a successful response without a brightness key reports level 0."""
+        self._respond_with(app, {'data': {'header': {'status': {'code': 0}}, 'data': {}}})
+
+        response = app.test_client().get('/robot/light')
+
+        assert response.status_code == 200
+        assert response.get_json() == {'success': True, 'level': 0}
+
+    @pytest.mark.parametrize("robot_response", [
+        {'data': {'data': '{"brightness": 7}'}},                                   # No header
+        {'data': {'header': {}, 'data': '{"brightness": 7}'}},                     # No status code
+        {'data': {'header': {'status': {'code': 3203}}, 'data': '{"brightness": 7}'}},
+    ])
+    def test_failed_query_returns_error(self, app, robot_response):
+        """Test responses without a success status code are reported as failures."""
+        self._respond_with(app, robot_response)
+
+        response = app.test_client().get('/robot/light')
+
+        assert response.status_code == 500
+        assert response.get_json()['success'] is False
@@ -221,3 +221,139 @@ class TestWebSocketMovementCommandHandler:
             0.0, 0.5, 0.0, 0.0, False
         )
 
+
+    def test_websocket_gamepad_command_returns_response(self, app, client):
+        """Test that the JSON handler answers with command_response."""
+        flask_app, socketio = app
+        control_service = flask_app.config['CONTROL_SERVICE']
+        control_service.process_movement_command.return_value = {
+            'status': 'success',
+            'should_send': False,
+            'zero_velocity': True,
+            'velocities': {'vx': 0.0, 'vy': 0.0, 'vyaw': 0.0, 'pitch': 0.0,
+                           'lx': 0.0, 'ly': 0.0, 'rx': 0.0, 'ry': 0.0},
+            'processing_time_ms': 0.1
+        }
+
+        client.emit('control_command', {'lx': 0.0, 'ly': 0.0, 'rx': 0.0, 'ry': 0.0})
+
+        received = client.get_received()
+        assert received[-1]['name'] == 'command_response'
+        assert received[-1]['args'][0]['status'] == 'success'
+        control_service.send_movement_command_sync.assert_not_called()
+
+    def test_websocket_binary_command_round_trip(self, app, client):
+        """Test the msgpack handler decodes the command and answers in msgpack."""
+        msgpack = pytest.importorskip("msgpack")
+        flask_app, socketio = app
+        control_service = flask_app.config['CONTROL_SERVICE']
+        control_service.process_movement_command.return_value = {
+            'status': 'success',
+            'should_send': True,
+            'zero_velocity': False,
+            'velocities': {'vx': 0.3, 'vy': 0.0, 'vyaw': 0.0, 'pitch': 0.0,
+                           'lx': 0.0, 'ly': 0.5, 'rx': 0.0, 'ry': 0.0},
+            'processing_time_ms': 1.5
+        }
+        control_service.send_movement_command_sync.return_value = {
+            'status': 'success',
+            'message': 'Movement command scheduled'
+        }
+
+        client.emit('control_command_bin', msgpack.packb({'lx': 0.5, 'ly': 0.5, 'rx': 0.0, 'ry': 0.0}))
+
+        control_service.process_movement_command.assert_called_once_with(
+            {'lx': 0.5, 'ly': 0.5, 'rx': 0.0, 'ry': 0.0}
+        )
+        control_service.send_movement_command_sync.assert_called_once_with(
+            0.0, 0.5, 0.0, 0.0, False
+        )
+        received = client.get_received()
+        assert received[-1]['name'] == 'command_response_bin'
+        response = msgpack.unpackb(received[-1]['args'][0])
+        assert response['status'] == 'success'
+        assert response['send_status'] == 'success'
+
+    def test_websocket_binary_command_rejects_bad_payload(self, app, client):
+        """Test a malformed msgpack payload gets an error response."""
+        msgpack = pytest.importorskip("msgpack")
+        flask_app, socketio = app
+        control_service = flask_app.config['CONTROL_SERVICE']
+
+        client.emit('control_command_bin', b'\xc1')  # 0xc1 is never valid msgpack
+
+        control_service.process_movement_command.assert_not_called()
+        response = msgpack.unpackb(client.get_received()[-1]['args'][0])
+        assert response['status'] == 'error'
+
+    def test_websocket_gamepad_axes_unpacks_binary_payload(self, app, client):
+        """Test the binary gamepad handler turns four float32 axes into a command."""
+        import struct
+        flask_app, socketio = app
+        control_service = flask_app.config['CONTROL_SERVICE']
+        control_service.process_movement_command.return_value = {
+            'status': 'success',
+            'should_send': False,
+            'zero_velocity': True,
+            'velocities': {'vx': 0.0, 'vy': 0.0, 'vyaw': 0.0, 'pitch': 0.0,
+                           'lx': 0.0, 'ly': 0.0, 'rx': 0.0, 'ry': 0.0},
+            'processing_time_ms': 0.1
+        }
+
+        client.emit('gamepad_axes', struct.pack('<4f', 0.25, -0.5, 0.75, 0.0))
+
+        control_service.process_movement_command.assert_called_once_with(
+            {'lx': 0.25, 'ly': -0.5, 'rx': 0.75, 'ry': 0.0, 'source': 'gamepad'}
+        )
+        assert client.get_received()[-1]['name'] == 'command_response'
+
+    def test_websocket_gamepad_axes_rejects_short_payload(self, app, client):
+        """Test a payload that isn't 16 bytes gets an error response."""
+        flask_app, socketio = app
+        control_service = flask_app.config['CONTROL_SERVICE']
+
+        client.emit('gamepad_axes', b'\x00' * 8)
+
+        control_service.process_movement_command.assert_not_called()
+        response = client.get_received()[-1]['args'][0]
+        assert response['status'] == 'error'
+
+    def test_websocket_control_action_acks_result(self, app, client):
+        """Test control_action schedules the action and acknowledges the result."""
+        flask_app, socketio = app
+        control_service = flask_app.config['CONTROL_SERVICE']
+        control_service.send_robot_action_sync.return_value = {'status': 'success', 'action': 'sit_down'}
+
+        ack = client.emit('control_action', {'action': 'sit_down'}, callback=True)
+
+        control_service.send_robot_action_sync.assert_called_once_with('sit_down')
+        assert ack == {'status': 'success', 'action': 'sit_down'}
+
+    def test_websocket_control_action_requires_action(self, app, client):
+        """Test control_action without an action name is rejected."""
+        flask_app, socketio = app
+        control_service = flask_app.config['CONTROL_SERVICE']
+
+        ack = client.emit('control_action', {}, callback=True)
+
+        control_service.send_robot_action_sync.assert_not_called()
+        assert ack['status'] == 'error'
+
+    def test_websocket_control_camera_uses_latest_wins_slot(self, app, client):
+        """Test control_camera hands yaw to send_camera_control_sync."""
+        flask_app, socketio = app
+        control_service = flask_app.config['CONTROL_SERVICE']
+        control_service.send_camera_control_sync.return_value = {
+            'status': 'success', 'message': 'Camera command scheduled'
+        }
+
+        ack = client.emit('control_camera', {'yaw': -0.35}, callback=True)
+
+        control_service.send_camera_control_sync.assert_called_once_with(-0.35)
+        assert ack['status'] == 'success'
+
+    def test_websocket_latency_ping_acks_pong(self, app, client):
+        """Test latency_ping answers with a pong timestamp acknowledgement."""
+        ack = client.emit('latency_ping', callback=True)
+
+        assert isinstance(ack['pong'], float)
@@ -26,9 +26,8 @@ class TestStateServiceIntegration:
         assert state.is_connected is False
         
         # Video state
-        assert isinstance(state.frame_queue, Queue)
-        assert state.frame_queue.maxsize == 30
         assert state.latest_frame is None
+        assert state.frame_seq == 0
         
         # Audio state
         assert state.audio_streaming_enabled is False
@@ -45,7 +44,7 @@ class TestStateServiceIntegration:
         assert state.keyboard_mouse_enabled is False
         assert state.emergency_stop_active is False
         assert state.last_command_time == 0
-        assert state.command_interval == 0.016
+        assert state.command_interval == pytest.approx(0.016)
         assert state.current_body_height == 1
         assert state.lidar_state is False
         
@@ -81,7 +80,33 @@ class TestStateServiceIntegration:
         # Should have a valid frame at the end
         assert state.latest_frame is not None
         assert state.latest_frame.shape == (480, 640, 3)
-    
+        assert state.frame_seq == 50
+
+    def test_wait_for_frame_wakes_on_publish(self):
+        """Test wait_for_frame returns as soon as a newer frame is published."""
+        state = StateService()
+        frame, seq = state.wait_for_frame(None, timeout=0)
+        publisher = threading.Timer(0.05, setattr, (state, 'latest_frame', "frame"))
+
+        start = time.monotonic()
+        publisher.start()
+        frame, new_seq = state.wait_for_frame(seq, timeout=5)
+        publisher.join()
+
+        assert frame == "frame"
+        assert new_seq == seq + 1
+        assert time.monotonic() - start < 5
+
+    def test_wait_for_frame_times_out(self):
+        """Test wait_for_frame returns the unchanged frame after the timeout."""
+        state = StateService()
+        state.latest_frame = "frame"
+
+        frame, seq = state.wait_for_frame(state.frame_seq, timeout=0.01)
+
+        assert frame == "frame"
+        assert seq == 1
+
     def test_thread_safe_gamepad_enabled(self):
         """Test thread-safe access to gamepad_enabled."""
         state = StateService()
@@ -126,8 +151,8 @@ class TestStateServiceIntegration:
         
         # Get initial settings
         settings = state.gamepad_settings
-        assert settings['deadzone_left_stick'] == 0.15
-        assert settings['sensitivity_linear'] == 1.0
+        assert settings['deadzone_left_stick'] == pytest.approx(0.15)
+        assert settings['sensitivity_linear'] == pytest.approx(1.0)
         
         # Update settings
         state.update_gamepad_settings({
@@ -136,12 +161,31 @@ class TestStateServiceIntegration:
         })
         
         # Verify updates
-        assert state.get_gamepad_setting('deadzone_left_stick') == 0.2
-        assert state.get_gamepad_setting('sensitivity_linear') == 1.5
+        assert state.get_gamepad_setting('deadzone_left_stick') == pytest.approx(0.2)
+        assert state.get_gamepad_setting('sensitivity_linear') == pytest.approx(1.5)
         
         # Set individual setting
         state.set_gamepad_setting('max_linear_velocity', 0.8)
-        assert state.get_gamepad_setting('max_linear_velocity') == 0.8
+        assert state.get_gamepad_setting('max_linear_velocity') == pytest.approx(0.8)
+
+        # Unknown keys are ignored
+        state.update_gamepad_settings({'not_a_setting': 1.0})
+        assert state.get_gamepad_setting('not_a_setting') is None
+        assert 'not_a_setting' not in state.gamepad_settings
+
+    def test_gamepad_settings_snapshot_is_immutable(self):
+        """Test updates swap in a new snapshot instead of mutating the old one."""
+        state = StateService()
+        before = state.gamepad_settings_snapshot
+
+        with pytest.raises(AttributeError):
+            before.sensitivity_linear = 2.0
+
+        state.set_gamepad_setting('sensitivity_linear', 2.0)
+
+        assert before.sensitivity_linear == pytest.approx(1.0)
+        assert state.gamepad_settings_snapshot.sensitivity_linear == pytest.approx(2.0)
+        assert state.gamepad_settings == state.gamepad_settings_snapshot._asdict()
 
     def test_velocity_tracking(self):
         """Test velocity tracking functionality."""
@@ -234,7 +278,6 @@ class TestStateServiceIntegration:
         state.connection = "mock_connection"
         state.is_connected = True
         state.latest_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        state.frame_queue.put("frame_data")
         state.gamepad_enabled = True
         state.audio_muted = False
         state.speed_level = 1
@@ -249,7 +292,6 @@ class TestStateServiceIntegration:
         assert state.connection is None
         assert state.is_connected is False
         assert state.latest_frame is None
-        assert state.frame_queue.empty()
         assert state.gamepad_enabled is False
         assert state.audio_muted is True
         assert state.speed_level == 0
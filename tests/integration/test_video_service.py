@@ -3,7 +3,7 @@ Integration tests for VideoService.
 
 These tests verify that VideoService correctly integrates with:
 - StateService for state management
-- Frame queue management
+- Latest-frame handoff
 - JPEG encoding
 - MJPEG stream generation
 """
@@ -12,8 +12,6 @@ import pytest
 import asyncio
 import time
 from unittest.mock import Mock, MagicMock, AsyncMock
-import numpy as np
-import cv2
 
 from app.services.state import StateService
 from app.services.video import VideoService
@@ -35,14 +33,15 @@ class TestVideoServiceIntegration:
         assert video_service.target_fps == 30
     
     @pytest.mark.asyncio
-    async def test_recv_camera_stream_updates_state(self):
-        """Test recv_camera_stream updates latest_frame and queue."""
+    async def test_recv_camera_stream_updates_state(self, fresh_mock):
+        """Test recv_camera_stream publishes each frame as latest_frame."""
+        import numpy as np
         state = StateService()
         video_service = VideoService(state)
         
         # Mock track
         mock_track = Mock()
-        mock_frame = Mock()
+        mock_frame = fresh_mock
         test_image = np.zeros((480, 640, 3), dtype=np.uint8)
         mock_frame.to_ndarray.return_value = test_image
         
@@ -62,26 +61,31 @@ class TestVideoServiceIntegration:
         
         # Verify state was updated
         assert state.latest_frame is not None
-        assert state.frame_queue.qsize() == 3
+        assert state.frame_seq == 3
+
+        # Frames are handed over without a copy and published read-only
+        assert state.latest_frame is test_image
+        assert not state.latest_frame.flags.writeable
     
     @pytest.mark.asyncio
-    async def test_recv_camera_stream_drops_old_frames_when_full(self):
-        """Test recv_camera_stream drops old frames when queue is full."""
+    async def test_recv_camera_stream_keeps_only_latest_frame(self, fresh_mock):
+        """Test recv_camera_stream keeps only the newest frame, with no backlog."""
+        import numpy as np
         state = StateService()
         video_service = VideoService(state)
         
         # Mock track
         mock_track = Mock()
-        mock_frame = Mock()
-        test_image = np.zeros((480, 640, 3), dtype=np.uint8)
-        mock_frame.to_ndarray.return_value = test_image
+        mock_frame = fresh_mock
+        images = [np.full((480, 640, 3), i, dtype=np.uint8) for i in range(35)]
+        mock_frame.to_ndarray.side_effect = images
         
-        # Simulate receiving more frames than queue size
+        # Simulate receiving 35 frames then stopping
         frame_count = 0
         async def mock_recv():
             nonlocal frame_count
             frame_count += 1
-            if frame_count > 35:  # Queue size is 30
+            if frame_count > 35:
                 raise Exception("Stop after 35 frames")
             return mock_frame
         
@@ -90,11 +94,13 @@ class TestVideoServiceIntegration:
         # Receive frames
         await video_service.recv_camera_stream(mock_track)
         
-        # Verify queue size is at max
-        assert state.frame_queue.qsize() <= 30
+        # Only the newest frame is retained
+        assert state.latest_frame is images[-1]
+        assert state.frame_seq == 35
     
     def test_encode_jpeg_success(self):
         """Test _encode_jpeg successfully encodes frame."""
+        import numpy as np
         state = StateService()
         video_service = VideoService(state)
         
@@ -109,8 +115,130 @@ class TestVideoServiceIntegration:
         assert isinstance(jpeg_bytes, bytes)
         assert len(jpeg_bytes) > 0
     
+    def test_encode_jpeg_uses_turbojpeg_when_available(self, fresh_mock, monkeypatch):
+        """Test _encode_jpeg prefers the TurboJPEG encoder over OpenCV."""
+        import numpy as np
+        from app.services import video as video_module
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.turbo_jpeg = fresh_mock
+        fresh_mock.encode.return_value = b'\xff\xd8turbo'
+        test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        monkeypatch.setattr(video_module, 'TJPF_BGR', 0, raising=False)
+
+        jpeg_bytes = video_service._encode_jpeg(test_frame, quality=70)
+
+        assert jpeg_bytes == b'\xff\xd8turbo'
+        fresh_mock.encode.assert_called_once_with(test_frame, quality=70, pixel_format=0)
+
+    def test_encode_jpeg_uses_nvjpeg_when_selected(self, fresh_mock):
+        """Test _encode_jpeg prefers the nvJPEG encoder when it is loaded."""
+        import numpy as np
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.nvjpeg = fresh_mock
+        fresh_mock.encode.return_value = b'\xff\xd8nvjpeg'
+        test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        jpeg_bytes = video_service._encode_jpeg(test_frame, quality=70)
+
+        assert jpeg_bytes == b'\xff\xd8nvjpeg'
+        fresh_mock.encode.assert_called_once_with(test_frame, 70)
+
+    def test_jpeg_encoder_cpu_disables_accelerated_backends(self, monkeypatch):
+        """Test JPEG_ENCODER=cpu leaves only the OpenCV encoder."""
+        from app.services import video as video_module
+        monkeypatch.setattr(video_module, 'JPEG_ENCODER', 'cpu')
+
+        video_service = VideoService(StateService())
+
+        assert video_service.nvjpeg is None
+        assert video_service.turbo_jpeg is None
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, 85),
+        ("40", 40),
+        ("0", 1),
+        ("250", 100),
+        ("high", 85),
+    ])
+    def test_parse_jpeg_quality(self, value, expected):
+        """Test MJPEG_QUALITY parsing falls back on bad input and clamps to 1-100."""
+        from app.services.video import _parse_jpeg_quality
+
+        assert _parse_jpeg_quality(value) == expected
+
+    @pytest.mark.parametrize("value,expected", [
+        (None, 'auto'),
+        ('TurboJPEG', 'turbojpeg'),
+        ('cpu', 'cpu'),
+        ('turbo', 'auto'),
+    ])
+    def test_parse_jpeg_encoder(self, value, expected):
+        """Test JPEG_ENCODER parsing is case-insensitive and treats unknown values as auto."""
+        from app.services.video import _parse_jpeg_encoder
+
+        assert _parse_jpeg_encoder(value) == expected
+
+    def test_parse_jpeg_encoder_warns_on_unknown_value(self, caplog):
+        """Test a typo in JPEG_ENCODER is logged instead of silently ignored."""
+        from app.services.video import _parse_jpeg_encoder
+
+        with caplog.at_level("WARNING", logger="app.services.video"):
+            _parse_jpeg_encoder('turbo')
+
+        assert "Unknown JPEG_ENCODER 'turbo'" in caplog.text
+
+    @pytest.mark.parametrize("requested,level", [(True, "WARNING"), (False, "INFO")])
+    def test_turbojpeg_load_failure_logged(self, monkeypatch, caplog, requested, level):
+        """Test a TurboJPEG load failure is a warning only when it was explicitly requested."""
+        from app.services import video as video_module
+        monkeypatch.setattr(video_module, 'TurboJPEG', Mock(side_effect=OSError("no libturbojpeg")))
+
+        with caplog.at_level("INFO", logger="app.services.video"):
+            assert video_module._load_turbojpeg(requested=requested) is None
+
+        records = [r for r in caplog.records if "TurboJPEG unavailable" in r.getMessage()]
+        assert [r.levelname for r in records] == [level]
+
+    def test_turbojpeg_requested_but_not_installed_warns(self, monkeypatch, caplog):
+        """Test JPEG_ENCODER=turbojpeg without PyTurboJPEG installed is logged."""
+        from app.services import video as video_module
+        monkeypatch.setattr(video_module, 'TurboJPEG', None)
+
+        with caplog.at_level("WARNING", logger="app.services.video"):
+            assert video_module._load_turbojpeg(requested=True) is None
+
+        assert "PyTurboJPEG is not installed" in caplog.text
+
+    def test_encode_jpeg_falls_back_to_opencv(self):
+        """Test _encode_jpeg uses OpenCV when TurboJPEG is not available."""
+        import numpy as np
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.turbo_jpeg = None
+
+        jpeg_bytes = video_service._encode_jpeg(np.zeros((480, 640, 3), dtype=np.uint8))
+
+        assert jpeg_bytes[:2] == b'\xff\xd8'
+
+    def test_encode_jpeg_buffer_avoids_copy(self):
+        """Test _encode_jpeg_buffer returns a view of the OpenCV output."""
+        import numpy as np
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.turbo_jpeg = None
+        test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        jpeg = video_service._encode_jpeg_buffer(test_frame)
+
+        assert isinstance(jpeg, memoryview)
+        assert bytes(jpeg) == video_service._encode_jpeg(test_frame)
+
     def test_encode_jpeg_with_custom_quality(self):
         """Test _encode_jpeg with custom quality setting."""
+        import numpy as np
         state = StateService()
         video_service = VideoService(state)
         
@@ -132,6 +260,7 @@ class TestVideoServiceIntegration:
     
     def test_create_blank_frame(self):
         """Test _create_blank_frame creates frame with text."""
+        import numpy as np
         state = StateService()
         video_service = VideoService(state)
         
@@ -144,33 +273,191 @@ class TestVideoServiceIntegration:
         assert blank_frame.shape == (480, 640, 3)
         assert blank_frame.dtype == np.uint8
     
-    def test_generate_frames_from_queue(self):
-        """Test generate_frames yields frames from queue."""
+    def test_mjpeg_part_framing(self):
+        """Test _mjpeg_part wraps JPEG bytes in the multipart boundary."""
+        from app.services.video import _mjpeg_part
+
+        part = _mjpeg_part(b'\xff\xd8jpeg\xff\xd9')
+
+        assert part == (b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'
+                        b'\xff\xd8jpeg\xff\xd9\r\n')
+
+    def test_generate_frames_raw_yields_ppm(self):
+        """Test generate_frames(raw=True) sends frames as uncompressed PPM."""
+        import cv2
+        import numpy as np
         state = StateService()
         video_service = VideoService(state)
-        
-        # Add test frames to queue
         test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        state.frame_queue.put(test_frame)
-        state.frame_queue.put(test_frame)
-        
-        # Generate frames
+        test_frame[:, :] = (255, 0, 0)  # Blue in BGR
+        state.latest_frame = test_frame
+
+        part = next(video_service.generate_frames(raw=True))
+
+        header = b'--frame\r\nContent-Type: image/x-portable-pixmap\r\n\r\n'
+        assert part.startswith(header + b'P6\n640 480\n255\n')
+        ppm = part[len(header):-2]
+        decoded = cv2.imdecode(np.frombuffer(ppm, np.uint8), cv2.IMREAD_COLOR)
+        assert np.array_equal(decoded, test_frame)
+
+    def test_generate_frames_downscales_to_width(self):
+        """Test generate_frames(width=...) shrinks frames before encoding."""
+        import cv2
+        import numpy as np
+        state = StateService()
+        video_service = VideoService(state)
+        state.latest_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        part = next(video_service.generate_frames(width=320))
+
+        jpeg = part[len(b'--frame\r\nContent-Type: image/jpeg\r\n\r\n'):-2]
+        decoded = cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+        assert decoded.shape == (240, 320, 3)
+
+    def test_downscale_reuses_buffer(self):
+        """Test _downscale writes into the previous buffer and never upscales."""
+        import numpy as np
+        from app.services.video import _downscale
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        first = _downscale(frame, 320, None)
+        second = _downscale(frame, 320, first)
+
+        assert first.shape == (240, 320, 3)
+        assert second is first
+        assert _downscale(frame, 1280, None) is frame
+
+    def test_blank_jpeg_is_precomputed(self):
+        """Test the default blank frame is encoded once at import."""
+        from app.services.video import _BLANK_JPEG_BYTES
+        state = StateService()
+        video_service = VideoService(state)
+
+        assert video_service._blank_jpeg() is _BLANK_JPEG_BYTES
+        assert _BLANK_JPEG_BYTES.startswith(b'\xff\xd8')
+
+    def test_blank_jpeg_reencoded_for_custom_settings(self):
+        """Test a custom blank frame size is honoured."""
+        import cv2
+        import numpy as np
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.turbo_jpeg = None
+        video_service.blank_frame_size = (320, 240)
+
+        jpeg = video_service._blank_jpeg()
+        decoded = cv2.imdecode(np.frombuffer(jpeg, np.uint8), cv2.IMREAD_COLOR)
+
+        assert decoded.shape == (240, 320, 3)
+
+    def test_generate_frames_yields_blank_when_idle(self):
+        """Test generate_frames emits the precomputed blank frame with no video."""
+        from app.services.video import _BLANK_JPEG_BYTES
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.frame_timeout = 0.01
+        video_service.blank_frame_timeout = 0.0
+
+        frame_data = next(video_service.generate_frames())
+
+        assert _BLANK_JPEG_BYTES in frame_data
+
+    def test_generate_frames_throttles_blank_frames(self):
+        """Test the idle blank frame is resent at blank_frame_interval, not per wake-up."""
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.frame_timeout = 0.01
+        video_service.blank_frame_timeout = 0.0
+        video_service.blank_frame_interval = 0.1
         generator = video_service.generate_frames()
-        
-        # Get first frame
+
+        next(generator)
+        start = time.monotonic()
+        next(generator)
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_generate_frames_sleeps_until_blank_due(self, monkeypatch):
+        """Test an idle stream waits for the blank frame deadline instead of polling."""
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.blank_frame_timeout = 0.2
+        wait_for_frame = Mock(side_effect=state.wait_for_frame)
+        monkeypatch.setattr(state, 'wait_for_frame', wait_for_frame)
+
+        start = time.monotonic()
+        next(video_service.generate_frames())
+
+        assert time.monotonic() - start >= 0.19
+        assert wait_for_frame.call_count <= 2
+
+    def test_generate_frames_stalled_stream_does_not_spin(self, monkeypatch):
+        """Test a stalled stream (frame kept, no new one) waits frame_timeout per wake-up."""
+        import threading
+        import numpy as np
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.frame_timeout = 0.1
+        video_service.blank_frame_timeout = 0.0  # Blank deadline is always in the past
+        state.latest_frame = np.zeros((48, 64, 3), dtype=np.uint8)
+        generator = video_service.generate_frames()
+        next(generator)
+
+        wait_for_frame = Mock(side_effect=state.wait_for_frame)
+        monkeypatch.setattr(state, 'wait_for_frame', wait_for_frame)
+        viewer = threading.Thread(target=next, args=(generator,), daemon=True)
+        viewer.start()
+        time.sleep(0.35)
+        wakeups = wait_for_frame.call_count
+        state.latest_frame = np.ones((48, 64, 3), dtype=np.uint8)  # Let the viewer finish
+        viewer.join(timeout=1)
+
+        assert wakeups <= 5
+
+    def test_generate_frames_shares_encoding_between_viewers(self, monkeypatch):
+        """Test concurrent viewers of the same frame reuse one JPEG encode."""
+        import numpy as np
+        state = StateService()
+        video_service = VideoService(state)
+        encode = Mock(side_effect=video_service._encode_jpeg_buffer)
+        monkeypatch.setattr(video_service, '_encode_jpeg_buffer', encode)
+        state.latest_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        first_viewer = next(video_service.generate_frames())
+        second_viewer = next(video_service.generate_frames())
+        small_viewer = next(video_service.generate_frames(width=320))
+
+        assert first_viewer is second_viewer
+        assert small_viewer != first_viewer
+        assert encode.call_count == 2  # Full size once, downscaled once
+
+    def test_generate_frames_sends_each_frame_once(self):
+        """Test generate_frames skips frames it has already sent."""
+        import threading
+        import numpy as np
+        state = StateService()
+        video_service = VideoService(state)
+        video_service.turbo_jpeg = None
+        video_service.nvjpeg = None
+        first = np.zeros((480, 640, 3), dtype=np.uint8)
+        second = np.full((480, 640, 3), 255, dtype=np.uint8)
+        state.latest_frame = first
+        generator = video_service.generate_frames()
+
+        assert video_service._encode_jpeg(first) in next(generator)
+        # Publish the next frame from another thread while the generator waits
+        threading.Timer(0.05, setattr, (state, 'latest_frame', second)).start()
         frame_data = next(generator)
-        
-        # Verify MJPEG format
-        assert isinstance(frame_data, bytes)
-        assert b'--frame' in frame_data
-        assert b'Content-Type: image/jpeg' in frame_data
-    
-    def test_generate_frames_fallback_to_latest(self):
-        """Test generate_frames falls back to latest_frame when queue is empty."""
+
+        assert video_service._encode_jpeg(second) in frame_data
+
+    def test_generate_frames_from_latest(self):
+        """Test generate_frames yields the published latest_frame."""
+        import numpy as np
         state = StateService()
         video_service = VideoService(state)
         
-        # Set latest frame but don't add to queue
+        # Publish a frame
         test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
         state.latest_frame = test_frame
         
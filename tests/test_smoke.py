@@ -6,7 +6,6 @@ These tests verify that pytest, fixtures, and async testing are configured prope
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock
 
 
 @pytest.mark.unit
@@ -35,9 +34,9 @@ async def test_async_testing_working():
 
 
 @pytest.mark.unit
-def test_mocking_working():
+def test_mocking_working(fresh_mock):
     """Verify mocking is working."""
-    mock_obj = Mock()
+    mock_obj = fresh_mock
     mock_obj.method.return_value = "mocked"
     
     result = mock_obj.method()
@@ -48,9 +47,9 @@ def test_mocking_working():
 
 @pytest.mark.unit
 @pytest.mark.asyncio
-async def test_async_mocking_working():
+async def test_async_mocking_working(fresh_async_mock):
     """Verify async mocking is working."""
-    mock_obj = AsyncMock()
+    mock_obj = fresh_async_mock
     mock_obj.async_method.return_value = "async_mocked"
     
     result = await mock_obj.async_method()
@@ -64,13 +63,11 @@ def test_gamepad_settings_fixture(default_gamepad_settings):
     """Verify gamepad settings fixture is working."""
     assert default_gamepad_settings is not None
     assert 'deadzone_left_stick' in default_gamepad_settings
-    assert default_gamepad_settings['deadzone_left_stick'] == 0.15
+    assert default_gamepad_settings['deadzone_left_stick'] == pytest.approx(0.15)
 
 
 @pytest.mark.unit
-def test_frame_queue_fixture(frame_queue):
-    """Verify frame queue fixture is working."""
-    assert frame_queue is not None
-    assert frame_queue.maxsize == 30
-    assert frame_queue.empty()
-
+def test_fresh_mock_fixture_is_reset(fresh_mock):
+    """Verify the shared mock starts each test without prior configuration."""
+    assert fresh_mock.method.call_count == 0
+    assert fresh_mock.method.return_value != "mocked"
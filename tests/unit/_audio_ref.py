@@ -0,0 +1,47 @@
+"""
+Reference audio reception logic shared by the audio unit tests.
+
+Mirrors AudioService.recv_audio_stream() without needing StateService or
+PyAudio, so unit tests exercise one implementation instead of redefining it
+inline in every test.
+"""
+
+
+async def recv_audio_stream(frame, output, audio_muted=False, audio_initialized=True):
+    """
+    Hand a received audio frame to the playback writer.
+
+    Args:
+        frame: Packed s16 AudioFrame from WebRTC
+        output: AudioOutput-like object with a push(bytes) method
+        audio_muted: Discard the frame without touching it when True
+        audio_initialized: Discard the frame when PyAudio is not set up
+    """
+    if audio_muted or not audio_initialized:
+        return  # Discard frame before any decoding
+
+    # Hand the plane buffer to the writer thread (no ndarray round-trip,
+    # no executor handoff, copied once into a preallocated ring slot)
+    output.push(frame.planes[0])
+
+
+class AudioState:
+    """
+    Reference model of playback mute and push-to-talk state.
+
+    Mirrors AudioService.toggle_audio() (mute) and start/stop_push_to_talk()
+    (transmit), which are independent of each other.
+    """
+
+    def __init__(self):
+        self.muted = True  # Muted by default
+        self.transmitting = False
+
+    def toggle_mute(self):
+        self.muted = not self.muted
+
+    def start_tx(self):
+        self.transmitting = True
+
+    def stop_tx(self):
+        self.transmitting = False
@@ -0,0 +1,26 @@
+"""
+Reference control math shared by the control unit tests.
+
+Vectorized with NumPy so a whole array of stick inputs is checked in one
+call instead of one scalar per test.
+"""
+
+import numpy as np
+
+
+def apply_deadzone(value, deadzone):
+    """
+    Zero stick input inside the deadzone and rescale the remaining range.
+
+    Args:
+        value: Stick position(s) in [-1, 1] (scalar or array)
+        deadzone: Deadzone radius in [0, 1)
+
+    Returns:
+        np.ndarray: Inputs with |value| < deadzone set to 0.0 and the rest
+        mapped linearly from [deadzone, 1] onto [0, 1], preserving sign
+    """
+    value = np.asarray(value, dtype=np.float64)
+    magnitude = np.abs(value)
+    scaled = np.sign(value) * (magnitude - deadzone) / (1.0 - deadzone)
+    return np.where(magnitude < deadzone, 0.0, scaled)
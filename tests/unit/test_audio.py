@@ -12,11 +12,23 @@ Tests cover:
 
 import pytest
 import asyncio
+import itertools
+import threading
+from collections import deque
 import numpy as np
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from aiortc import MediaStreamTrack
 from av import AudioFrame
 
+from ._audio_ref import AudioState, recv_audio_stream
+
+
+@pytest.fixture(scope="module")
+def silent_audio_frame():
+    """Real 20ms packed s16 stereo frame, built once and shared by the module."""
+    arr = np.zeros((1, 960 * 2), dtype=np.int16)
+    return AudioFrame.from_ndarray(arr, format='s16', layout='stereo')
+
 
 @pytest.mark.unit
 @pytest.mark.audio
@@ -84,210 +96,134 @@ class TestMicrophoneAudioTrack:
         
         result = await mock_recv()
         assert result == mock_audio_data
-    
-    @pytest.mark.asyncio
-    async def test_recv_when_not_transmitting(self):
-        """Test receiving silence when not transmitting."""
-        async def mock_recv_silence():
-            # Should return silence
-            silence = np.zeros((1, 960 * 2), dtype=np.int16)
-            return silence.tobytes()
-        
-        result = await mock_recv_silence()
-        expected_silence = np.zeros((1, 960 * 2), dtype=np.int16).tobytes()
-        assert result == expected_silence
 
 
 @pytest.mark.unit
 @pytest.mark.audio
 @pytest.mark.asyncio
+@pytest.mark.xdist_group("audio")
 class TestAudioReception:
     """Test audio reception from robot (robot → user)."""
     
-    async def test_recv_audio_stream_success(self, mock_pyaudio):
+    async def test_recv_audio_stream_success(self, silent_audio_frame):
         """Test successful audio frame reception and playback."""
-        # Mock audio frame
-        mock_frame = Mock()
-        mock_frame.to_ndarray.return_value = np.zeros(8192, dtype=np.int16)
-        
-        # Mock PyAudio stream
-        mock_stream = Mock()
-        mock_stream.write = Mock()
-        
-        # Simulate recv_audio_stream function
-        async def recv_audio_stream(frame, stream, audio_muted):
-            if audio_muted:
-                return  # Discard frame
-            
-            audio_data = np.frombuffer(frame.to_ndarray(), dtype=np.int16)
-            audio_bytes = audio_data.tobytes()
-            
-            # Use asyncio.to_thread to prevent blocking
-            await asyncio.to_thread(stream.write, audio_bytes)
+        # Mock AudioOutput writer
+        mock_output = Mock()
+        mock_output.push = Mock()
         
         # Test with audio unmuted
-        await recv_audio_stream(mock_frame, mock_stream, audio_muted=False)
-        mock_stream.write.assert_called_once()
+        await recv_audio_stream(silent_audio_frame, mock_output, audio_muted=False)
+        mock_output.push.assert_called_once()
+        pushed = bytes(mock_output.push.call_args[0][0])
+        assert pushed == bytes(silent_audio_frame.planes[0])
+        assert len(pushed) == 960 * 2 * 2
     
-    async def test_recv_audio_stream_when_muted(self, mock_pyaudio):
+    async def test_recv_audio_stream_when_muted(self):
         """Test audio frame reception when muted (should discard)."""
+        # Mock (not silent_audio_frame) so frame access can be asserted on
         mock_frame = Mock()
-        mock_frame.to_ndarray.return_value = np.zeros(8192, dtype=np.int16)
-        
-        mock_stream = Mock()
-        mock_stream.write = Mock()
+        mock_frame.to_ndarray = Mock(return_value=np.zeros(8192, dtype=np.int16))
         
-        async def recv_audio_stream(frame, stream, audio_muted):
-            if audio_muted:
-                return  # Discard frame
-            
-            audio_data = np.frombuffer(frame.to_ndarray(), dtype=np.int16)
-            audio_bytes = audio_data.tobytes()
-            await asyncio.to_thread(stream.write, audio_bytes)
+        mock_output = Mock()
+        mock_output.push = Mock()
         
         # Test with audio muted
-        await recv_audio_stream(mock_frame, mock_stream, audio_muted=True)
-        mock_stream.write.assert_not_called()
+        await recv_audio_stream(mock_frame, mock_output, audio_muted=True)
+        mock_output.push.assert_not_called()
+        mock_frame.to_ndarray.assert_not_called()
     
-    async def test_recv_audio_stream_not_initialized(self):
+    async def test_recv_audio_stream_not_initialized(self, silent_audio_frame):
         """Test audio reception when PyAudio not initialized."""
-        async def recv_audio_stream(frame, audio_initialized):
-            if not audio_initialized:
-                return  # Early return
-            # Process frame...
+        mock_output = Mock()
+        
+        result = await recv_audio_stream(silent_audio_frame, mock_output, audio_initialized=False)
         
-        mock_frame = Mock()
-        result = await recv_audio_stream(mock_frame, audio_initialized=False)
         assert result is None
+        mock_output.push.assert_not_called()
 
-    async def test_blocking_io_with_asyncio_to_thread(self, mock_pyaudio):
-        """Test that blocking PyAudio operations use asyncio.to_thread()."""
-        mock_stream = Mock()
-        mock_stream.write = Mock()
-
-        # Simulate blocking write operation
-        async def write_with_thread(data):
-            # This should use asyncio.to_thread() to prevent blocking
-            await asyncio.to_thread(mock_stream.write, data)
-
-        test_data = b'\x00' * 8192
-        await write_with_thread(test_data)
-
-        mock_stream.write.assert_called_once_with(test_data)
-
-
-@pytest.mark.unit
-@pytest.mark.audio
-class TestAudioMuteUnmute:
-    """Test audio mute/unmute functionality."""
-
-    def test_audio_starts_muted(self):
-        """Test that audio starts in muted state."""
-        audio_muted = True
-        assert audio_muted is True
-
-    def test_unmute_audio(self):
-        """Test unmuting audio."""
-        audio_muted = True
-        audio_streaming_enabled = False
+    async def test_blocking_write_on_writer_thread(self, mock_pyaudio):
+        """Test that blocking PyAudio writes run on the dedicated writer thread."""
+        stream = mock_pyaudio.open()
+        written = threading.Event()
+        writer_threads = []
 
-        # Unmute
-        audio_streaming_enabled = True
-        audio_muted = not audio_streaming_enabled
+        def write(data):
+            writer_threads.append(threading.current_thread())
+            written.set()
 
-        assert audio_streaming_enabled is True
-        assert audio_muted is False
+        stream.write = Mock(side_effect=write)
 
-    def test_mute_audio(self):
-        """Test muting audio."""
-        audio_muted = False
-        audio_streaming_enabled = True
+        # Simplified AudioOutput: bounded buffer drained by one thread
+        buffer = deque(maxlen=10)
+        wakeup = threading.Event()
 
-        # Mute
-        audio_streaming_enabled = False
-        audio_muted = not audio_streaming_enabled
+        def drain():
+            wakeup.wait()
+            while buffer:
+                stream.write(buffer.popleft())
 
-        assert audio_streaming_enabled is False
-        assert audio_muted is True
+        writer = threading.Thread(target=drain, daemon=True)
+        writer.start()
 
-    def test_toggle_audio_multiple_times(self):
-        """Test toggling audio multiple times."""
-        audio_muted = True
+        # Producer side never blocks
+        test_data = b'\x00' * 3840
+        buffer.append(test_data)
+        wakeup.set()
 
-        # Toggle 1: unmute
-        audio_muted = False
-        assert audio_muted is False
+        assert written.wait(timeout=1.0)
+        writer.join(timeout=1.0)
+        stream.write.assert_called_once_with(test_data)
+        assert writer_threads == [writer]
 
-        # Toggle 2: mute
-        audio_muted = True
-        assert audio_muted is True
 
-        # Toggle 3: unmute
-        audio_muted = False
-        assert audio_muted is False
+# Every operation sequence up to this length is checked against the invariants
+MAX_SEQUENCE_LENGTH = 5
+AUDIO_STATE_OPS = ('toggle_mute', 'start_tx', 'stop_tx')
 
 
 @pytest.mark.unit
 @pytest.mark.audio
-class TestPushToTalk:
-    """Test push-to-talk functionality."""
-
-    def test_push_to_talk_starts_inactive(self):
-        """Test that push-to-talk starts inactive."""
-        push_to_talk_active = False
-        assert push_to_talk_active is False
-
-    def test_activate_push_to_talk(self):
-        """Test activating push-to-talk (C key pressed)."""
-        push_to_talk_active = False
-
-        # Activate
-        push_to_talk_active = True
+class TestAudioStateMachine:
+    """Test mute and push-to-talk state over all short operation sequences."""
 
-        assert push_to_talk_active is True
-
-    def test_deactivate_push_to_talk(self):
-        """Test deactivating push-to-talk (C key released)."""
-        push_to_talk_active = True
-
-        # Deactivate
-        push_to_talk_active = False
-
-        assert push_to_talk_active is False
-
-    def test_push_to_talk_with_microphone_track(self):
-        """Test push-to-talk with MicrophoneAudioTrack."""
-        class MockMicrophoneTrack:
-            def __init__(self):
-                self.is_transmitting = False
+    def test_initial_state(self):
+        """Test audio starts muted and push-to-talk starts inactive."""
+        state = AudioState()
+        assert state.muted is True
+        assert state.transmitting is False
 
-            def start_transmitting(self):
-                self.is_transmitting = True
+    @pytest.mark.asyncio
+    async def test_invariants_hold_for_all_sequences(self, silent_audio_frame):
+        """Test invariants after every sequence of mute/push-to-talk operations."""
+        for length in range(MAX_SEQUENCE_LENGTH + 1):
+            for ops in itertools.product(AUDIO_STATE_OPS, repeat=length):
+                state = AudioState()
+                output = Mock()
 
-            def stop_transmitting(self):
-                self.is_transmitting = False
+                for op in ops:
+                    getattr(state, op)()
 
-        track = MockMicrophoneTrack()
+                # Mute follows toggle parity; push-to-talk follows the last tx op
+                tx_ops = [op for op in ops if op != 'toggle_mute']
+                assert state.muted is (ops.count('toggle_mute') % 2 == 0), ops
+                assert state.transmitting is (bool(tx_ops) and tx_ops[-1] == 'start_tx'), ops
 
-        # Start push-to-talk
-        track.start_transmitting()
-        assert track.is_transmitting is True
-
-        # Stop push-to-talk
-        track.stop_transmitting()
-        assert track.is_transmitting is False
+                # Never play back while muted, always play back when unmuted
+                await recv_audio_stream(silent_audio_frame, output, audio_muted=state.muted)
+                assert output.push.called is (not state.muted), ops
 
 
 @pytest.mark.unit
 @pytest.mark.audio
+@pytest.mark.xdist_group("audio")
 class TestPyAudioIntegration:
     """Test PyAudio integration."""
 
-    def test_pyaudio_initialization(self, mock_pyaudio):
+    def test_pyaudio_initialization(self, mock_pyaudio_fast):
         """Test PyAudio initialization."""
-        assert mock_pyaudio is not None
-        assert hasattr(mock_pyaudio, 'open')
-        assert hasattr(mock_pyaudio, 'terminate')
+        assert mock_pyaudio_fast is not None
+        assert hasattr(mock_pyaudio_fast, 'open')
+        assert hasattr(mock_pyaudio_fast, 'terminate')
 
     def test_pyaudio_stream_open(self, mock_pyaudio):
         """Test opening PyAudio stream."""
@@ -310,9 +246,9 @@ class TestPyAudioIntegration:
         stream.write(test_data)
         stream.write.assert_called_once_with(test_data)
 
-    def test_pyaudio_stream_read(self, mock_pyaudio):
+    def test_pyaudio_stream_read(self, mock_pyaudio_fast):
         """Test reading from PyAudio stream."""
-        stream = mock_pyaudio.open()
+        stream = mock_pyaudio_fast.open()
 
         data = stream.read(960)
 
@@ -12,7 +12,16 @@ Tests cover:
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-import threading
+from typing import NamedTuple
+
+
+class ConnectionSpec(NamedTuple):
+    """Connection parameters for one robot (compact and immutable, unlike a dict)."""
+    method: str
+    ip: str = ""
+    serial_number: str = ""
+    username: str = ""
+    password: str = ""
 
 
 @pytest.mark.unit
@@ -20,21 +29,15 @@ import threading
 class TestConnectionInitialization:
     """Test connection initialization and setup."""
     
-    def test_connection_starts_as_none(self):
-        """Test that connection starts as None."""
+    @pytest.mark.parametrize("val,expected", [
+        (None, None),
+        (None, None),
+        (False, False),
+    ], ids=["connection", "event_loop", "is_connected"])
+    def test_initial_values(self, val, expected):
+        """Test that connection, event loop and is_connected start unset."""
         # This will be replaced with actual import when we refactor
-        connection = None
-        assert connection is None
-    
-    def test_event_loop_starts_as_none(self):
-        """Test that event loop starts as None."""
-        event_loop = None
-        assert event_loop is None
-    
-    def test_is_connected_starts_as_false(self):
-        """Test that is_connected flag starts as False."""
-        is_connected = False
-        assert is_connected is False
+        assert val is expected
 
 
 @pytest.mark.unit
@@ -55,27 +58,16 @@ class TestEventLoopManagement:
         assert not loop.is_running()
         loop.close()
     
-    def test_event_loop_in_thread(self):
+    def test_event_loop_in_thread(self, bg_loop):
         """Test running event loop in separate thread."""
-        loop = asyncio.new_event_loop()
-        
-        def run_loop():
-            asyncio.set_event_loop(loop)
-            loop.run_forever()
-        
-        thread = threading.Thread(target=run_loop, daemon=True)
-        thread.start()
-        
-        # Give thread time to start
-        import time
-        time.sleep(0.1)
+        assert bg_loop.is_running()
         
-        assert thread.is_alive()
+        # Coroutines scheduled from this thread run on the loop thread
+        async def get_loop():
+            return asyncio.get_running_loop()
         
-        # Stop the loop
-        loop.call_soon_threadsafe(loop.stop)
-        thread.join(timeout=1)
-        loop.close()
+        future = asyncio.run_coroutine_threadsafe(get_loop(), bg_loop)
+        assert future.result(timeout=1) is bg_loop
 
 
 @pytest.mark.unit
@@ -133,44 +125,24 @@ class TestRobotInitialization:
 class TestConnectionMethods:
     """Test connection method validation."""
     
-    def test_valid_connection_methods(self):
-        """Test valid connection methods."""
-        valid_methods = ['LocalSTA', 'LocalAP', 'Remote']
-        
-        for method in valid_methods:
-            assert method in ['LocalSTA', 'LocalAP', 'Remote']
-    
-    def test_localsta_requires_ip(self):
-        """Test LocalSTA connection requires IP address."""
-        connection_data = {
-            'method': 'LocalSTA',
-            'ip': '192.168.1.100'
-        }
-        
-        assert connection_data['method'] == 'LocalSTA'
-        assert connection_data['ip'] != ''
-    
-    def test_localap_requires_serial(self):
-        """Test LocalAP connection requires serial number."""
-        connection_data = {
-            'method': 'LocalAP',
-            'serial_number': 'B42D2000XXXXXXXX'
-        }
-        
-        assert connection_data['method'] == 'LocalAP'
-        assert connection_data['serial_number'] != ''
-    
-    def test_remote_requires_credentials(self):
-        """Test Remote connection requires username and password."""
-        connection_data = {
-            'method': 'Remote',
-            'username': 'user@example.com',
-            'password': 'password123'
-        }
-        
-        assert connection_data['method'] == 'Remote'
-        assert connection_data['username'] != ''
-        assert connection_data['password'] != ''
+    @pytest.mark.parametrize("spec,required", [
+        (ConnectionSpec('LocalSTA', ip='192.168.1.100'), ['ip']),
+        (ConnectionSpec('LocalAP', serial_number='B42D2000XXXXXXXX'), ['serial_number']),
+        (ConnectionSpec('Remote', username='user@example.com', password='password123'),
+         ['username', 'password']),
+    ], ids=["localsta_requires_ip", "localap_requires_serial", "remote_requires_credentials"])
+    def test_connection_method_requirements(self, spec, required):
+        """Test each connection method is valid and carries its required fields."""
+        assert spec.method in ['LocalSTA', 'LocalAP', 'Remote']
+        for field in required:
+            assert getattr(spec, field)
+
+    def test_connection_spec_is_immutable(self):
+        """Test connection specs can't be modified after construction."""
+        spec = ConnectionSpec('LocalSTA', ip='192.168.1.100')
+
+        with pytest.raises(AttributeError):
+            spec.ip = '10.0.0.1'
 
 
 @pytest.mark.unit
@@ -232,25 +204,64 @@ class TestConnectionLifecycle:
         # Should have been called twice (initial + reconnect)
         assert mock_webrtc_connection.connect.call_count == 2
 
+    async def test_mock_rejects_unknown_attributes(self, mock_webrtc_connection):
+        """Test the autospecced mock catches misspelled attributes."""
+        with pytest.raises(AttributeError):
+            mock_webrtc_connection.conect = AsyncMock()
+
+
+# (state, event, expected next state); pairs not listed must leave the state unchanged
+TRANSITIONS_CASES = [
+    ('DISCONNECTED', 'CONNECT', 'CONNECTING'),
+    ('CONNECTING', 'ESTABLISHED', 'CONNECTED'),
+    ('CONNECTING', 'FAILED', 'DISCONNECTED'),
+    ('CONNECTING', 'DISCONNECT', 'CLOSING'),
+    ('CONNECTED', 'FAILED', 'DISCONNECTED'),
+    ('CONNECTED', 'DISCONNECT', 'CLOSING'),
+    ('CLOSING', 'CLOSED', 'DISCONNECTED'),
+    ('CLOSING', 'FAILED', 'DISCONNECTED'),
+]
+
+INVALID_CASES = [
+    ('DISCONNECTED', 'ESTABLISHED'),
+    ('DISCONNECTED', 'DISCONNECT'),
+    ('CONNECTED', 'CONNECT'),
+    ('CLOSING', 'CONNECT'),
+]
+
 
 @pytest.mark.unit
 @pytest.mark.connection
 class TestConnectionState:
     """Test connection state management."""
 
-    def test_connection_state_transitions(self):
-        """Test connection state transitions."""
-        # Initial state
-        is_connected = False
-        assert is_connected is False
+    @pytest.mark.parametrize("cur,event,expected", TRANSITIONS_CASES)
+    def test_connection_state_transitions(self, cur, event, expected):
+        """Test each valid transition in the connection state table."""
+        from app.services.connection import ConnectionService, ConnState, ConnEvent
 
-        # After connection
-        is_connected = True
-        assert is_connected is True
+        service = ConnectionService(Mock())
+        service.conn_state = ConnState[cur]
 
-        # After disconnection
-        is_connected = False
-        assert is_connected is False
+        assert service.handle_event(ConnEvent[event]) is ConnState[expected]
+        assert service.conn_state is ConnState[expected]
+
+    @pytest.mark.parametrize("cur,event", INVALID_CASES)
+    def test_invalid_transition_is_ignored(self, cur, event):
+        """Test invalid transitions leave the state unchanged."""
+        from app.services.connection import ConnectionService, ConnState, ConnEvent
+
+        service = ConnectionService(Mock())
+        service.conn_state = ConnState[cur]
+
+        assert service.handle_event(ConnEvent[event]) is ConnState[cur]
+
+    def test_transition_table_matches_cases(self):
+        """Test the production table has exactly the expected transitions."""
+        from app.services.connection import _TRANSITIONS
+
+        table = {(s.name, e.name): n.name for (s, e), n in _TRANSITIONS.items()}
+        assert table == {(cur, event): expected for cur, event, expected in TRANSITIONS_CASES}
 
     def test_connection_object_lifecycle(self):
         """Test connection object lifecycle."""
@@ -273,32 +284,17 @@ class TestConnectionState:
 class TestConnectionErrorHandling:
     """Test connection error handling."""
 
-    async def test_connection_timeout(self, mock_webrtc_connection):
-        """Test connection timeout handling."""
-        mock_webrtc_connection.connect.side_effect = asyncio.TimeoutError("Connection timeout")
-
-        with pytest.raises(asyncio.TimeoutError):
-            await mock_webrtc_connection.connect()
-
-    async def test_connection_network_error(self, mock_webrtc_connection):
-        """Test network error handling."""
-        mock_webrtc_connection.connect.side_effect = ConnectionError("Network unreachable")
-
-        with pytest.raises(ConnectionError):
-            await mock_webrtc_connection.connect()
-
-    async def test_invalid_credentials(self, mock_webrtc_connection):
-        """Test invalid credentials handling."""
-        mock_webrtc_connection.connect.side_effect = PermissionError("Invalid credentials")
-
-        with pytest.raises(PermissionError):
-            await mock_webrtc_connection.connect()
-
-    async def test_robot_not_found(self, mock_webrtc_connection):
-        """Test robot not found error."""
-        mock_webrtc_connection.connect.side_effect = ValueError("Robot not found")
-
-        with pytest.raises(ValueError):
+    @pytest.mark.parametrize("exc", [
+        asyncio.TimeoutError("Connection timeout"),
+        ConnectionError("Network unreachable"),
+        PermissionError("Invalid credentials"),
+        ValueError("Robot not found"),
+    ], ids=["timeout", "network_error", "invalid_credentials", "robot_not_found"])
+    async def test_connect_raises(self, mock_webrtc_connection, exc):
+        """Test connection errors propagate with their original type."""
+        mock_webrtc_connection.connect.side_effect = exc
+
+        with pytest.raises(type(exc)):
             await mock_webrtc_connection.connect()
 
 
@@ -311,25 +307,44 @@ class TestConcurrentConnections:
     async def test_prevent_multiple_connections(self):
         """Test preventing multiple simultaneous connections."""
         is_connected = False
-        connection_lock = asyncio.Lock()
 
-        async def connect_with_lock():
+        async def connect_no_lock():
+            # GIL-protected test-and-set: no await between the check and the set,
+            # so no other coroutine can interleave and no asyncio.Lock is needed
             nonlocal is_connected
-            async with connection_lock:
-                if is_connected:
-                    raise RuntimeError("Already connected")
-                is_connected = True
-                await asyncio.sleep(0.01)  # Simulate connection time
-                return True
+            if is_connected:
+                raise RuntimeError("Already connected")
+            is_connected = True
+            await asyncio.sleep(0.01)  # Simulate connection time
+            return True
 
         # First connection should succeed
-        result = await connect_with_lock()
+        result = await connect_no_lock()
         assert result is True
         assert is_connected is True
 
         # Second connection should fail
         with pytest.raises(RuntimeError, match="Already connected"):
-            await connect_with_lock()
+            await connect_no_lock()
+
+    async def test_concurrent_connect_attempts_only_one_wins(self):
+        """Test concurrent attempts scheduled together cannot both pass the check."""
+        is_connected = False
+
+        async def connect_no_lock():
+            nonlocal is_connected
+            if is_connected:
+                raise RuntimeError("Already connected")
+            is_connected = True
+            await asyncio.sleep(0.01)
+            return True
+
+        results = await asyncio.gather(
+            connect_no_lock(), connect_no_lock(), return_exceptions=True
+        )
+
+        assert results.count(True) == 1
+        assert sum(isinstance(r, RuntimeError) for r in results) == 1
 
     async def test_connection_cleanup_on_error(self, mock_webrtc_connection):
         """Test connection cleanup when error occurs."""
@@ -7,30 +7,36 @@ This ensures that refactoring doesn't break the critical path of command executi
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
-from app.services import StateService, ControlService
 
 
 class TestMovementCommandFlow:
     """Test the complete movement command flow."""
 
-    @pytest.fixture
-    def state(self):
-        """Create a state service for testing."""
-        state = StateService()
+    @pytest.fixture(scope="class")
+    def state(self, services):
+        """Create a state service shared by the tests in this class."""
+        return services.StateService()
+
+    @pytest.fixture(scope="class")
+    def control_service(self, services, state):
+        """Create a control service shared by the tests in this class."""
+        return services.ControlService(state)
+
+    @pytest.fixture(autouse=True)
+    def _reset(self, state, control_service):
+        """Restore connected, gamepad-enabled state before each test."""
         state.is_connected = True
         state.gamepad_enabled = True
-        return state
-
-    @pytest.fixture
-    def control_service(self, state):
-        """Create a control service for testing."""
-        return ControlService(state)
+        state.keyboard_mouse_enabled = False
+        state.emergency_stop_active = False
+        state.zero_velocity_sent = False
+        state.event_loop = None
+        control_service.reset_slew_rate_limiter()
 
-    def test_process_and_send_gamepad_command(self, control_service, state):
+    def test_process_and_send_gamepad_command(self, control_service, state, running_event_loop):
         """Test that gamepad commands are processed and sent correctly."""
-        # Setup: Create event loop
-        state.event_loop = Mock()
-        state.event_loop.is_running.return_value = True
+        # Setup: Running event loop
+        state.event_loop = running_event_loop
         
         # Process command
         data = {'lx': 0.5, 'ly': 0.5, 'rx': 0.0, 'ry': 0.0}
@@ -55,11 +61,10 @@ class TestMovementCommandFlow:
         assert send_result['status'] == 'success'
         assert 'scheduled' in send_result['message'].lower()
 
-    def test_process_and_send_keyboard_mouse_command(self, control_service, state):
+    def test_process_and_send_keyboard_mouse_command(self, control_service, state, running_event_loop):
         """Test that keyboard/mouse commands are processed and sent correctly."""
-        # Setup: Create event loop and enable keyboard/mouse
-        state.event_loop = Mock()
-        state.event_loop.is_running.return_value = True
+        # Setup: Running event loop and keyboard/mouse enabled
+        state.event_loop = running_event_loop
         state.gamepad_enabled = False
         state.keyboard_mouse_enabled = True
 
@@ -90,11 +95,10 @@ class TestMovementCommandFlow:
         # Verify sending succeeded
         assert send_result['status'] == 'success'
 
-    def test_zero_velocity_command_not_sent_twice(self, control_service, state):
+    def test_zero_velocity_command_not_sent_twice(self, control_service, state, running_event_loop):
         """Test that zero velocity commands are only sent once."""
         # Setup
-        state.event_loop = Mock()
-        state.event_loop.is_running.return_value = True
+        state.event_loop = running_event_loop
         
         # First zero velocity command
         data = {'lx': 0.0, 'ly': 0.0, 'rx': 0.0, 'ry': 0.0}
@@ -111,11 +115,10 @@ class TestMovementCommandFlow:
         assert result2['zero_velocity'] is True
         assert result2['should_send'] is False  # Second time should NOT send
 
-    def test_send_command_fails_when_event_loop_not_running(self, control_service, state):
+    def test_send_command_fails_when_event_loop_not_running(self, control_service, state, stopped_event_loop):
         """Test that sending fails gracefully when event loop is not running."""
         # Setup: Event loop not running
-        state.event_loop = Mock()
-        state.event_loop.is_running.return_value = False
+        state.event_loop = stopped_event_loop
         
         # Try to send command (lx, ly, rx, ry, is_zero_velocity)
         send_result = control_service.send_movement_command_sync(0.5, 0.0, 0.0, 0.0, False)
@@ -3,9 +3,8 @@ Unit tests for video streaming functionality.
 
 Tests cover:
 - Video frame reception (robot → user)
-- Frame buffering and queue management
+- Latest-frame handoff via StateService.wait_for_frame
 - JPEG encoding
-- Frame dropping when queue is full
 - Thread-safe frame access with locks
 - Video streaming route
 """
@@ -15,79 +14,63 @@ import asyncio
 import numpy as np
 import cv2
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from queue import Queue, Empty
 import threading
 import time
 
+from app.services import StateService
+
 
 @pytest.mark.unit
 @pytest.mark.video
-class TestFrameQueue:
-    """Test frame queue management."""
-    
-    def test_frame_queue_initialization(self, frame_queue):
-        """Test frame queue initialization with maxsize=30."""
-        assert frame_queue is not None
-        assert frame_queue.maxsize == 30
-        assert frame_queue.empty()
+class TestFrameHandoff:
+    """Test the latest-frame handoff between the decoder and MJPEG consumers."""
     
-    def test_add_frame_to_queue(self, frame_queue):
-        """Test adding a frame to the queue."""
+    def test_wait_for_frame_returns_published_frame(self):
+        """Test a consumer gets the frame published after its last sequence number."""
+        state = StateService()
         test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
         
-        frame_queue.put(test_frame)
+        state.latest_frame = test_frame
+        frame, seq = state.wait_for_frame(None, timeout=0.1)
         
-        assert not frame_queue.empty()
-        assert frame_queue.qsize() == 1
+        assert frame is test_frame
+        assert seq == state.frame_seq == 1
     
-    def test_get_frame_from_queue(self, frame_queue):
-        """Test getting a frame from the queue."""
-        test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        frame_queue.put(test_frame)
+    def test_newer_frame_replaces_unsent_one(self):
+        """Test frames published before the consumer wakes are not queued."""
+        state = StateService()
+        frames = [np.full((480, 640, 3), i, dtype=np.uint8) for i in range(3)]
         
-        retrieved_frame = frame_queue.get()
+        for frame in frames:
+            state.latest_frame = frame
+        frame, seq = state.wait_for_frame(0, timeout=0.1)
         
-        assert retrieved_frame is not None
-        assert np.array_equal(retrieved_frame, test_frame)
-        assert frame_queue.empty()
+        assert frame is frames[-1]
+        assert seq == 3
     
-    def test_queue_full_behavior(self, frame_queue):
-        """Test queue behavior when full."""
-        # Fill the queue
-        for i in range(30):
-            frame = np.zeros((480, 640, 3), dtype=np.uint8)
-            frame_queue.put(frame)
+    def test_wait_for_frame_times_out_without_new_frame(self):
+        """Test the consumer gets its own sequence number back when no frame arrives."""
+        state = StateService()
+        state.latest_frame = np.zeros((480, 640, 3), dtype=np.uint8)
         
-        assert frame_queue.full()
-        assert frame_queue.qsize() == 30
-    
-    def test_drop_old_frame_when_full(self, frame_queue):
-        """Test dropping old frame when queue is full."""
-        # Fill the queue
-        for i in range(30):
-            frame = np.zeros((480, 640, 3), dtype=np.uint8)
-            frame_queue.put(frame)
+        start = time.monotonic()
+        _, seq = state.wait_for_frame(state.frame_seq, timeout=0.05)
         
-        # Queue is full, remove old frame
-        if frame_queue.full():
-            try:
-                frame_queue.get_nowait()
-            except Empty:
-                pass
-        
-        # Add new frame
-        new_frame = np.ones((480, 640, 3), dtype=np.uint8)
-        frame_queue.put(new_frame)
-        
-        assert frame_queue.qsize() == 30
+        assert seq == 1
+        assert time.monotonic() - start >= 0.04
     
-    def test_queue_empty_exception(self, frame_queue):
-        """Test getting from empty queue raises Empty exception."""
-        assert frame_queue.empty()
+    def test_wait_for_frame_wakes_on_publish(self):
+        """Test a waiting consumer wakes as soon as another thread publishes."""
+        state = StateService()
+        test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        publisher = threading.Timer(0.05, setattr, (state, 'latest_frame', test_frame))
         
-        with pytest.raises(Empty):
-            frame_queue.get_nowait()
-
+        publisher.start()
+        frame, seq = state.wait_for_frame(0, timeout=5)
+        publisher.join()
+        
+        assert frame is test_frame
+        assert seq == 1
 
 @pytest.mark.unit
 @pytest.mark.video
@@ -135,18 +118,18 @@ class TestLatestFrame:
 
 @pytest.mark.unit
 @pytest.mark.video
-@pytest.mark.asyncio
 class TestVideoReception:
     """Test video frame reception from robot."""
     
-    async def test_recv_camera_stream_success(self, frame_queue):
+    @pytest.mark.asyncio
+    async def test_recv_camera_stream_success(self):
         """Test successful video frame reception."""
-        # Mock video track
-        mock_track = AsyncMock()
-        mock_frame = Mock()
+        # Only recv() is awaited, so only recv() needs to be an AsyncMock
         test_img = np.zeros((480, 640, 3), dtype=np.uint8)
+        mock_frame = Mock()
         mock_frame.to_ndarray.return_value = test_img
-        mock_track.recv.return_value = mock_frame
+        mock_track = Mock()
+        mock_track.recv = AsyncMock(return_value=mock_frame)
         
         # Simulate receiving one frame
         frame = await mock_track.recv()
@@ -155,23 +138,7 @@ class TestVideoReception:
         assert img is not None
         assert img.shape == (480, 640, 3)
     
-    async def test_recv_camera_stream_adds_to_queue(self, frame_queue):
-        """Test that received frames are added to queue."""
-        test_img = np.zeros((480, 640, 3), dtype=np.uint8)
-        
-        # Add frame to queue
-        if frame_queue.full():
-            try:
-                frame_queue.get_nowait()
-            except Empty:
-                pass
-        
-        frame_queue.put(test_img)
-
-        assert not frame_queue.empty()
-        assert frame_queue.qsize() == 1
-
-    async def test_recv_camera_stream_updates_latest_frame(self):
+    def test_recv_camera_stream_updates_latest_frame(self):
         """Test that received frames update latest_frame."""
         latest_frame = None
         frame_lock = threading.Lock()
@@ -184,10 +151,11 @@ class TestVideoReception:
         assert latest_frame is not None
         assert np.array_equal(latest_frame, test_img)
 
+    @pytest.mark.asyncio
     async def test_recv_camera_stream_error_handling(self):
         """Test error handling during video reception."""
-        mock_track = AsyncMock()
-        mock_track.recv.side_effect = Exception("Video stream error")
+        mock_track = Mock()
+        mock_track.recv = AsyncMock(side_effect=Exception("Video stream error"))
 
         with pytest.raises(Exception, match="Video stream error"):
             await mock_track.recv()
@@ -208,6 +176,19 @@ class TestJPEGEncoding:
         assert buffer is not None
         assert len(buffer) > 0
 
+    def test_encode_frame_to_jpeg_turbojpeg(self):
+        """Test encoding a frame with libjpeg-turbo (optional PyTurboJPEG)."""
+        turbojpeg = pytest.importorskip("turbojpeg")
+        try:
+            encoder = turbojpeg.TurboJPEG()
+        except (OSError, RuntimeError):
+            pytest.skip("libjpeg-turbo shared library not installed")
+        test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+
+        jpeg_bytes = encoder.encode(test_frame, quality=85, pixel_format=turbojpeg.TJPF_BGR)
+
+        assert jpeg_bytes[:2] == b'\xff\xd8'
+
     def test_jpeg_quality_setting(self):
         """Test JPEG encoding with quality setting."""
         test_frame = np.random.randint(0, 255, (480, 640, 3), dtype=np.uint8)
@@ -249,38 +230,6 @@ class TestJPEGEncoding:
 class TestFrameGeneration:
     """Test frame generation for MJPEG streaming."""
 
-    def test_generate_frames_from_queue(self, frame_queue):
-        """Test generating frames from queue."""
-        test_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        frame_queue.put(test_frame)
-
-        # Get frame from queue
-        try:
-            frame_to_send = frame_queue.get(timeout=0.1)
-        except Empty:
-            frame_to_send = None
-
-        assert frame_to_send is not None
-        assert np.array_equal(frame_to_send, test_frame)
-
-    def test_generate_frames_fallback_to_latest(self, frame_queue):
-        """Test falling back to latest_frame when queue is empty."""
-        latest_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        frame_lock = threading.Lock()
-
-        # Queue is empty, use latest_frame
-        try:
-            frame_to_send = frame_queue.get(timeout=0.1)
-        except Empty:
-            with frame_lock:
-                if latest_frame is not None:
-                    frame_to_send = latest_frame.copy()
-                else:
-                    frame_to_send = None
-
-        assert frame_to_send is not None
-        assert np.array_equal(frame_to_send, latest_frame)
-
     def test_generate_blank_frame_when_waiting(self):
         """Test generating blank 'waiting' frame when no video."""
         blank_frame = np.zeros((480, 640, 3), dtype=np.uint8)
@@ -309,47 +258,6 @@ class TestVideoCleanup:
 
         assert latest_frame is None
 
-    def test_clear_frame_queue(self, frame_queue):
-        """Test clearing frame queue on disconnect."""
-        # Add some frames
-        for i in range(5):
-            frame = np.zeros((480, 640, 3), dtype=np.uint8)
-            frame_queue.put(frame)
-
-        assert frame_queue.qsize() == 5
-
-        # Clear the queue
-        while not frame_queue.empty():
-            try:
-                frame_queue.get_nowait()
-            except Empty:
-                break
-
-        assert frame_queue.empty()
-
-    def test_cleanup_all_video_resources(self, frame_queue):
-        """Test complete video resource cleanup."""
-        latest_frame = np.zeros((480, 640, 3), dtype=np.uint8)
-        frame_lock = threading.Lock()
-
-        # Add frames to queue
-        for i in range(3):
-            frame = np.zeros((480, 640, 3), dtype=np.uint8)
-            frame_queue.put(frame)
-
-        # Cleanup
-        with frame_lock:
-            latest_frame = None
-
-        while not frame_queue.empty():
-            try:
-                frame_queue.get_nowait()
-            except Empty:
-                break
-
-        assert latest_frame is None
-        assert frame_queue.empty()
-
 
 @pytest.mark.unit
 @pytest.mark.video
@@ -383,17 +291,3 @@ class TestVideoErrorHandling:
         # OpenCV raises cv2.error for empty frames
         with pytest.raises(cv2.error):
             cv2.imencode('.jpg', invalid_frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-
-    def test_queue_timeout_handling(self, frame_queue):
-        """Test handling queue timeout when empty."""
-        assert frame_queue.empty()
-
-        # Try to get with timeout
-        try:
-            frame = frame_queue.get(timeout=0.1)
-            frame_to_send = frame
-        except Empty:
-            frame_to_send = None
-
-        assert frame_to_send is None
-
@@ -23,7 +23,7 @@ aioice.Connection = Connection  # type: ignore
 
 import aiortc
 import logging
-from packaging.version import Version
+import re
 
 
 # ============================================================================
@@ -50,6 +50,7 @@ from packaging.version import Version
 from aiortc import RTCPeerConnection
 
 _original_remoteRtp = RTCPeerConnection._RTCPeerConnection__remoteRtp  # type: ignore
+_remoteDescription = RTCPeerConnection._RTCPeerConnection__remoteDescription  # type: ignore
 
 
 def __remoteRtp_with_null_check(self, transceiver):
@@ -58,37 +59,43 @@ def __remoteRtp_with_null_check(self, transceiver):
     This prevents the race condition where __connect() task tries to access
     __remoteDescription().media before the remote description is fully set.
     """
-    try:
-        # Check if remote description is set before accessing it
-        remote_desc = self._RTCPeerConnection__remoteDescription()  # type: ignore
-        if remote_desc is None:
-            logging.debug(f"__remoteRtp called but remote description is None, skipping for now")
-            return
+    # Check if remote description is set before accessing it
+    if _remoteDescription(self) is None:
+        logging.debug("__remoteRtp called but remote description is None, skipping for now")
+        return None
 
-        # Call the original method
+    try:
         return _original_remoteRtp(self, transceiver)
-
     except AttributeError as e:
-        # If we still get an AttributeError, log it but don't crash
-        logging.debug(f"Race condition in __remoteRtp: {e}")
-        return
+        # Still racing on other half-initialized state: skip this call, but
+        # log loudly enough that a real regression isn't hidden
+        logging.warning(f"Race condition in __remoteRtp: {e}")
+        return None
 
 
 # Apply the monkey patch
 RTCPeerConnection._RTCPeerConnection__remoteRtp = __remoteRtp_with_null_check  # type: ignore
 
 
-if Version(aiortc.__version__) == Version("1.10.0"):
+def _release_tuple(version):
+    """(major, minor, micro) from a version string, ignoring pre-release suffixes like 'rc1'."""
+    match = re.match(r"(\d+)(?:\.(\d+))?(?:\.(\d+))?", version)
+    return tuple(int(part or 0) for part in match.groups()) if match else (0, 0, 0)
+
+
+_AIORTC_VERSION = _release_tuple(aiortc.__version__)
+
+if _AIORTC_VERSION == (1, 10, 0):
     X509_DIGEST_ALGORITHMS = {
         "sha-256": "SHA256",
     }
     aiortc.rtcdtlstransport.X509_DIGEST_ALGORITHMS = X509_DIGEST_ALGORITHMS
 
-elif Version(aiortc.__version__) >= Version("1.11.0"):
-    # Syntax changed in aiortc 1.11.0, so we need to use the hashes module
-    from cryptography.hazmat.primitives import hashes
-
+elif _AIORTC_VERSION >= (1, 11, 0):
+    # Syntax changed in aiortc 1.11.0: values are HashAlgorithm instances
+    # (certificate.fingerprint() rejects the bare class). Reuse aiortc's own
+    # SHA256 instance rather than building another one.
     X509_DIGEST_ALGORITHMS = {
-        "sha-256": hashes.SHA256(),  # type: ignore
+        "sha-256": aiortc.rtcdtlstransport.X509_DIGEST_ALGORITHMS["sha-256"],
     }
     aiortc.rtcdtlstransport.X509_DIGEST_ALGORITHMS = X509_DIGEST_ALGORITHMS
\ No newline at end of file
@@ -9,6 +9,13 @@ import sys
 from Crypto.PublicKey import RSA
 from .encryption import aes_encrypt, generate_aes_key, rsa_encrypt, aes_decrypt, rsa_load_public_key
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from requests.adapters import HTTPAdapter
+
+# Shared session for the Unitree cloud API: login, public key, TURN info and
+# SDP exchange hit the same host back-to-back, so keep-alive lets them reuse
+# one TLS connection instead of handshaking for every call
+_REMOTE_SESSION = requests.Session()
+_REMOTE_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
 
 def decrypt_con_notify_data(encrypted_b64: str) -> str:
     key = bytes([232, 86, 130, 189, 22, 84, 155, 0, 142, 4, 166, 104, 43, 179, 235, 227])
@@ -109,11 +116,11 @@ def make_remote_request(path, body, token, method="GET"):
         if method.upper() == "GET":
             # Convert body dictionary to query parameters for GET request
             params = urllib.parse.urlencode(body)
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = _REMOTE_SESSION.get(url, params=params, headers=headers, timeout=10)
         else:
             # URL-encode the body for POST request
             encoded_body = urllib.parse.urlencode(body)
-            response = requests.post(url, data=encoded_body, headers=headers, timeout=10)
+            response = _REMOTE_SESSION.post(url, data=encoded_body, headers=headers, timeout=10)
 
         # Log response details for debugging
         logging.debug(f"Response Status Code: {response.status_code}")
@@ -1,10 +1,10 @@
 import hashlib
 import json
 import logging
-import random
 import requests
 import time
 import sys
+import uuid
 from Crypto.PublicKey import RSA
 from .unitree_auth import make_remote_request
 from .encryption import rsa_encrypt, rsa_load_public_key, aes_decrypt, generate_aes_key
@@ -12,19 +12,18 @@ from .encryption import rsa_encrypt, rsa_load_public_key, aes_decrypt, generate_
 # Function to generate MD5 hash of a string
 
 def _generate_md5(string: str) -> str:
-    md5_hash = hashlib.md5(string.encode())
+    # MD5 only matches the Unitree API's password format, it isn't a security
+    # control; flag it so FIPS-enforcing OpenSSL builds don't reject it
+    try:
+        md5_hash = hashlib.md5(string.encode(), usedforsecurity=False)
+    except TypeError:
+        # Python 3.8 has no usedforsecurity argument
+        md5_hash = hashlib.md5(string.encode())
     return md5_hash.hexdigest()
 
 def generate_uuid():
-    def replace_char(char):
-        rand = random.randint(0, 15)
-        if char == "x":
-            return format(rand, 'x')
-        elif char == "y":
-            return format((rand & 0x3) | 0x8, 'x')
-
-    uuid_template = "xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx"
-    return ''.join(replace_char(char) if char in 'xy' else char for char in uuid_template)
+    # Random (version 4) UUID in the "xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx" form
+    return str(uuid.uuid4())
 
 
 def get_nested_field(message, *fields):
@@ -40,6 +39,8 @@ def get_nested_field(message, *fields):
 def fetch_token(email: str, password: str) -> str:
     logging.info("Obtaining TOKEN...")
     path = "login/email"
+    # Hashed once per call and not cached, so the plaintext password isn't
+    # kept alive beyond this request
     body = {
         'email': email,
         'password': _generate_md5(password)
@@ -3,8 +3,23 @@ Simple web browser interface for Unitree Go2 robot control and video streaming.
 Run this script and open http://localhost:5000 in your browser.
 """
 
-import logging
 import os
+
+# ============================================================================
+# SOCKET.IO ASYNC MODE
+# ============================================================================
+# 'threading' (default): one OS thread per MJPEG viewer / Socket.IO client
+# 'eventlet': cooperative green threads, so many viewers share one core.
+#             Requires `pip install eventlet`; must patch before anything
+#             imports threading/socket. The asyncio loop and the audio
+#             writer still run on native threads (app/services/native_threading.py).
+# ============================================================================
+ASYNC_MODE = os.getenv('SOCKETIO_ASYNC_MODE', 'threading').lower()
+if ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
+import logging
 from flask import Flask
 from flask_socketio import SocketIO
 
@@ -13,6 +28,7 @@ from app.services import StateService, ConnectionService, VideoService, AudioSer
 
 # Import route blueprints
 from app.routes import views_bp, api_bp, register_websocket_handlers
+from app.json_provider import OrjsonProvider, OrjsonSocketIOJSON, orjson
 
 # ============================================================================
 # DEBUG LEVEL CONFIGURATION
@@ -32,6 +48,12 @@ elif DEBUG_LEVEL == 1:
 else:
     logging.basicConfig(level=logging.DEBUG)    # Verbose/Deep Debug mode
 
+# The log format never shows thread/process details, so don't collect them
+# for every record (movement logging runs at 30-60 Hz)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Reduce Werkzeug HTTP request logging verbosity
 # This suppresses routine GET/POST request logs like "/api/robot/status"
 # while keeping ERROR and WARNING logs visible
@@ -43,17 +65,24 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = 'unitree_webrtc_secret_key'
 app.config['DEBUG_LEVEL'] = DEBUG_LEVEL  # Make DEBUG_LEVEL accessible to services
 
+# Use orjson for API responses and Socket.IO packets when it is installed
+socketio_json_options = {}
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+    socketio_json_options['json'] = OrjsonSocketIOJSON
+
 # Initialize SocketIO
 socketio = SocketIO(
     app,
     cors_allowed_origins="*",
-    async_mode='threading',
+    async_mode=ASYNC_MODE,
     # Increase buffer sizes for high-frequency audio streaming
     max_http_buffer_size=10 * 1024 * 1024,  # 10MB buffer
     ping_timeout=60,  # 60 seconds
     ping_interval=25,  # 25 seconds
     engineio_logger=False,
-    logger=False
+    logger=False,
+    **socketio_json_options
 )
 
 # Initialize services